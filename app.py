@@ -5,37 +5,161 @@ Aplicação principal em Flask que fornece as rotas e funcionalidades para
 gerar documentação profissional em formato Markdown para repositórios GitHub.
 """
 
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash, send_file
+from flask import Flask, Request, Response, render_template, request, jsonify, session, redirect, url_for, flash, g
 import os
 import json
-import markdown
-import tempfile
+import hmac
+import atexit
+import time
+import unicodedata
+from urllib.parse import quote
 from datetime import datetime
-from werkzeug.utils import secure_filename
-from flask_session import Session
 
-from utils.markdown_generator import generate_markdown
-from utils.file_analyzer import analyze_structure
+from utils.markdown_generator import generate_markdown, generate_markdown_fragments, fragments_for_sections
+from utils.preview_renderer import render_preview_html, preview_delta
+from utils.preview_stream import PreviewChannel
+from utils.file_analyzer import upload_digest, HashingSpooledFile
+from utils.analysis_jobs import AnalysisJobQueue, QueueFullError
+from utils.cache import DiskLRUCache, content_hash, files_hash
+from utils.session_store import SQLiteStore, SQLiteSessionInterface
+from utils.janitor import Janitor
 from utils.template_manager import get_project_template
+from utils.tech_badges import get_badge_index, get_badge_index_version
+from utils import metrics
+from utils.profiler import RequestProfiler
+from utils.page_cache import PageCache
+from utils.assets import AssetManifest
 from models.project import Project
 
+class DocGenRequest(Request):
+    """
+    Requisição que recebe arquivos enviados em HashingSpooledFile, mantendo
+    uploads pequenos em memória e calculando o SHA-256 durante o recebimento.
+    """
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # Uploads grandes vão para o diretório dos jobs, de onde a análise os lê sem cópias
+        return HashingSpooledFile(max_size=app.config['UPLOAD_SPOOL_THRESHOLD'], spool_dir=analysis_jobs.jobs_dir)
+
 # Inicialização da aplicação Flask
 app = Flask(__name__)
+app.request_class = DocGenRequest
 
 # Configurações da aplicação
 app.config.update(
     SECRET_KEY=os.environ.get('SECRET_KEY', os.urandom(24)),
-    SESSION_TYPE='filesystem',
     SESSION_PERMANENT=False,
-    SESSION_USE_SIGNER=True,
-    SESSION_FILE_DIR=tempfile.mkdtemp(),
+    SESSION_LIFETIME=24 * 60 * 60,  # Sessões expiram após 24 horas sem uso
+    DATABASE_PATH=os.environ.get('DATABASE_PATH', os.path.join(app.instance_path, 'docgen.sqlite3')),
+    JANITOR_INTERVAL=int(os.environ.get('JANITOR_INTERVAL', 300)),  # Segundos entre limpezas em segundo plano
     MAX_CONTENT_LENGTH=50 * 1024 * 1024,  # Limite de 50MB para uploads
-    UPLOAD_FOLDER=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uploads'),
-    ALLOWED_EXTENSIONS={'zip', 'tar.gz', 'tgz'}
+    UPLOAD_SPOOL_THRESHOLD=2 * 1024 * 1024,  # Uploads acima de 2MB vão para um arquivo temporário
+    ALLOWED_EXTENSIONS={'zip', 'tar.gz', 'tgz'},
+    STRUCTURE_MAX_ENTRIES=int(os.environ.get('STRUCTURE_MAX_ENTRIES', 5000)),  # Linhas exibidas na árvore
+    STRUCTURE_MAX_DEPTH=int(os.environ.get('STRUCTURE_MAX_DEPTH', 12)),  # Profundidade máxima da árvore
+    STRUCTURE_TIME_BUDGET=float(os.environ.get('STRUCTURE_TIME_BUDGET', 5.0)),  # Segundos para ler o índice e para gerar a árvore
+    STRUCTURE_MAX_MEMBERS=int(os.environ.get('STRUCTURE_MAX_MEMBERS', 50000)),  # Membros lidos do arquivo enviado
+    ANALYSIS_WORKERS=int(os.environ.get('ANALYSIS_WORKERS', 2)),  # Processos para análise de arquivos
+    ANALYSIS_QUEUE_SIZE=int(os.environ.get('ANALYSIS_QUEUE_SIZE', 8)),  # Análises pendentes por worker
+    ANALYSIS_RETRY_AFTER=5,  # Segundos sugeridos ao cliente quando a fila está cheia
+    ANALYSIS_CACHE_DIR=os.environ.get('ANALYSIS_CACHE_DIR', os.path.join(app.instance_path, 'analysis_cache')),
+    ANALYSIS_CACHE_MAX_BYTES=int(os.environ.get('ANALYSIS_CACHE_MAX_BYTES', 64 * 1024 * 1024)),
+    DOWNLOAD_STREAM_THRESHOLD=1024 * 1024,  # Downloads maiores são enviados em partes, seção por seção
+    PREVIEW_MODE=os.environ.get('PREVIEW_MODE', 'server'),  # 'server', 'stream' (canal SSE) ou 'client' (preview no navegador)
+    AUTOSAVE_INTERVAL=float(os.environ.get('AUTOSAVE_INTERVAL', 3)),  # Segundos entre gravações no modo cliente
+    PREVIEW_STREAM_TIMEOUT=int(os.environ.get('PREVIEW_STREAM_TIMEOUT', 300)),  # Duração máxima de uma conexão SSE
+    PREVIEW_POLL_TIMEOUT=int(os.environ.get('PREVIEW_POLL_TIMEOUT', 25)),  # Espera máxima de uma consulta long-poll
+    PREVIEW_MAX_CONNECTIONS=int(os.environ.get('PREVIEW_MAX_CONNECTIONS', 32)),  # Conexões SSE/long-poll abertas por processo
+    PREVIEW_SHORT_POLL_INTERVAL=int(os.environ.get('PREVIEW_SHORT_POLL_INTERVAL', 2)),  # Segundos entre consultas sem conexão aberta
+    METRICS_TOKEN=os.environ.get('METRICS_TOKEN'),  # Se definido, /metrics exige "Authorization: Bearer <token>"
+    METRICS_DIR=os.environ.get('METRICS_DIR'),  # Se definido, /metrics soma as medições de todos os workers
+    METRICS_FLUSH_INTERVAL=float(os.environ.get('METRICS_FLUSH_INTERVAL', 5)),  # Segundos entre gravações das métricas de cada worker
+    PROFILER_SECRET=os.environ.get('PROFILER_SECRET'),  # Habilita o profiling de requisições com cabeçalho assinado
+    PROFILER_SAMPLE_RATE=float(os.environ.get('PROFILER_SAMPLE_RATE', 0)),  # Fração de requisições perfiladas
+    PROFILER_DIR=os.environ.get('PROFILER_DIR', os.path.join(app.instance_path, 'profiles')),
+    PROFILER_MAX_BYTES=int(os.environ.get('PROFILER_MAX_BYTES', 32 * 1024 * 1024)),  # Limite do diretório de perfis
+    BUILD_VERSION=os.environ.get('BUILD_VERSION'),  # Identifica o código em execução nos ETags (padrão: hash dos arquivos)
+    PUBLIC_PAGE_MAX_AGE=int(os.environ.get('PUBLIC_PAGE_MAX_AGE', 24 * 60 * 60))  # Cache de /examples e /demo em navegadores e CDNs
+)
+
+# Sessões e projetos em SQLite, compartilhados entre todos os workers
+store = SQLiteStore(app.config['DATABASE_PATH'])
+app.session_interface = SQLiteSessionInterface(store, app.config['SESSION_LIFETIME'])
+
+# Cache de resultados de análise, indexado pelo conteúdo do arquivo enviado
+analysis_cache = DiskLRUCache(
+    app.config['ANALYSIS_CACHE_DIR'],
+    max_bytes=app.config['ANALYSIS_CACHE_MAX_BYTES']
 )
 
-# Inicializa extensões
-Session(app)
+# Fila de análise de estrutura em segundo plano
+analysis_jobs = AnalysisJobQueue(
+    os.path.join(app.instance_path, 'analysis_jobs'),
+    max_workers=app.config['ANALYSIS_WORKERS'],
+    max_pending=app.config['ANALYSIS_QUEUE_SIZE'],
+    result_cache=analysis_cache
+)
+
+# Bundles de CSS/JS gerados por `python -m utils.asset_builder` (sem build, os arquivos originais)
+AssetManifest(app.static_folder).init_app(app)
+
+# Versão do código, dos templates e dos bundles em execução: entra nos ETags para que
+# respostas geradas por uma versão anterior não sejam reaproveitadas após um deploy
+if not app.config['BUILD_VERSION']:
+    app.config['BUILD_VERSION'] = files_hash(
+        app.root_path, ['app.py', 'models', 'utils', 'templates', os.path.join('static', 'dist', 'manifest.json')]
+    )
+
+# Páginas de exemplo e demonstração, iguais para todos os visitantes
+page_cache = PageCache()
+
+# Canal de preview em tempo real, acompanhando a versão dos projetos no SQLite
+preview_channel = PreviewChannel(store, max_connections=app.config['PREVIEW_MAX_CONNECTIONS'])
+
+# Limpeza periódica de sessões expiradas e jobs antigos, fora do caminho das requisições
+janitor = Janitor(app.config['JANITOR_INTERVAL'], [
+    store.delete_expired,
+    analysis_jobs.purge_expired
+])
+
+# Métricas compartilhadas entre os workers: cada um grava as suas periodicamente e ao encerrar
+metrics.REGISTRY.set_directory(app.config['METRICS_DIR'])
+metrics_flusher = Janitor(app.config['METRICS_FLUSH_INTERVAL'], [metrics.REGISTRY.flush])
+atexit.register(metrics.REGISTRY.flush)
+
+# Profiling sob demanda: os hooks só são registrados quando habilitado
+if app.config['PROFILER_SECRET'] or app.config['PROFILER_SAMPLE_RATE'] > 0:
+    RequestProfiler(
+        app.config['PROFILER_DIR'],
+        secret=app.config['PROFILER_SECRET'],
+        sample_rate=app.config['PROFILER_SAMPLE_RATE'],
+        max_bytes=app.config['PROFILER_MAX_BYTES']
+    ).init_app(app)
+
+@app.before_request
+def start_janitor():
+    """Garante que a limpeza em segundo plano esteja rodando neste worker"""
+    janitor.ensure_started()
+    if app.config['METRICS_DIR']:
+        metrics_flusher.ensure_started()
+
+@app.before_request
+def start_request_timer():
+    """Marca o início da requisição para a métrica de tempo de resposta"""
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def observe_request_duration(response):
+    """Registra o tempo de resposta por rota (o endpoint, não a URL, para limitar os rótulos)"""
+    started = g.pop('request_started', None)
+    if started is not None:
+        metrics.REQUEST_DURATION.observe(
+            time.perf_counter() - started,
+            request.endpoint or 'unmatched',
+            request.method,
+            str(response.status_code)
+        )
+    return response
 
 # Configuração de tipos de projetos disponíveis
 PROJECT_TYPES = {
@@ -48,9 +172,6 @@ PROJECT_TYPES = {
     "frameworks": "Framework Específico"
 }
 
-# Assegura que o diretório de uploads exista
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-
 # Funções auxiliares
 def get_project_description(project_type):
     """
@@ -76,18 +197,114 @@ def get_project_description(project_type):
 
 def allowed_file(filename):
     """Verifica se o arquivo possui uma extensão permitida"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
+    filename = filename.lower()
+    return any(filename.endswith('.' + extension) for extension in app.config['ALLOWED_EXTENSIONS'])
+
+def load_project():
+    """Carrega o projeto da sessão atual, ou None se nenhum projeto foi iniciado"""
+    project_data = store.load_project(session.sid)
+    if project_data is None:
+        return None
+    # Identifica o tipo de projeto nos perfis gravados pelo profiler
+    g.project_type = project_data['type']
+    return Project.from_dict(project_data)
 
-def clear_expired_sessions():
-    """Remove arquivos de sessão expirados (mais de 24 horas)"""
-    session_dir = app.config['SESSION_FILE_DIR']
-    now = datetime.now()
+def apply_project_structure(project, structure):
+    """Grava a estrutura analisada no projeto da sessão"""
+    project.set_structure(structure)
+    
+    # Atualiza também na seção de estrutura se existir
+    if 'structure' in project.sections:
+        project.update_section('structure', dict(project.sections['structure'], manual_structure=structure))
     
-    for filename in os.listdir(session_dir):
-        filepath = os.path.join(session_dir, filename)
-        file_modified = datetime.fromtimestamp(os.path.getmtime(filepath))
-        if (now - file_modified).days > 1:
-            os.remove(filepath)
+    # Estrutura e seção são gravadas juntas, em uma única versão
+    store.save_changes(session.sid, project)
+
+def section_form_data(form):
+    """Extrai os dados de uma seção dos campos enviados pelo formulário do editor"""
+    data = {}
+    
+    # Processa os dados do formulário
+    for key, value in form.items():
+        if key != 'section':
+            # Processa checkboxes (que enviam múltiplos valores)
+            if key.endswith('[]'):
+                base_key = key.rstrip('[]')
+                if base_key not in data:
+                    data[base_key] = []
+                data[base_key].append(value)
+            else:
+                data[key] = value
+    return data
+
+def _is_field_value(value):
+    """Valores aceitos em um campo: texto ou lista de textos (checkboxes)"""
+    if isinstance(value, str):
+        return True
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+def validate_sections(sections, template):
+    """
+    Verifica as seções enviadas pelo editor antes de gravá-las.
+
+    Aceita apenas seções do template do projeto, com campos no formato que
+    section_form_data produz; qualquer outro valor quebraria a geração do
+    markdown em todas as requisições seguintes.
+
+    Args:
+        sections: Dados recebidos (ID da seção -> campos)
+        template (dict): Template do tipo do projeto
+
+    Returns:
+        str: Mensagem de erro, ou None se os dados forem válidos
+    """
+    if not isinstance(sections, dict):
+        return 'Dados inválidos'
+    for section_id, data in sections.items():
+        if section_id not in template:
+            return f'Seção desconhecida: {section_id}'
+        if not isinstance(data, dict) or not all(_is_field_value(value) for value in data.values()):
+            return f'Dados inválidos na seção {section_id}'
+    return None
+
+def markdown_filename(project_data):
+    """Nome do arquivo .md exportado para o projeto"""
+    project_name = project_data.get('name', 'README').replace(' ', '_')
+    return f"{project_name}.md"
+
+def set_attachment_filename(response, filename):
+    """Define o Content-Disposition de download, com fallback ASCII para nomes acentuados"""
+    try:
+        filename.encode('ascii')
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize('NFKD', filename).encode('ascii', 'ignore').decode('ascii')
+        response.headers.set(
+            'Content-Disposition', 'attachment',
+            filename=simple, **{'filename*': "UTF-8''" + quote(filename, safe="!#$&+^`|~")}
+        )
+    else:
+        response.headers.set('Content-Disposition', 'attachment', filename=filename)
+
+def iter_markdown_chunks(fragments):
+    """Gera o documento em partes codificadas, uma por seção"""
+    first = True
+    for _, content in fragments:
+        yield (content if first else "\n\n" + content).encode('utf-8')
+        first = False
+
+def project_etag(*parts):
+    """ETag determinístico calculado a partir do conteúdo que gera a resposta"""
+    return content_hash([app.config['BUILD_VERSION'], parts])
+
+def with_etag(response, etag):
+    """Anexa o ETag e obriga o navegador a revalidar antes de reutilizar a resposta"""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+def not_modified(etag):
+    """Resposta 304 para quando o cliente já tem a versão atual"""
+    return with_etag(Response(status=304), etag)
 
 def create_example_project(project_type):
     """Cria um projeto de exemplo pré-preenchido"""
@@ -130,9 +347,6 @@ def create_example_project(project_type):
 @app.route('/')
 def index():
     """Página inicial com seleção de tipo de projeto"""
-    # Limpa sessões expiradas periodicamente
-    clear_expired_sessions()
-    
     return render_template(
         'index.html', 
         project_types=PROJECT_TYPES,
@@ -154,15 +368,10 @@ def setup_project():
     if use_example:
         # Cria um projeto de exemplo pré-preenchido
         project = create_example_project(project_type)
-        session['project'] = project.to_dict()
     else:
         # Inicializa projeto vazio na sessão
         project = Project(project_type=project_type)
-        session['project'] = project.to_dict()
-    
-    # Carrega template baseado no tipo
-    template = get_project_template(project_type)
-    session['template'] = template
+    store.save_project(session.sid, project.to_dict())
     
     # Define o tema padrão
     session['theme'] = 'default'
@@ -172,89 +381,220 @@ def setup_project():
 @app.route('/editor')
 def editor():
     """Interface principal de edição"""
-    if 'project' not in session:
+    project = load_project()
+    if project is None:
         flash('Sessão expirada ou projeto não iniciado.', 'error')
         return redirect(url_for('index'))
     
-    project_data = session.get('project')
-    template = session.get('template')
+    project_data = project.to_dict()
+    template = get_project_template(project.project_type)
     theme = session.get('theme', 'default')
     current_section = request.args.get('section', 'project_info')
     
-    # Converte de volta para objeto Project
-    project = Project.from_dict(project_data)
-    
     # Verifica se a seção existe no template
     if current_section not in template:
         current_section = 'project_info'
     
-    # Gera o preview inicial
-    preview_markdown = generate_markdown(project_data)
-    preview_html = markdown.markdown(preview_markdown, extensions=['extra', 'codehilite'])
+    preview_mode = app.config['PREVIEW_MODE']
+    
+    # Mensagens pendentes também mudam a página, então entram no ETag
+    etag = project_etag('editor', project_data, current_section, theme, preview_mode, session.get('_flashes'))
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
+    
+    # No modo servidor o preview inicial já vem renderizado; no modo cliente
+    # o navegador gera o preview a partir dos dados do projeto
+    preview_html = None
+    if preview_mode != 'client':
+        preview_html = render_preview_html(generate_markdown_fragments(project_data))
     
     # Calcula o progresso do projeto
     completed_sections = sum(1 for section in template if project.is_section_complete(section))
     total_sections = len(template)
     progress = int((completed_sections / total_sections) * 100) if total_sections > 0 else 0
     
-    return render_template(
+    return with_etag(app.make_response(render_template(
         'editor.html',
         project=project_data,
         project_obj=project,
         template=template,
         current_section=current_section,
-        preview_markdown=preview_markdown,
         preview_html=preview_html,
+        preview_mode=preview_mode,
+        autosave_interval=int(app.config['AUTOSAVE_INTERVAL'] * 1000),
         theme=theme,
         progress=progress
-    )
+    )), etag)
 
 @app.route('/update_section', methods=['POST'])
 def update_section():
     """Atualiza uma seção específica do projeto"""
-    if 'project' not in session:
+    project = load_project()
+    if project is None:
         return jsonify({'error': 'Sessão expirada'}), 400
     
     section = request.form.get('section')
     if not section:
         return jsonify({'error': 'Seção não especificada'}), 400
     
-    data = {}
-    
-    # Processa os dados do formulário
-    for key, value in request.form.items():
-        if key != 'section':
-            # Processa checkboxes (que enviam múltiplos valores)
-            if key.endswith('[]'):
-                base_key = key.rstrip('[]')
-                if base_key not in data:
-                    data[base_key] = []
-                data[base_key].append(value)
-            else:
-                data[key] = value
+    data = section_form_data(request.form)
+    previous_version = project.version
     
-    # Atualiza a seção no projeto
-    project_data = session.get('project')
-    project = Project.from_dict(project_data)
+    # Atualiza a seção no projeto, gravando apenas a seção alterada
     project.update_section(section, data)
-    
-    # Atualiza a sessão
-    session['project'] = project.to_dict()
+    store.save_changes(session.sid, project)
     
     # Gera preview do markdown
-    markdown_content = generate_markdown(project.to_dict())
-    html_preview = markdown.markdown(markdown_content, extensions=['extra', 'codehilite'])
+    fragments = generate_markdown_fragments(project.to_dict())
+    
+    if request.args.get('delta'):
+        # Modo incremental: só os fragmentos das seções alteradas desde a versão
+        # exibida pelo cliente, se nenhuma outra gravação tiver ocorrido no meio
+        base_version = request.args.get('base_version', type=int)
+        changed = None
+        if base_version is not None and base_version <= previous_version == project.version - 1:
+            changed = fragments_for_sections(fragments, project.project_type, project.changed_since(base_version))
+        delta = preview_delta(fragments, changed)
+        return jsonify(dict(delta, success=True, mode='delta', version=project.version))
+    
+    markdown_content = "\n\n".join(content for _, content in fragments)
+    html_preview = render_preview_html(fragments)
     
     return jsonify({
         'success': True,
+        'version': project.version,
         'markdown': markdown_content,
         'html_preview': html_preview
     })
 
+@app.route('/save_sections', methods=['POST'])
+def save_sections():
+    """Grava em lote as seções editadas no modo de preview no navegador"""
+    project = load_project()
+    if project is None:
+        return jsonify({'error': 'Sessão expirada'}), 400
+    
+    payload = request.get_json(silent=True) or {}
+    sections = payload.get('sections')
+    error = validate_sections(sections, get_project_template(project.project_type))
+    if error:
+        return jsonify({'error': error}), 400
+    
+    version = store.save_sections(session.sid, sections) if sections else project.version
+    
+    return jsonify({
+        'success': True,
+        'version': version
+    })
+
+@app.route('/preview/changes', methods=['POST'])
+def preview_changes():
+    """Grava a edição de uma seção; o preview é enviado pelo canal da aba"""
+    version = store.load_project_version(session.sid)
+    if version is None:
+        return jsonify({'error': 'Sessão expirada'}), 400
+    
+    section = request.form.get('section')
+    if not section:
+        return jsonify({'error': 'Seção não especificada'}), 400
+    
+    version = store.save_section(session.sid, section, section_form_data(request.form))
+    
+    return jsonify({
+        'success': True,
+        'version': version
+    }), 202
+
+def preview_since():
+    """Versão exibida pelo navegador, informada na URL ou na reconexão do EventSource"""
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    if last_event_id.isdigit():
+        return int(last_event_id)
+    return request.args.get('since', type=int)
+
+def acquire_preview_connection():
+    """
+    Reserva uma conexão mantida aberta para o preview desta requisição.
+    
+    Workers síncronos (o padrão do gunicorn) atendem uma requisição por vez e
+    informam wsgi.multithread falso: neles, uma conexão aberta bloquearia o
+    worker inteiro, então nenhuma é mantida. Workers gthread, gevent e
+    eventlet (e o servidor de desenvolvimento) mantêm até
+    PREVIEW_MAX_CONNECTIONS por processo.
+    """
+    if not request.environ.get('wsgi.multithread'):
+        return False
+    return preview_channel.acquire_connection()
+
+def short_poll_headers():
+    """Intervalo sugerido ao navegador quando a consulta não pode ficar aberta"""
+    return {'X-Preview-Poll-Interval': str(app.config['PREVIEW_SHORT_POLL_INTERVAL'])}
+
+@app.route('/preview/stream', methods=['GET'])
+def preview_stream():
+    """Canal Server-Sent Events com os deltas do preview de uma aba do editor"""
+    if store.load_project_version(session.sid) is None:
+        return jsonify({'error': 'Sessão expirada'}), 400
+    
+    # Sem conexões disponíveis, o navegador passa para as consultas em /preview/poll
+    if not acquire_preview_connection():
+        response = jsonify({'error': 'Canal de preview indisponível'})
+        response.headers['Retry-After'] = str(app.config['PREVIEW_SHORT_POLL_INTERVAL'])
+        return response, 503
+    
+    # O gerador roda depois que a view retorna, fora do contexto da requisição
+    events = preview_channel.stream(session.sid, preview_since(), app.config['PREVIEW_STREAM_TIMEOUT'])
+    response = Response(events, mimetype='text/event-stream')
+    # Liberada quando a resposta é fechada, mesmo se o gerador nunca for iniciado
+    response.call_on_close(preview_channel.release_connection)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Evita que proxies acumulem os eventos
+    return response
+
+@app.route('/preview/poll', methods=['GET'])
+def preview_poll():
+    """
+    Alternativa ao canal SSE: responde quando a versão do projeto mudar (long-poll)
+    ou, sem conexões disponíveis, imediatamente, indicando o intervalo da próxima consulta
+    """
+    since = preview_since()
+    headers = {}
+    if acquire_preview_connection():
+        try:
+            version = preview_channel.wait_for_change(session.sid, since, app.config['PREVIEW_POLL_TIMEOUT'])
+        finally:
+            preview_channel.release_connection()
+    else:
+        version = store.load_project_version(session.sid)
+        headers = short_poll_headers()
+    
+    if version is None:
+        return jsonify({'error': 'Sessão expirada'}), 400
+    if version == since:
+        return Response(status=204, headers=headers)
+    
+    delta = preview_channel.render(session.sid, since)
+    if delta is None:
+        return jsonify({'error': 'Sessão expirada'}), 400
+    return jsonify(dict(delta, success=True, mode='delta')), 200, headers
+
+@app.route('/badges.json', methods=['GET'])
+def badge_index():
+    """Índice de badges de tecnologias usado pelo preview no navegador"""
+    etag = get_badge_index_version()
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify(get_badge_index())
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'public, max-age=86400'
+    return response
+
 @app.route('/upload_structure', methods=['POST'])
 def upload_structure():
     """Processa upload de estrutura de arquivos"""
-    if 'project' not in session:
+    project = load_project()
+    if project is None:
         return jsonify({'error': 'Sessão expirada'}), 400
     
     if 'project_files' not in request.files:
@@ -268,83 +608,131 @@ def upload_structure():
     if not allowed_file(file.filename):
         return jsonify({'error': 'Tipo de arquivo não suportado. Use .zip ou .tar.gz'}), 400
     
-    # Salva o arquivo temporariamente
-    filename = secure_filename(file.filename)
-    filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    file.save(filepath)
+    options = {
+        'max_entries': app.config['STRUCTURE_MAX_ENTRIES'],
+        'max_depth': app.config['STRUCTURE_MAX_DEPTH'],
+        'time_budget': app.config['STRUCTURE_TIME_BUDGET'],
+        'max_members': app.config['STRUCTURE_MAX_MEMBERS']
+    }
     
     try:
-        # Análise da estrutura de arquivos
-        structure = analyze_structure(filepath)
-        
-        # Atualiza estrutura no projeto
-        project_data = session.get('project')
-        project = Project.from_dict(project_data)
-        project.structure = structure
-        session['project'] = project.to_dict()
+        digest = upload_digest(file)
         
-        # Atualiza também na seção de estrutura se existir
-        if 'structure' in project.sections:
-            project.sections['structure']['manual_structure'] = structure
-            session['project'] = project.to_dict()
+        # Arquivos já analisados com as mesmas opções são respondidos direto do cache
+        # ('v2' descarta entradas antigas, que podiam guardar mensagens de erro como estrutura)
+        cache_key = content_hash(['v2', digest, file.filename, options])
+        cached = analysis_cache.get(cache_key)
+        if cached is not None:
+            apply_project_structure(project, cached['structure'])
+            return jsonify({
+                'success': True,
+                'status': 'done',
+                'structure': cached['structure'],
+                'sha256': digest
+            })
         
-        return jsonify({
-            'success': True,
-            'structure': structure
-        })
+        # Entrega o arquivo recebido à análise em segundo plano, sem lê-lo para a memória
+        job_id = analysis_jobs.submit(file.stream, file.filename, options, cache_key=cache_key)
+    except QueueFullError:
+        response = jsonify({'error': 'Muitas análises em andamento. Tente novamente em instantes.'})
+        response.headers['Retry-After'] = str(app.config['ANALYSIS_RETRY_AFTER'])
+        return response, 503
     except Exception as e:
         return jsonify({'error': f'Erro ao analisar estrutura: {str(e)}'}), 500
     finally:
-        # Remove o arquivo temporário
-        if os.path.exists(filepath):
-            os.remove(filepath)
+        file.close()
+    
+    session['structure_job'] = job_id
+    status_url = url_for('upload_structure_status', job_id=job_id)
+    
+    return jsonify({
+        'success': True,
+        'status': 'pending',
+        'job_id': job_id,
+        'status_url': status_url,
+        'sha256': digest
+    }), 202, {'Location': status_url}
+
+@app.route('/upload_structure/<job_id>', methods=['GET'])
+def upload_structure_status(job_id):
+    """Consulta o andamento de uma análise de estrutura"""
+    project = load_project()
+    if project is None:
+        return jsonify({'error': 'Sessão expirada'}), 400
+    
+    if session.get('structure_job') != job_id:
+        return jsonify({'error': 'Análise não encontrada'}), 404
+    
+    state = analysis_jobs.status(job_id)
+    if state is None:
+        return jsonify({'error': 'Análise não encontrada'}), 404
+    
+    if state['status'] == 'pending':
+        return jsonify({'success': True, 'status': 'pending'})
+    
+    # Análise concluída: libera o job da sessão
+    session.pop('structure_job', None)
+    
+    if state['status'] == 'error':
+        return jsonify({'success': False, 'status': 'error', 'error': state['error']}), 500
+    
+    structure = state['structure']
+    apply_project_structure(project, structure)
+    
+    return jsonify({
+        'success': True,
+        'status': 'done',
+        'structure': structure
+    })
 
 @app.route('/export', methods=['GET'])
 def export_markdown():
     """Exporta o markdown final"""
-    if 'project' not in session:
+    project = load_project()
+    if project is None:
         return redirect(url_for('index'))
     
-    project_data = session.get('project')
-    markdown_content = generate_markdown(project_data)
+    project_data = project.to_dict()
+    etag = project_etag('export', project_data)
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
     
-    project_name = project_data.get('name', 'README').replace(' ', '_')
-    filename = f"{project_name}.md"
+    markdown_content = generate_markdown(project_data)
     
-    return jsonify({
+    return with_etag(jsonify({
         'markdown': markdown_content,
-        'filename': filename
-    })
+        'filename': markdown_filename(project_data)
+    }), etag)
 
 @app.route('/download', methods=['GET'])
 def download_markdown():
     """Faz download do arquivo markdown"""
-    if 'project' not in session:
+    project = load_project()
+    if project is None:
         flash('Sessão expirada ou projeto não iniciado.', 'error')
         return redirect(url_for('index'))
     
-    project_data = session.get('project')
-    markdown_content = generate_markdown(project_data)
-    
-    # Cria arquivo temporário
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.md')
-    temp_file.write(markdown_content.encode('utf-8'))
-    temp_file.close()
+    project_data = project.to_dict()
+    etag = project_etag('download', project_data)
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
     
-    project_name = project_data.get('name', 'README').replace(' ', '_')
-    filename = f"{project_name}.md"
+    fragments = generate_markdown_fragments(project_data)
+    size = sum(len(content) for _, content in fragments)
     
-    return send_file(
-        temp_file.name,
-        as_attachment=True,
-        download_name=filename,
-        mimetype='text/markdown'
-    )
+    # O documento é enviado direto da memória; documentos muito grandes
+    # seguem em partes para não montar uma segunda cópia completa
+    if size > app.config['DOWNLOAD_STREAM_THRESHOLD']:
+        response = Response(iter_markdown_chunks(fragments), mimetype='text/markdown')
+    else:
+        response = Response("\n\n".join(content for _, content in fragments), mimetype='text/markdown')
+    set_attachment_filename(response, markdown_filename(project_data))
+    return with_etag(response, etag)
 
 @app.route('/update_theme', methods=['POST'])
 def update_theme():
     """Atualiza o tema da interface"""
-    if 'project' not in session:
+    if load_project() is None:
         return jsonify({'error': 'Sessão expirada'}), 400
     
     theme = request.form.get('theme', 'default')
@@ -355,31 +743,31 @@ def update_theme():
 @app.route('/get_sections_status', methods=['GET'])
 def get_sections_status():
     """Retorna o status de completude de cada seção"""
-    if 'project' not in session:
+    project = load_project()
+    if project is None:
         return jsonify({'error': 'Sessão expirada'}), 400
     
-    project_data = session.get('project')
-    template = session.get('template')
-    
-    project = Project.from_dict(project_data)
+    template = get_project_template(project.project_type)
     sections_status = {}
     
+    # A completude de cada seção já foi validada ao gravá-la
     for section_id in template:
         sections_status[section_id] = project.is_section_complete(section_id)
     
-    return jsonify({
+    etag = project_etag('sections_status', project.project_type, sections_status)
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
+    
+    return with_etag(jsonify({
         'success': True,
         'status': sections_status
-    })
+    }), etag)
 
 @app.route('/reset', methods=['GET'])
 def reset_project():
     """Reset o projeto atual e redireciona para a página inicial"""
     # Limpa dados da sessão
-    if 'project' in session:
-        del session['project']
-    if 'template' in session:
-        del session['template']
+    store.delete_project(session.sid)
     
     flash('Projeto resetado com sucesso!', 'success')
     return redirect(url_for('index'))
@@ -387,6 +775,12 @@ def reset_project():
 @app.route('/examples', methods=['GET'])
 def view_examples():
     """Exibe exemplos de documentações geradas"""
+    # O ano entra na chave porque aparece no rodapé (current_year)
+    page = page_cache.get(('examples', datetime.now().year), render_examples_page)
+    return page.response(request, app.config['PUBLIC_PAGE_MAX_AGE'])
+
+def render_examples_page():
+    """Renderiza a página de exemplos (chamada uma vez por processo)"""
     examples = [
         {
             'name': 'API REST Flask',
@@ -418,14 +812,20 @@ def view_demo(example_type):
     """Exibe uma demonstração de documentação"""
     if example_type not in PROJECT_TYPES:
         flash('Exemplo não encontrado', 'error')
-        return redirect(url_for('examples'))
+        return redirect(url_for('view_examples'))
     
+    page = page_cache.get(('demo', example_type, datetime.now().year), lambda: render_demo_page(example_type))
+    return page.response(request, app.config['PUBLIC_PAGE_MAX_AGE'])
+
+def render_demo_page(example_type):
+    """Renderiza a demonstração de um tipo de projeto (chamada uma vez por processo)"""
     # Cria um projeto de exemplo
     project = create_example_project(example_type)
     
     # Gera o markdown e HTML
-    markdown_content = generate_markdown(project.to_dict())
-    html_preview = markdown.markdown(markdown_content, extensions=['extra', 'codehilite'])
+    fragments = generate_markdown_fragments(project.to_dict())
+    markdown_content = "\n\n".join(content for _, content in fragments)
+    html_preview = render_preview_html(fragments)
     
     return render_template(
         'demo.html',
@@ -435,6 +835,16 @@ def view_demo(example_type):
         html_preview=html_preview
     )
 
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Métricas de desempenho no formato texto do Prometheus"""
+    token = app.config['METRICS_TOKEN']
+    if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return Response(status=401)
+    
+    return Response(metrics.REGISTRY.render(), content_type=metrics.CONTENT_TYPE,
+                    headers={'Cache-Control': 'no-store'})
+
 @app.errorhandler(404)
 def page_not_found(e):
     """Manipulador para erro 404"""
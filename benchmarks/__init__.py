@@ -0,0 +1,10 @@
+"""
+Benchmarks dos caminhos críticos do DocGen.
+
+Uso:
+    python -m benchmarks -o resultados.json
+    python -m benchmarks --suite generator --suite routes --quick
+
+Cada medição registra os percentis de tempo (p50/p95/p99, em milissegundos)
+e o pico de memória alocada, em um JSON que pode ser comparado entre versões.
+"""
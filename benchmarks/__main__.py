@@ -0,0 +1,71 @@
+"""
+Executa os benchmarks e grava os resultados em JSON.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from benchmarks import analyzer, generator, routes
+from benchmarks.harness import format_result
+
+SUITES = {
+    'generator': generator.run,
+    'analyzer': analyzer.run,
+    'routes': routes.run
+}
+
+def _git_revision():
+    """Retorna o commit atual, para identificar a versão medida"""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Mede o tempo e a memória dos caminhos críticos do DocGen.'
+    )
+    parser.add_argument('--suite', action='append', choices=sorted(SUITES),
+                        help='Conjunto a executar (pode ser repetido; padrão: todos)')
+    parser.add_argument('--quick', action='store_true', help='Usa apenas os tamanhos menores')
+    parser.add_argument('-r', '--repeat', type=int, default=20, help='Execuções cronometradas por medição')
+    parser.add_argument('-o', '--output', default='-', help='Arquivo JSON de saída (padrão: saída padrão)')
+    args = parser.parse_args(argv)
+
+    report = {
+        'started_at': datetime.now(timezone.utc).isoformat(),
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'quick': args.quick,
+        'repeat': args.repeat,
+        'suites': {}
+    }
+
+    for name in args.suite or list(SUITES):
+        started = time.perf_counter()
+        results = SUITES[name](quick=args.quick, repeat=args.repeat)
+        for result in results:
+            print(format_result(result), file=sys.stderr)
+        report['suites'][name] = {
+            'seconds': time.perf_counter() - started,
+            'results': results
+        }
+
+    payload = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output == '-':
+        print(payload)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            output_file.write(payload + '\n')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+Benchmarks da análise de estrutura com arquivos compactados gerados.
+"""
+
+import os
+import shutil
+import tarfile
+import tempfile
+import zipfile
+
+from werkzeug.datastructures import FileStorage
+
+from benchmarks.harness import measure, scaled_repeat
+from utils.file_analyzer import (analyze_structure, build_archive_tree,
+                                 generate_archive_tree_structure, generate_tree_structure)
+
+ARCHIVE_SIZES = (1000, 10000, 100000, 500000)
+QUICK_ARCHIVE_SIZES = (1000, 10000)
+
+# Árvores em disco ficam menores: criar centenas de milhares de arquivos domina o tempo do benchmark
+DIRECTORY_SIZES = (1000, 10000)
+QUICK_DIRECTORY_SIZES = (1000,)
+
+def member_names(count):
+    """
+    Gera nomes de arquivos distribuídos em pacotes e módulos, com alguns
+    diretórios que a análise ignora.
+
+    Args:
+        count (int): Quantidade de arquivos
+
+    Returns:
+        list: Caminhos relativos dos arquivos
+    """
+    names = []
+    for i in range(count):
+        package = f'projeto/pkg{i // 1000:04d}/mod{i // 50 % 20:02d}'
+        if i % 25 == 0:
+            names.append(f'{package}/__pycache__/arquivo_{i}.pyc')
+        else:
+            names.append(f'{package}/arquivo_{i}.py')
+    return names
+
+def build_zip(path, names):
+    """Grava um zip com arquivos vazios nos caminhos informados"""
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED) as archive:
+        for name in names:
+            archive.writestr(name, b'')
+
+def build_tar(path, names):
+    """Grava um tar.gz com arquivos vazios nos caminhos informados"""
+    with tarfile.open(path, 'w:gz', compresslevel=1) as archive:
+        for name in names:
+            archive.addfile(tarfile.TarInfo(name))
+
+def build_directory(path, names):
+    """Cria os arquivos vazios em disco, sob o diretório informado"""
+    for name in names:
+        file_path = os.path.join(path, name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        open(file_path, 'wb').close()
+
+def _analyze(path, filename):
+    with open(path, 'rb') as stream:
+        return analyze_structure(FileStorage(stream=stream, filename=filename))
+
+def run(quick=False, repeat=20):
+    """
+    Executa os benchmarks do analisador.
+
+    Args:
+        quick (bool): Usa apenas os tamanhos menores
+        repeat (int): Execuções cronometradas por medição (reduzidas nos tamanhos maiores)
+
+    Returns:
+        list: Resultados de measure
+    """
+    results = []
+    work_dir = tempfile.mkdtemp(prefix='docgen-bench-')
+    try:
+        for count in (QUICK_ARCHIVE_SIZES if quick else ARCHIVE_SIZES):
+            names = member_names(count)
+            params = {'members': count}
+            runs = scaled_repeat(repeat, count)
+
+            zip_path = os.path.join(work_dir, f'projeto_{count}.zip')
+            tar_path = os.path.join(work_dir, f'projeto_{count}.tar.gz')
+            build_zip(zip_path, names)
+            build_tar(tar_path, names)
+
+            results.append(measure('analyze_structure (zip)',
+                                   lambda: _analyze(zip_path, 'projeto.zip'),
+                                   repeat=runs, warmup=1, params=params))
+            results.append(measure('analyze_structure (tar.gz)',
+                                   lambda: _analyze(tar_path, 'projeto.tar.gz'),
+                                   repeat=runs, warmup=1, params=params))
+
+            members = [(name, False) for name in names]
+            results.append(measure('build_archive_tree', lambda: build_archive_tree(members),
+                                   repeat=runs, warmup=1, params=params))
+
+            tree = build_archive_tree(members)
+            results.append(measure('generate_archive_tree_structure',
+                                   lambda: generate_archive_tree_structure(tree, 'projeto'),
+                                   repeat=runs, warmup=1, params=params))
+
+            os.remove(zip_path)
+            os.remove(tar_path)
+
+        for count in (QUICK_DIRECTORY_SIZES if quick else DIRECTORY_SIZES):
+            directory = os.path.join(work_dir, f'arvore_{count}')
+            build_directory(directory, member_names(count))
+            results.append(measure('generate_tree_structure',
+                                   lambda: generate_tree_structure(directory),
+                                   repeat=scaled_repeat(repeat, count), warmup=1,
+                                   params={'members': count}))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
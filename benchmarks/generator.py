@@ -0,0 +1,92 @@
+"""
+Benchmarks de generate_markdown com projetos sintéticos de tamanho crescente.
+"""
+
+from benchmarks.harness import measure
+from utils.markdown_generator import clear_fragment_cache, generate_markdown
+
+SIZES = (10, 100, 1000, 10000)
+QUICK_SIZES = (10, 100, 1000)
+
+def synthetic_project(entries, project_type='backend'):
+    """
+    Monta um projeto completo com o número informado de itens de FAQ,
+    roadmap e equipe.
+
+    Args:
+        entries (int): Quantidade de itens em cada lista
+        project_type (str): Tipo do projeto
+
+    Returns:
+        dict: Projeto no formato de Project.to_dict
+    """
+    return {
+        'type': project_type,
+        'name': f'Projeto {entries}',
+        'theme': 'default',
+        'structure': None,
+        'sections': {
+            'project_info': {
+                'name': f'Projeto {entries}',
+                'short_description': 'Projeto sintético para benchmark',
+                'logo_url': 'https://exemplo.com/logo.png'
+            },
+            'about': {
+                'description': 'Descrição do projeto. ' * 20,
+                'motivation': 'Motivação do projeto.',
+                'key_features': '\n'.join(f'Funcionalidade {i}' for i in range(min(entries, 50)))
+            },
+            'technology': {
+                'technologies': 'Python, Flask, JavaScript, React, PostgreSQL, Redis, Docker',
+                'architecture': 'Arquitetura em camadas.'
+            },
+            'installation': {
+                'prerequisites': 'Python 3.9+\nNode.js 18+',
+                'installation_steps': 'git clone https://github.com/exemplo/projeto\npip install -r requirements.txt',
+                'env_variables': 'DATABASE_URL=postgres://localhost/projeto'
+            },
+            'usage': {
+                'usage_instructions': 'python app.py',
+                'examples': 'curl http://localhost:5000/api',
+                'commands': 'run: inicia o servidor\ntest: executa os testes'
+            },
+            'api': {'has_api': 'Sim', 'api_documentation': 'GET /api/itens'},
+            'roadmap': {
+                'future_features': '\n'.join(f'Funcionalidade futura {i}' for i in range(entries)),
+                'known_issues': '\n'.join(f'Problema conhecido {i}' for i in range(entries))
+            },
+            'faq': {
+                'faq_items': '\n'.join(f'P: Pergunta {i}?\nR: Resposta {i}.' for i in range(entries))
+            },
+            'team': {
+                'team_members': '\n'.join(f'Pessoa {i} - Desenvolvimento' for i in range(entries))
+            },
+            'license': {'license_type': 'MIT'},
+            'contact': {'contact_info': 'contato@exemplo.com', 'support_channels': 'Issues no GitHub'}
+        }
+    }
+
+def run(quick=False, repeat=20):
+    """
+    Executa os benchmarks do gerador.
+
+    Args:
+        quick (bool): Usa apenas os tamanhos menores
+        repeat (int): Execuções cronometradas por medição
+
+    Returns:
+        list: Resultados de measure
+    """
+    results = []
+    for entries in (QUICK_SIZES if quick else SIZES):
+        project = synthetic_project(entries)
+        params = {'entries': entries}
+
+        # Sem cache: todos os fragmentos são gerados a cada execução
+        results.append(measure('generate_markdown (frio)', generate_markdown, repeat=repeat,
+                               setup=lambda project=project: (clear_fragment_cache(), project)[1],
+                               params=params))
+        # Com cache: apenas índice e junção do documento
+        results.append(measure('generate_markdown (cache)', lambda project=project: generate_markdown(project),
+                               repeat=repeat, params=params))
+    return results
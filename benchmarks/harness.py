@@ -0,0 +1,121 @@
+"""
+Medição de tempo e memória usada por todos os benchmarks.
+"""
+
+import gc
+import math
+import time
+import tracemalloc
+
+def percentile(sorted_values, fraction):
+    """
+    Calcula um percentil por interpolação linear.
+
+    Args:
+        sorted_values (list): Amostras em ordem crescente
+        fraction (float): Percentil desejado entre 0 e 1 (0.95 = p95)
+
+    Returns:
+        float: Valor do percentil
+    """
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def scaled_repeat(repeat, size, reference=10000, minimum=3):
+    """
+    Reduz o número de execuções de medições grandes, mantendo um mínimo.
+
+    Args:
+        repeat (int): Execuções usadas até o tamanho de referência
+        size (int): Tamanho da entrada medida
+        reference (int): Tamanho a partir do qual as execuções diminuem
+        minimum (int): Menor número de execuções
+
+    Returns:
+        int: Execuções cronometradas para o tamanho informado
+    """
+    if size <= reference:
+        return repeat
+    return max(minimum, repeat * reference // size)
+
+def measure(name, func, repeat=20, warmup=2, setup=None, params=None):
+    """
+    Mede o tempo e o pico de memória de uma função.
+
+    Os tempos são medidos sem o tracemalloc, que deixa a execução mais
+    lenta; o pico de memória vem de uma execução separada e rastreada.
+
+    Args:
+        name (str): Nome da medição
+        func (callable): Função medida; recebe o retorno de setup, se houver
+        repeat (int): Execuções cronometradas
+        warmup (int): Execuções descartadas antes da medição
+        setup (callable): Prepara o argumento de cada execução, fora do tempo medido
+        params (dict): Parâmetros da medição registrados no resultado
+
+    Returns:
+        dict: Nome, parâmetros, tempos em ms (min, média, p50, p95, p99, max)
+            e pico de memória em bytes
+    """
+    def run_once():
+        argument = setup() if setup else None
+        started = time.perf_counter()
+        if setup:
+            func(argument)
+        else:
+            func()
+        return time.perf_counter() - started
+
+    for _ in range(warmup):
+        run_once()
+
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        samples = sorted(run_once() * 1000 for _ in range(repeat))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    argument = setup() if setup else None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        if setup:
+            func(argument)
+        else:
+            func()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'name': name,
+        'params': params or {},
+        'repeat': repeat,
+        'ms': {
+            'min': samples[0],
+            'mean': sum(samples) / len(samples),
+            'p50': percentile(samples, 0.50),
+            'p95': percentile(samples, 0.95),
+            'p99': percentile(samples, 0.99),
+            'max': samples[-1]
+        },
+        'peak_memory_bytes': peak
+    }
+
+def format_result(result):
+    """Resume um resultado em uma linha legível"""
+    ms = result['ms']
+    params = ' '.join(f'{key}={value}' for key, value in result['params'].items())
+    return (f"{result['name']:<32} {params:<24} p50 {ms['p50']:9.2f} ms  p95 {ms['p95']:9.2f} ms  "
+            f"p99 {ms['p99']:9.2f} ms  pico {result['peak_memory_bytes'] / 1024:10.1f} KiB")
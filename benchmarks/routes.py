@@ -0,0 +1,132 @@
+"""
+Benchmarks das rotas Flask executadas pelo cliente de testes.
+
+A aplicação é importada com banco, cache e jobs de análise em um diretório
+temporário, para não tocar nos dados reais. A análise de uploads roda no
+pool de processos, então o pico de memória medido em /upload_structure
+cobre apenas o worker que atende a requisição.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+
+from benchmarks.analyzer import member_names
+from benchmarks.generator import synthetic_project
+from benchmarks.harness import measure
+
+PROJECT_SIZES = (10, 1000)
+QUICK_PROJECT_SIZES = (10,)
+
+UPLOAD_SIZES = (1000, 10000)
+QUICK_UPLOAD_SIZES = (1000,)
+
+# Tempo máximo (segundos) de espera pela análise em segundo plano
+UPLOAD_TIMEOUT = 60
+
+def _load_app(work_dir):
+    """Importa a aplicação apontando o armazenamento para um diretório temporário; retorna (app, store)"""
+    os.environ['DATABASE_PATH'] = os.path.join(work_dir, 'docgen.sqlite3')
+    os.environ['ANALYSIS_CACHE_DIR'] = os.path.join(work_dir, 'analysis_cache')
+    from app import app, analysis_jobs, store
+    analysis_jobs.jobs_dir = os.path.join(work_dir, 'analysis_jobs')
+    app.config['TESTING'] = True
+    return app, store
+
+def _start_project(app, store, project):
+    """Cria uma sessão com o projeto informado e retorna o cliente de testes e o ID da sessão"""
+    client = app.test_client()
+    client.post('/setup', data={'project_type': project['type']})
+    with client.session_transaction() as session:
+        sid = session.sid
+    store.save_project(sid, project)
+    return client, sid
+
+def _zip_bytes(names, marker):
+    """Monta um zip em memória; o marcador torna cada arquivo único e evita o cache de análises"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as archive:
+        archive.writestr(f'projeto/.marcador_{marker}', b'')
+        for name in names:
+            archive.writestr(name, b'')
+    return buffer.getvalue()
+
+def _upload(client, data):
+    """Envia o arquivo e consulta o job até a análise terminar"""
+    response = client.post('/upload_structure', data={
+        'project_files': (io.BytesIO(data), 'projeto.zip')
+    }, content_type='multipart/form-data')
+    payload = response.get_json()
+    deadline = time.monotonic() + UPLOAD_TIMEOUT
+    while payload.get('status') == 'pending':
+        if time.monotonic() > deadline:
+            raise RuntimeError('Tempo limite da análise excedido')
+        time.sleep(0.005)
+        payload = client.get(payload.get('status_url') or response.headers['Location']).get_json()
+    if payload.get('status') != 'done':
+        raise RuntimeError(payload.get('error', 'Falha na análise'))
+
+def run(quick=False, repeat=20):
+    """
+    Executa os benchmarks das rotas.
+
+    Args:
+        quick (bool): Usa apenas os tamanhos menores
+        repeat (int): Execuções cronometradas por medição
+
+    Returns:
+        list: Resultados de measure
+    """
+    results = []
+    work_dir = tempfile.mkdtemp(prefix='docgen-bench-')
+    try:
+        app, store = _load_app(work_dir)
+
+        for entries in (QUICK_PROJECT_SIZES if quick else PROJECT_SIZES):
+            client, sid = _start_project(app, store, synthetic_project(entries))
+            params = {'entries': entries}
+
+            results.append(measure('GET /editor', lambda: client.get('/editor'),
+                                   repeat=repeat, params=params))
+
+            etag = client.get('/editor').headers['ETag']
+            results.append(measure('GET /editor (304)',
+                                   lambda: client.get('/editor', headers={'If-None-Match': etag}),
+                                   repeat=repeat, params=params))
+
+            edits = iter(range(10 ** 9))
+            results.append(measure(
+                'POST /update_section',
+                lambda: client.post('/update_section', data={
+                    'section': 'about',
+                    'description': f'Descrição {next(edits)}'
+                }),
+                repeat=repeat, params=params
+            ))
+
+            state = {'version': store.load_project_version(sid)}
+
+            def update_delta():
+                response = client.post(f"/update_section?delta=1&base_version={state['version']}", data={
+                    'section': 'about',
+                    'description': f'Descrição {next(edits)}'
+                })
+                state['version'] = response.get_json()['version']
+
+            results.append(measure('POST /update_section (delta)', update_delta,
+                                   repeat=repeat, params=params))
+
+        client, _ = _start_project(app, store, synthetic_project(10))
+        markers = iter(range(10 ** 9))
+        for count in (QUICK_UPLOAD_SIZES if quick else UPLOAD_SIZES):
+            names = member_names(count)
+            results.append(measure('POST /upload_structure',
+                                   lambda data: _upload(client, data),
+                                   setup=lambda: _zip_bytes(names, next(markers)),
+                                   repeat=repeat, warmup=1, params={'members': count}))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
@@ -1,14 +1,30 @@
+from utils.template_manager import is_section_data_complete
+
 class Project:
     """
     Classe para representar um projeto e suas seções de documentação.
+    
+    Cada seção guarda a versão do projeto em que foi alterada pela última vez,
+    e as seções modificadas em memória ficam marcadas até serem gravadas. Assim
+    é possível perguntar o que mudou desde uma versão (changed_since) e gravar
+    apenas o que mudou (dirty_sections), sem comparar o projeto inteiro.
     """
     
+    __slots__ = ('project_type', 'name', 'sections', 'structure', 'theme', 'version', 'section_versions',
+                 'section_complete', 'structure_version', '_dirty_sections', '_structure_dirty')
+    
     def __init__(self, project_type=None, name=None):
         self.project_type = project_type
         self.name = name
         self.sections = {}
         self.structure = None
         self.theme = "default"
+        self.version = 0  # Incrementada pelo armazenamento a cada gravação
+        self.section_versions = {}  # Versão do projeto em que cada seção mudou pela última vez
+        self.section_complete = {}  # Completude de cada seção, validada ao gravar a versão atual
+        self.structure_version = 0  # Versão em que a estrutura analisada mudou pela última vez
+        self._dirty_sections = set()
+        self._structure_dirty = False
         
     def to_dict(self):
         """
@@ -19,7 +35,11 @@ class Project:
             'name': self.name,
             'sections': self.sections,
             'structure': self.structure,
-            'theme': self.theme
+            'theme': self.theme,
+            'version': self.version,
+            'section_versions': self.section_versions,
+            'section_complete': self.section_complete,
+            'structure_version': self.structure_version
         }
     
     @classmethod
@@ -34,6 +54,10 @@ class Project:
         project.sections = data.get('sections', {})
         project.structure = data.get('structure')
         project.theme = data.get('theme', 'default')
+        project.version = data.get('version', 0)
+        project.section_versions = data.get('section_versions', {})
+        project.section_complete = data.get('section_complete', {})
+        project.structure_version = data.get('structure_version', 0)
         return project
     
     def update_section(self, section_id, data):
@@ -41,6 +65,14 @@ class Project:
         Atualiza uma seção específica do projeto.
         """
         self.sections[section_id] = data
+        self._dirty_sections.add(section_id)
+        
+    def set_structure(self, structure):
+        """
+        Define a estrutura de arquivos analisada do projeto.
+        """
+        self.structure = structure
+        self._structure_dirty = True
         
     def get_section(self, section_id):
         """
@@ -48,13 +80,81 @@ class Project:
         """
         return self.sections.get(section_id, {})
         
+    @property
+    def is_dirty(self):
+        """
+        Indica se há alterações em memória ainda não gravadas.
+        """
+        return bool(self._dirty_sections) or self._structure_dirty
+        
+    @property
+    def structure_dirty(self):
+        """
+        Indica se a estrutura analisada mudou desde a última gravação.
+        """
+        return self._structure_dirty
+        
+    def dirty_sections(self):
+        """
+        Retorna as seções alteradas desde a última gravação.
+        
+        Returns:
+            dict: Dados de cada seção alterada, indexados pelo ID da seção
+        """
+        return {section_id: self.sections[section_id] for section_id in self._dirty_sections}
+        
+    def mark_saved(self, version, complete=None):
+        """
+        Registra que as alterações pendentes foram gravadas na versão informada.
+        
+        Args:
+            version (int): Versão do projeto após a gravação
+            complete (dict): Completude das seções gravadas, validada pelo armazenamento
+        """
+        for section_id in self._dirty_sections:
+            self.section_versions[section_id] = version
+            self.section_complete.pop(section_id, None)
+        self.section_complete.update(complete or {})
+        if self._structure_dirty:
+            self.structure_version = version
+        self.version = version
+        self._dirty_sections.clear()
+        self._structure_dirty = False
+        
+    def changed_since(self, version):
+        """
+        Lista as seções alteradas depois de uma versão do projeto.
+        
+        A estrutura analisada é informada como a seção 'structure', que é
+        onde ela aparece no documento.
+        
+        Args:
+            version (int): Versão de referência
+            
+        Returns:
+            set: IDs das seções alteradas depois da versão informada
+        """
+        changed = {section_id for section_id, section_version in self.section_versions.items()
+                   if section_version > version}
+        changed.update(self._dirty_sections)
+        if self.structure_version > version or self._structure_dirty:
+            changed.add('structure')
+        return changed
+        
     def is_section_complete(self, section_id):
         """
         Verifica se uma seção está completa (todos os campos obrigatórios preenchidos).
+        
+        Usa o resultado validado na gravação da versão atual da seção; apenas
+        seções alteradas em memória (ou gravadas por versões antigas) são
+        validadas campo a campo.
         """
         if section_id not in self.sections:
             return False
             
-        # Lógica para verificar campos obrigatórios
-        # Implementação dependerá das regras específicas para cada seção
-        return True
\ No newline at end of file
+        if section_id not in self._dirty_sections:
+            complete = self.section_complete.get(section_id)
+            if complete is not None:
+                return complete
+        
+        return is_section_data_complete(self.project_type, section_id, self.sections[section_id])
\ No newline at end of file
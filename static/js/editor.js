@@ -6,6 +6,10 @@
 // Constantes
 const ANIMATION_DURATION = 300; // em ms
 const DEBOUNCE_DELAY = 500; // em ms
+const ANALYSIS_POLL_INTERVAL = 1000; // em ms
+const AUTOSAVE_INTERVAL = 3000; // em ms, no modo de preview no navegador
+const STREAM_MAX_FAILURES = 3; // Falhas seguidas do canal SSE antes de passar para long-poll
+const STREAM_RETRY_DELAY = 2000; // em ms, entre tentativas do long-poll após erro
 
 // Estado do editor
 let editorState = {
@@ -13,7 +17,16 @@ let editorState = {
     formChanged: false,
     previewVisible: window.innerWidth >= 1024,
     lastSavedData: null,
-    uploading: false
+    uploading: false,
+    previewVersion: null, // Versão do documento exibida no preview
+    previewMode: 'server', // 'server', 'stream' (canal SSE) ou 'client' (preview gerado no navegador)
+    previewSource: null, // EventSource do canal de preview no modo stream
+    pendingChange: null, // Última edição ainda não enviada no modo stream
+    changeInFlight: false, // Envio de edição em andamento no modo stream
+    project: null, // Dados do projeto no modo cliente
+    renderedFragments: new Map(), // Markdown de cada fragmento exibido no modo cliente
+    pendingSections: {}, // Seções alteradas ainda não gravadas no servidor
+    savePromise: null // Gravação em andamento no modo cliente
 };
 
 /**
@@ -23,6 +36,17 @@ let editorState = {
 function initEditor(sectionId) {
     editorState.currentSection = sectionId;
     
+    // O preview inicial já vem renderizado pelo servidor, na versão indicada
+    const preview = document.getElementById('markdown-preview');
+    if (preview && preview.dataset.version) {
+        editorState.previewVersion = parseInt(preview.dataset.version, 10);
+    }
+    if (preview && preview.dataset.previewMode === 'client') {
+        initClientPreview(preview);
+    } else if (preview && preview.dataset.previewMode === 'stream') {
+        initPreviewStream();
+    }
+    
     // Inicializa componentes
     initFormHandlers();
     initPreviewToggle();
@@ -233,31 +257,73 @@ function uploadProjectStructure(file) {
         method: 'POST',
         body: formData
     })
-    .then(response => response.json())
+    .then(response => {
+        if (response.status === 503) {
+            const retryAfter = response.headers.get('Retry-After') || ANALYSIS_POLL_INTERVAL / 1000;
+            throw new Error(`Servidor ocupado. Tente novamente em ${retryAfter} segundos.`);
+        }
+        return response.json();
+    })
     .then(data => {
-        if (data.success) {
-            // Atualiza o campo de estrutura manual com a estrutura analisada
-            const manualStructureField = document.getElementById('manual_structure');
-            if (manualStructureField) {
-                manualStructureField.value = data.structure;
-                showMessage('Estrutura do projeto analisada com sucesso!', 'success');
-                
-                // Atualiza o preview para mostrar a estrutura
-                updatePreview();
+        if (!data.success) {
+            throw new Error(data.error || 'Erro desconhecido');
+        }
+        return data.status === 'pending' ? pollAnalysisJob(data.status_url) : data;
+    })
+    .then(data => {
+        // O servidor já gravou a estrutura; o estado local do modo cliente acompanha
+        if (editorState.project) {
+            editorState.project.structure = data.structure;
+            if (editorState.project.sections.structure) {
+                editorState.project.sections.structure.manual_structure = data.structure;
             }
-        } else {
-            showMessage('Erro ao analisar estrutura: ' + data.error, 'error');
+            renderClientPreview();
+        }
+        
+        // Atualiza o campo de estrutura manual com a estrutura analisada
+        const manualStructureField = document.getElementById('manual_structure');
+        if (manualStructureField) {
+            manualStructureField.value = data.structure;
+            showMessage('Estrutura do projeto analisada com sucesso!', 'success');
+            
+            // Atualiza o preview para mostrar a estrutura
+            updatePreview();
         }
     })
     .catch(error => {
         console.error('Erro ao fazer upload:', error);
-        showMessage('Erro ao enviar arquivo. Tente novamente.', 'error');
+        showMessage('Erro ao analisar estrutura: ' + error.message, 'error');
     })
     .finally(() => {
         editorState.uploading = false;
     });
 }
 
+/**
+ * Consulta periodicamente o andamento de uma análise de estrutura
+ * @param {string} statusUrl - URL de status do job
+ * @returns {Promise} - Promise que resolve com o resultado da análise concluída
+ */
+function pollAnalysisJob(statusUrl) {
+    return new Promise((resolve, reject) => {
+        const check = () => {
+            fetch(statusUrl)
+                .then(response => response.json())
+                .then(data => {
+                    if (!data.success) {
+                        reject(new Error(data.error || 'Erro desconhecido'));
+                    } else if (data.status === 'pending') {
+                        setTimeout(check, ANALYSIS_POLL_INTERVAL);
+                    } else {
+                        resolve(data);
+                    }
+                })
+                .catch(reject);
+        };
+        setTimeout(check, ANALYSIS_POLL_INTERVAL);
+    });
+}
+
 /**
  * Inicializa o modal de exportação
  */
@@ -440,6 +506,10 @@ function updateConditionalFields() {
  * @returns {Promise} - Promise que resolve quando o salvamento terminar
  */
 function saveSection(silent = false) {
+    if (editorState.previewMode === 'client') {
+        return saveClientSection(silent);
+    }
+    
     return new Promise((resolve, reject) => {
         const form = document.getElementById('section-form');
         if (!form) {
@@ -450,7 +520,7 @@ function saveSection(silent = false) {
         const formData = new FormData(form);
         formData.append('section', editorState.currentSection);
         
-        fetch('/update_section', {
+        fetch(sectionUpdateUrl(), {
             method: 'POST',
             body: formData
         })
@@ -464,8 +534,8 @@ function saveSection(silent = false) {
                     showMessage('Seção salva com sucesso!', 'success');
                 }
                 
-                // Atualiza o preview com o markdown gerado
-                renderMarkdownPreview(data.markdown);
+                // Atualiza o preview com os fragmentos alterados
+                applyPreviewUpdate(data);
                 
                 // Atualiza o status da seção no menu
                 updateSectionStatus();
@@ -493,20 +563,32 @@ function updatePreview() {
     const form = document.getElementById('section-form');
     if (!form) return;
     
+    // No modo cliente o preview é gerado localmente e a gravação fica para o autosave
+    if (editorState.previewMode === 'client') {
+        applyClientEdit(form);
+        return;
+    }
+    
     const formData = new FormData(form);
     formData.append('section', editorState.currentSection);
     
+    // No modo stream a edição só é enfileirada; o preview chega pelo canal da aba
+    if (editorState.previewMode === 'stream') {
+        sendPreviewChange(formData);
+        return;
+    }
+    
     // Não atualiza o preview se estiver em uma tela pequena e o preview não estiver visível
     if (window.innerWidth < 1024 && !editorState.previewVisible) return;
     
-    fetch('/update_section', {
+    fetch(sectionUpdateUrl(), {
         method: 'POST',
         body: formData
     })
     .then(response => response.json())
     .then(data => {
         if (data.success) {
-            renderMarkdownPreview(data.markdown);
+            applyPreviewUpdate(data);
         }
     })
     .catch(error => {
@@ -514,6 +596,413 @@ function updatePreview() {
     });
 }
 
+/**
+ * Inicializa o modo stream: as edições vão para /preview/changes e o
+ * preview é atualizado pelos deltas recebidos no canal SSE da aba
+ */
+function initPreviewStream() {
+    editorState.previewMode = 'stream';
+    connectPreviewStream();
+}
+
+/**
+ * Abre o canal SSE do preview, ou o long-poll se SSE não estiver disponível
+ */
+function connectPreviewStream() {
+    if (!window.EventSource) {
+        pollPreviewChanges();
+        return;
+    }
+    
+    let url = '/preview/stream';
+    if (editorState.previewVersion !== null) {
+        url += '?since=' + editorState.previewVersion;
+    }
+    
+    // Ao reconectar, o navegador informa a última versão recebida (Last-Event-ID)
+    const source = new EventSource(url);
+    let failures = 0;
+    editorState.previewSource = source;
+    
+    source.addEventListener('preview', event => {
+        applyPreviewUpdate(Object.assign({mode: 'delta'}, JSON.parse(event.data)));
+    });
+    source.addEventListener('expired', () => {
+        source.close();
+        showMessage('Sessão expirada. Recarregue a página para continuar.', 'error');
+    });
+    source.onopen = () => {
+        failures = 0;
+    };
+    source.onerror = () => {
+        failures++;
+        if (failures >= STREAM_MAX_FAILURES || source.readyState === EventSource.CLOSED) {
+            source.close();
+            editorState.previewSource = null;
+            pollPreviewChanges();
+        }
+    };
+}
+
+/**
+ * Reabre o canal pedindo o documento completo (quando o preview perde fragmentos)
+ */
+function restartPreviewStream() {
+    editorState.previewVersion = null;
+    if (editorState.previewSource) {
+        editorState.previewSource.close();
+        connectPreviewStream();
+    }
+    // No long-poll, a próxima consulta já sai sem versão e recebe tudo
+}
+
+/**
+ * Long-poll: aguarda a próxima versão do preview e consulta de novo
+ */
+function pollPreviewChanges() {
+    let url = '/preview/poll';
+    if (editorState.previewVersion !== null) {
+        url += '?since=' + editorState.previewVersion;
+    }
+    
+    let delay = 0;
+    fetch(url)
+        .then(response => {
+            // Servidor sem conexões disponíveis: responde na hora e indica quando consultar de novo
+            const interval = parseInt(response.headers.get('X-Preview-Poll-Interval'), 10);
+            if (interval > 0) delay = interval * 1000;
+            return response.status === 204 ? null : response.json();
+        })
+        .then(data => {
+            if (data && !data.success) {
+                showMessage('Sessão expirada. Recarregue a página para continuar.', 'error');
+                return;
+            }
+            if (data) {
+                applyPreviewUpdate(data);
+            }
+            setTimeout(pollPreviewChanges, delay);
+        })
+        .catch(error => {
+            console.error('Erro no canal de preview:', error);
+            setTimeout(pollPreviewChanges, STREAM_RETRY_DELAY);
+        });
+}
+
+/**
+ * Envia uma edição no modo stream
+ * Apenas um envio fica em andamento; edições feitas nesse meio tempo
+ * substituem umas às outras e só a última é enviada
+ * @param {FormData} formData - Dados da seção editada
+ */
+function sendPreviewChange(formData) {
+    editorState.pendingChange = formData;
+    if (editorState.changeInFlight) return;
+    
+    const body = editorState.pendingChange;
+    editorState.pendingChange = null;
+    editorState.changeInFlight = true;
+    
+    fetch('/preview/changes', {
+        method: 'POST',
+        body: body
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            editorState.formChanged = false;
+            editorState.lastSavedData = body;
+        } else {
+            showMessage('Erro ao salvar: ' + (data.error || 'Erro desconhecido'), 'error');
+        }
+    })
+    .catch(error => {
+        console.error('Erro ao enviar edição:', error);
+    })
+    .finally(() => {
+        editorState.changeInFlight = false;
+        if (editorState.pendingChange) {
+            sendPreviewChange(editorState.pendingChange);
+        }
+    });
+}
+
+/**
+ * Inicializa o modo de preview no navegador
+ * O preview é gerado por readme_generator.js e as seções alteradas são
+ * gravadas em lote a cada AUTOSAVE_INTERVAL
+ * @param {HTMLElement} preview - Container do preview
+ */
+function initClientPreview(preview) {
+    const projectData = document.getElementById('project-data');
+    if (!projectData || typeof generateMarkdownFragments !== 'function') return;
+    
+    editorState.previewMode = 'client';
+    editorState.project = JSON.parse(projectData.textContent);
+    renderClientPreview();
+    
+    // Os badges de tecnologias aparecem assim que o índice for carregado
+    loadBadgeIndex()
+        .then(() => renderClientPreview())
+        .catch(error => console.error('Erro ao carregar badges:', error));
+    
+    const interval = parseInt(preview.dataset.autosaveInterval, 10) || AUTOSAVE_INTERVAL;
+    setInterval(() => {
+        if (editorState.savePromise) return;
+        flushAutosave().catch(error => console.error('Erro no salvamento automático:', error));
+    }, interval);
+    
+    // Grava o que estiver pendente ao sair da página ou trocar de aba
+    window.addEventListener('pagehide', () => flushAutosave(true));
+    document.addEventListener('visibilitychange', () => {
+        if (document.visibilityState === 'hidden') flushAutosave(true);
+    });
+}
+
+/**
+ * Lê os dados do formulário da seção no mesmo formato gravado pelo servidor
+ * @param {HTMLFormElement} form - Formulário da seção
+ * @returns {Object} - Dados da seção
+ */
+function formSectionData(form) {
+    const data = {};
+    new FormData(form).forEach((value, key) => {
+        // Arquivos são enviados separadamente (upload de estrutura)
+        if (typeof value !== 'string') return;
+        
+        const isList = key.endsWith('[]');
+        const baseKey = isList ? key.slice(0, -2) : key;
+        if (baseKey in data) {
+            data[baseKey] = [].concat(data[baseKey], value);
+        } else {
+            data[baseKey] = isList ? [value] : value;
+        }
+    });
+    return data;
+}
+
+/**
+ * Aplica a edição atual ao projeto local, atualiza o preview e agenda a gravação
+ * @param {HTMLFormElement} form - Formulário da seção
+ */
+function applyClientEdit(form) {
+    const data = formSectionData(form);
+    editorState.project.sections[editorState.currentSection] = data;
+    editorState.pendingSections[editorState.currentSection] = data;
+    renderClientPreview();
+}
+
+/**
+ * Gera o preview no navegador, substituindo apenas os fragmentos alterados
+ */
+function renderClientPreview() {
+    if (!editorState.project) return;
+    
+    const fragments = generateMarkdownFragments(editorState.project);
+    const changed = {};
+    fragments.forEach(([id, markdown]) => {
+        if (editorState.renderedFragments.get(id) !== markdown) {
+            changed[id] = { markdown, html: markdownToHtml(markdown) };
+        }
+    });
+    
+    if (patchPreviewFragments(fragments.map(([id]) => id), changed)) {
+        editorState.renderedFragments = new Map(fragments);
+    } else if (editorState.renderedFragments.size > 0) {
+        // O preview foi alterado por fora: renderiza tudo novamente
+        editorState.renderedFragments = new Map();
+        renderClientPreview();
+    }
+}
+
+/**
+ * Converte markdown em HTML com marked.js (ou texto pré-formatado, se indisponível)
+ * @param {string} markdown - Conteúdo markdown
+ * @returns {string} - HTML
+ */
+function markdownToHtml(markdown) {
+    if (window.marked) {
+        return marked.parse(markdown);
+    }
+    const pre = document.createElement('pre');
+    pre.textContent = markdown;
+    return pre.outerHTML;
+}
+
+/**
+ * Grava de uma vez as seções alteradas desde a última gravação
+ * Edições repetidas na mesma seção são combinadas, e só há uma gravação em andamento
+ * @param {boolean} beacon - Usa navigator.sendBeacon (ao sair da página)
+ * @returns {Promise} - Promise que resolve quando a gravação terminar
+ */
+function flushAutosave(beacon = false) {
+    if (editorState.savePromise && !beacon) {
+        return editorState.savePromise.then(() => flushAutosave());
+    }
+    
+    const sections = editorState.pendingSections;
+    if (Object.keys(sections).length === 0) return Promise.resolve();
+    editorState.pendingSections = {};
+    
+    const body = JSON.stringify({ sections });
+    if (beacon && navigator.sendBeacon) {
+        navigator.sendBeacon('/save_sections', new Blob([body], { type: 'application/json' }));
+        return Promise.resolve();
+    }
+    
+    editorState.savePromise = fetch('/save_sections', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body
+    })
+    .then(response => response.json().then(data => {
+        if (!data.success) {
+            const error = new Error(data.error || 'Erro desconhecido');
+            // Dados recusados pelo servidor seriam recusados de novo a cada reenvio
+            error.rejected = response.status === 400;
+            throw error;
+        }
+        return data;
+    }))
+    .then(data => {
+        editorState.previewVersion = data.version;
+        updateSectionStatus();
+        return data;
+    })
+    .catch(error => {
+        // Devolve as seções à fila sem sobrescrever edições mais recentes
+        if (!error.rejected) {
+            editorState.pendingSections = Object.assign(sections, editorState.pendingSections);
+        }
+        throw error;
+    })
+    .finally(() => {
+        editorState.savePromise = null;
+    });
+    return editorState.savePromise;
+}
+
+/**
+ * Salva a seção atual no modo cliente, gravando imediatamente o que estiver pendente
+ * @param {boolean} silent - Se true, não mostra mensagens de sucesso
+ * @returns {Promise} - Promise que resolve quando o salvamento terminar
+ */
+function saveClientSection(silent) {
+    const form = document.getElementById('section-form');
+    if (!form) {
+        return Promise.reject(new Error('Formulário não encontrado'));
+    }
+    
+    applyClientEdit(form);
+    return flushAutosave()
+        .then(data => {
+            editorState.formChanged = false;
+            if (!silent) {
+                showMessage('Seção salva com sucesso!', 'success');
+            }
+            return data;
+        })
+        .catch(error => {
+            console.error('Erro ao salvar seção:', error);
+            showMessage('Erro ao salvar. Verifique sua conexão e tente novamente.', 'error');
+            throw error;
+        });
+}
+
+/**
+ * URL de atualização de seção no modo incremental
+ * Informa a versão exibida para que o servidor envie apenas o que mudou
+ * @returns {string} - URL da requisição
+ */
+function sectionUpdateUrl() {
+    let url = '/update_section?delta=1';
+    if (editorState.previewVersion !== null) {
+        url += '&base_version=' + editorState.previewVersion;
+    }
+    return url;
+}
+
+/**
+ * Aplica no preview a resposta de /update_section
+ * @param {Object} data - Resposta do servidor
+ */
+function applyPreviewUpdate(data) {
+    if (data.mode !== 'delta') {
+        renderMarkdownPreview(data.markdown);
+        return;
+    }
+    
+    // Ignora respostas atrasadas de versões já exibidas
+    if (editorState.previewVersion !== null && data.version <= editorState.previewVersion) return;
+    
+    if (patchPreviewFragments(data.order, data.fragments)) {
+        editorState.previewVersion = data.version;
+    } else {
+        // O preview perdeu algum fragmento: pede o documento completo
+        editorState.previewVersion = null;
+        if (editorState.previewMode === 'stream') {
+            restartPreviewStream();
+            return;
+        }
+        editorState.formChanged = true;
+        updatePreview();
+    }
+}
+
+/**
+ * Aplica no preview os fragmentos alterados, na ordem do documento
+ * Blocos sem conteúdo novo são mantidos como estão (apenas movidos, se
+ * necessário); blocos fora da ordem informada são removidos
+ * @param {string[]} order - IDs dos fragmentos na ordem do documento
+ * @param {Object} fragments - Fragmentos alterados ({id: {markdown, html}})
+ * @returns {boolean} - false se algum fragmento não enviado faltar no preview (nada é alterado)
+ */
+function patchPreviewFragments(order, fragments) {
+    const previewContainer = document.getElementById('markdown-preview');
+    if (!previewContainer) return false;
+
+    const existing = new Map();
+    Array.from(previewContainer.children).forEach(child => {
+        if (child.classList.contains('preview-fragment') && child.dataset.fragmentId) {
+            existing.set(child.dataset.fragmentId, child);
+        }
+    });
+
+    // Confere antes de alterar: os fragmentos não enviados precisam já estar no preview
+    if (order.some(id => !(id in fragments) && !existing.has(id))) return false;
+
+    const blocks = order.map(id => {
+        let block = existing.get(id);
+        if (id in fragments) {
+            if (!block) {
+                block = document.createElement('div');
+                block.className = 'preview-fragment';
+                block.dataset.fragmentId = id;
+            }
+            block.innerHTML = fragments[id].html;
+            if (window.hljs) {
+                block.querySelectorAll('pre code').forEach(code => hljs.highlightElement(code));
+            }
+        }
+        return block;
+    });
+
+    // Remove fragmentos antigos e qualquer conteúdo de fora dos blocos (placeholder, documento completo)
+    const kept = new Set(blocks);
+    Array.from(previewContainer.children).forEach(child => {
+        if (!kept.has(child)) child.remove();
+    });
+
+    // Insere e reordena movendo apenas os blocos fora de posição
+    blocks.forEach((block, index) => {
+        const current = previewContainer.children[index] || null;
+        if (current !== block) {
+            previewContainer.insertBefore(block, current);
+        }
+    });
+    return true;
+}
+
 /**
  * Renderiza o markdown no preview
  * @param {string} markdown - Conteúdo markdown
@@ -522,6 +1011,9 @@ function renderMarkdownPreview(markdown) {
     const previewContainer = document.getElementById('markdown-preview');
     if (!previewContainer) return;
     
+    // O documento inteiro substitui os fragmentos do preview incremental
+    editorState.previewVersion = null;
+    
     // Usa marked.js para renderizar markdown em HTML
     if (window.marked) {
         previewContainer.innerHTML = marked.parse(markdown);
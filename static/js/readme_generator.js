@@ -0,0 +1,542 @@
+/**
+ * DocGen - Gerador de README no navegador
+ * Port de utils/markdown_generator.py usado pelo preview no modo cliente.
+ * Qualquer mudança nos templates de seção deve ser feita nos dois arquivos.
+ */
+
+// Índice de badges (alias normalizado -> URL), carregado de /badges.json
+let badgeIndex = null;
+
+// Seções usadas por generateSpecificSections para cada tipo de projeto
+const SPECIFIC_SECTIONS = {
+    backend: ['database'],
+    frontend: ['ui_components', 'state_management'],
+    mobile: ['platforms']
+};
+
+/**
+ * Carrega o índice de badges de tecnologias
+ * @returns {Promise} - Promise que resolve quando o índice estiver disponível
+ */
+function loadBadgeIndex() {
+    return fetch('/badges.json')
+        .then(response => response.json())
+        .then(index => {
+            badgeIndex = index;
+            return index;
+        });
+}
+
+/**
+ * Normaliza o nome de uma tecnologia como tech_badges.normalize_tech_name
+ * @param {string} name - Nome digitado pelo usuário
+ * @returns {string} - Nome normalizado
+ */
+function normalizeTechName(name) {
+    return name.trim().toLowerCase().replace(/[\s._-]+/g, '');
+}
+
+/**
+ * Equivalente a dict.get do Python (o valor padrão só vale para chaves ausentes)
+ */
+function getValue(data, key, defaultValue = '') {
+    return data && Object.prototype.hasOwnProperty.call(data, key) ? data[key] : defaultValue;
+}
+
+/**
+ * Verdadeiro para valores considerados vazios pelo Python (None, '', {}, [])
+ */
+function isBlank(value) {
+    if (value === null || value === undefined || value === '' || value === false) return true;
+    if (Array.isArray(value)) return value.length === 0;
+    if (typeof value === 'object') return Object.keys(value).length === 0;
+    return false;
+}
+
+/**
+ * Linhas não vazias de um texto, já sem espaços nas pontas
+ */
+function nonEmptyLines(text) {
+    return text.trim().split('\n').map(line => line.trim()).filter(line => line);
+}
+
+function generateHeader(projectInfo) {
+    const name = getValue(projectInfo, 'name', 'Projeto');
+    const logoUrl = getValue(projectInfo, 'logo_url');
+    const shortDescription = getValue(projectInfo, 'short_description');
+
+    const header = ['<a id="top"></a>'];
+
+    if (logoUrl) {
+        header.push(`<div align="center">\n  <img src="${logoUrl}" alt="${name} Logo" width="200">\n</div>`);
+    }
+
+    header.push(`# ${name}`);
+
+    if (shortDescription) {
+        header.push(`> ${shortDescription}`);
+    }
+
+    header.push(`
+<p align="center">
+  <a href="https://github.com/username/repo/stargazers"><img src="https://img.shields.io/github/stars/username/repo" alt="Stars Badge"/></a>
+  <a href="https://github.com/username/repo/network/members"><img src="https://img.shields.io/github/forks/username/repo" alt="Forks Badge"/></a>
+  <a href="https://github.com/username/repo/pulls"><img src="https://img.shields.io/github/issues-pr/username/repo" alt="Pull Requests Badge"/></a>
+  <a href="https://github.com/username/repo/issues"><img src="https://img.shields.io/github/issues/username/repo" alt="Issues Badge"/></a>
+  <a href="https://github.com/username/repo/blob/master/LICENSE"><img src="https://img.shields.io/github/license/username/repo" alt="License Badge"/></a>
+</p>
+`);
+
+    return header.join('\n');
+}
+
+function generateAboutSection(aboutData) {
+    if (isBlank(aboutData)) return '';
+
+    const description = getValue(aboutData, 'description');
+    const motivation = getValue(aboutData, 'motivation');
+    const keyFeatures = getValue(aboutData, 'key_features');
+
+    const about = ['## 📋 Sobre o Projeto'];
+
+    if (description) about.push(description);
+
+    if (motivation) {
+        about.push('\n### Motivação\n');
+        about.push(motivation);
+    }
+
+    if (keyFeatures) {
+        about.push('\n### Principais Diferenciais\n');
+        nonEmptyLines(keyFeatures).forEach(feature => about.push(`- ${feature}`));
+    }
+
+    return about.join('\n');
+}
+
+function generateTableOfContents(project) {
+    const sections = project.sections || {};
+    const toc = ['## 📑 Índice\n'];
+
+    const tocSections = [
+        ['about', 'Sobre o Projeto'],
+        ['technology', 'Tecnologias Utilizadas'],
+        ['installation', 'Instalação e Configuração'],
+        ['usage', 'Como Utilizar'],
+        ['structure', 'Estrutura do Projeto'],
+        ['api', 'API e Endpoints'],
+        ['roadmap', 'Roadmap'],
+        ['contributing', 'Contribuição'],
+        ['license', 'Licença'],
+        ['contact', 'Contato e Suporte'],
+        ['faq', 'FAQ'],
+        ['team', 'Equipe'],
+        ['acknowledgements', 'Agradecimentos']
+    ];
+
+    tocSections.forEach(([sectionId, sectionTitle]) => {
+        if (!isBlank(sections[sectionId])) {
+            toc.push(`- [📍 ${sectionTitle}](#${sectionId.toLowerCase()})`);
+        }
+    });
+
+    return toc.join('\n');
+}
+
+function generateTechnologiesSection(techData) {
+    if (isBlank(techData)) return '';
+
+    const technologies = getValue(techData, 'technologies');
+    const architecture = getValue(techData, 'architecture');
+
+    const techSection = ['## 🔧 Tecnologias Utilizadas\n'];
+
+    if (technologies) {
+        const techBadges = technologies.trim().split(',').map(tech => {
+            const badgeUrl = badgeIndex && badgeIndex[normalizeTechName(tech)];
+            return badgeUrl ? `<img src="${badgeUrl}" alt="${tech.trim()}">` : `**${tech.trim()}**`;
+        });
+
+        techSection.push('<p align="center">');
+        techSection.push('  ' + techBadges.join(' '));
+        techSection.push('</p>\n');
+    }
+
+    if (architecture) {
+        techSection.push('### Arquitetura\n');
+        techSection.push(architecture);
+    }
+
+    return techSection.join('\n');
+}
+
+function generateInstallationSection(installationData) {
+    if (isBlank(installationData)) return '';
+
+    const prerequisites = getValue(installationData, 'prerequisites');
+    const installationSteps = getValue(installationData, 'installation_steps');
+    const envVariables = getValue(installationData, 'env_variables');
+
+    const installation = ['## 🚀 Instalação e Configuração\n'];
+
+    if (prerequisites) {
+        installation.push('### Pré-requisitos\n');
+        nonEmptyLines(prerequisites).forEach(req => installation.push(`- ${req}`));
+        installation.push('');
+    }
+
+    if (installationSteps) {
+        installation.push('### Passos para Instalação\n');
+        installation.push('```bash');
+        installation.push(installationSteps);
+        installation.push('```\n');
+    }
+
+    if (envVariables) {
+        installation.push('### Variáveis de Ambiente\n');
+        installation.push('Crie um arquivo `.env` na raiz do projeto com as seguintes variáveis:\n');
+        installation.push('```env');
+        installation.push(envVariables);
+        installation.push('```');
+    }
+
+    return installation.join('\n');
+}
+
+function generateUsageSection(usageData) {
+    if (isBlank(usageData)) return '';
+
+    const usageInstructions = getValue(usageData, 'usage_instructions');
+    const examples = getValue(usageData, 'examples');
+    const commands = getValue(usageData, 'commands');
+
+    const usage = ['## 📘 Como Utilizar\n'];
+
+    if (usageInstructions) {
+        usage.push(usageInstructions);
+        usage.push('');
+    }
+
+    if (examples) {
+        usage.push('### Exemplos\n');
+        usage.push('```');
+        usage.push(examples);
+        usage.push('```\n');
+    }
+
+    if (commands) {
+        usage.push('### Comandos Principais\n');
+        usage.push('| Comando | Descrição |');
+        usage.push('| ------- | --------- |');
+
+        commands.trim().split('\n').forEach(cmd => {
+            const separator = cmd.indexOf(':');
+            if (separator !== -1) {
+                usage.push(`| \`${cmd.slice(0, separator).trim()}\` | ${cmd.slice(separator + 1).trim()} |`);
+            } else if (cmd.trim()) {
+                usage.push(`| \`${cmd.trim()}\` | - |`);
+            }
+        });
+    }
+
+    return usage.join('\n');
+}
+
+function generateStructureSection(structureData, structureSection) {
+    const manualStructure = getValue(structureSection, 'manual_structure');
+    if (!structureData && !manualStructure) return '';
+
+    return ['## 📁 Estrutura do Projeto\n', '```', structureData || manualStructure, '```'].join('\n');
+}
+
+function generateApiSection(apiData) {
+    if (isBlank(apiData) || getValue(apiData, 'has_api', null) !== 'Sim') return '';
+
+    const apiDocumentation = getValue(apiData, 'api_documentation');
+    const api = ['## 🔌 API e Endpoints\n'];
+
+    if (apiDocumentation) api.push(apiDocumentation);
+
+    return api.join('\n');
+}
+
+function generateSpecificSections(projectType, sections) {
+    const specificSections = [];
+
+    if (projectType === 'backend' && 'database' in sections) {
+        const dbSection = ['## 💾 Banco de Dados\n'];
+        const databaseSchema = getValue(sections.database, 'database_schema');
+        const migrations = getValue(sections.database, 'migrations');
+
+        if (databaseSchema) {
+            dbSection.push('### Esquema do Banco de Dados\n');
+            dbSection.push(databaseSchema);
+            dbSection.push('');
+        }
+
+        if (migrations) {
+            dbSection.push('### Migrações\n');
+            dbSection.push(migrations);
+        }
+
+        if (dbSection.length > 1) specificSections.push(dbSection.join('\n'));
+    } else if (projectType === 'frontend') {
+        if ('ui_components' in sections) {
+            const uiSection = ['## 🎨 Componentes de UI\n'];
+            const uiLibrary = getValue(sections.ui_components, 'ui_library');
+            const componentStructure = getValue(sections.ui_components, 'component_structure');
+
+            if (uiLibrary) {
+                uiSection.push(`Este projeto utiliza **${uiLibrary}** para seus componentes de UI.\n`);
+            }
+
+            if (componentStructure) {
+                uiSection.push('### Estrutura de Componentes\n');
+                uiSection.push(componentStructure);
+            }
+
+            if (uiSection.length > 1) specificSections.push(uiSection.join('\n'));
+        }
+
+        if ('state_management' in sections) {
+            const stateSection = ['## 🔄 Gerenciamento de Estado\n'];
+            const stateSolution = getValue(sections.state_management, 'state_solution');
+            const stateDescription = getValue(sections.state_management, 'state_description');
+
+            if (stateSolution) {
+                stateSection.push(`Este projeto utiliza **${stateSolution}** para gerenciamento de estado.\n`);
+            }
+
+            if (stateDescription) {
+                stateSection.push('### Implementação do Estado\n');
+                stateSection.push(stateDescription);
+            }
+
+            if (stateSection.length > 1) specificSections.push(stateSection.join('\n'));
+        }
+    } else if (projectType === 'mobile') {
+        if ('platforms' in sections) {
+            const platformsSection = ['## 📱 Plataformas Suportadas\n'];
+            let platformList = getValue(sections.platforms, 'platform_list', []);
+            const minVersions = getValue(sections.platforms, 'min_versions');
+
+            if (!isBlank(platformList)) {
+                if (typeof platformList === 'string') platformList = [platformList];
+                platformsSection.push(platformList.join(', '));
+                platformsSection.push('');
+            }
+
+            if (minVersions) {
+                platformsSection.push('### Versões Mínimas Suportadas\n');
+                platformsSection.push(minVersions);
+            }
+
+            if (platformsSection.length > 1) specificSections.push(platformsSection.join('\n'));
+        }
+    }
+
+    return specificSections;
+}
+
+function generateRoadmapSection(roadmapData) {
+    if (isBlank(roadmapData)) return '';
+
+    const futureFeatures = getValue(roadmapData, 'future_features');
+    const knownIssues = getValue(roadmapData, 'known_issues');
+
+    const roadmap = ['## 🛣️ Roadmap\n'];
+
+    if (futureFeatures) {
+        roadmap.push('### Funcionalidades Futuras\n');
+        nonEmptyLines(futureFeatures).forEach(feature => roadmap.push(`- [ ] ${feature}`));
+        roadmap.push('');
+    }
+
+    if (knownIssues) {
+        roadmap.push('### Problemas Conhecidos\n');
+        nonEmptyLines(knownIssues).forEach(issue => roadmap.push(`- ${issue}`));
+    }
+
+    return roadmap.join('\n');
+}
+
+function generateContributingSection(contributingData) {
+    if (isBlank(contributingData)) return '';
+
+    const contributionGuidelines = getValue(contributingData, 'contribution_guidelines');
+    const codeOfConduct = getValue(contributingData, 'code_of_conduct');
+
+    const contributing = ['## 👥 Contribuição\n'];
+
+    if (contributionGuidelines) {
+        contributing.push(contributionGuidelines);
+        contributing.push('');
+    } else {
+        contributing.push(`
+Contribuições são o que fazem a comunidade open source um lugar incrível para aprender, inspirar e criar. Qualquer contribuição que você fizer será **muito apreciada**.
+
+1. Faça um Fork do projeto
+2. Crie uma Branch para sua Feature (\`git checkout -b feature/AmazingFeature\`)
+3. Faça commit das suas alterações (\`git commit -m 'Add some AmazingFeature'\`)
+4. Faça Push para a Branch (\`git push origin feature/AmazingFeature\`)
+5. Abra um Pull Request
+`);
+    }
+
+    if (codeOfConduct) {
+        contributing.push('### Código de Conduta\n');
+        contributing.push(codeOfConduct);
+    }
+
+    return contributing.join('\n');
+}
+
+function generateLicenseSection(licenseData) {
+    if (isBlank(licenseData)) return '';
+
+    const licenseType = getValue(licenseData, 'license_type');
+    const customLicense = getValue(licenseData, 'custom_license');
+
+    const licenseSection = ['## 📜 Licença\n'];
+
+    if (licenseType === 'Outra' && customLicense) {
+        licenseSection.push(customLicense);
+    } else if (licenseType && licenseType !== 'Nenhuma') {
+        licenseSection.push(`Este projeto está licenciado sob a licença ${licenseType} - veja o arquivo [LICENSE](LICENSE) para detalhes.`);
+    } else {
+        licenseSection.push('Este projeto ainda não possui uma licença definida.');
+    }
+
+    return licenseSection.join('\n');
+}
+
+function generateContactSection(contactData) {
+    if (isBlank(contactData)) return '';
+
+    const contactInfo = getValue(contactData, 'contact_info');
+    const supportChannels = getValue(contactData, 'support_channels');
+
+    const contact = ['## 📞 Contato e Suporte\n'];
+
+    if (contactInfo) {
+        contact.push(contactInfo);
+        contact.push('');
+    }
+
+    if (supportChannels) {
+        contact.push('### Canais de Suporte\n');
+        nonEmptyLines(supportChannels).forEach(channel => contact.push(`- ${channel}`));
+    }
+
+    return contact.join('\n');
+}
+
+function generateFaqSection(faqData) {
+    if (isBlank(faqData)) return '';
+
+    const faqItems = getValue(faqData, 'faq_items');
+    if (!faqItems) return '';
+
+    const faq = ['## ❓ FAQ\n'];
+    let currentQuestion = null;
+
+    faqItems.split('\n').forEach(line => {
+        const item = line.trim();
+        if (item.startsWith('P:') || item.startsWith('Q:')) {
+            if (currentQuestion) faq.push('');
+            const question = item.slice(2).trim();
+            faq.push(`### ${question}`);
+            currentQuestion = question;
+        } else if (item.startsWith('R:') || item.startsWith('A:')) {
+            if (currentQuestion) faq.push(item.slice(2).trim());
+        }
+    });
+
+    return faq.join('\n');
+}
+
+function generateAcknowledgementsSection(acknowledgementsData) {
+    if (isBlank(acknowledgementsData)) return '';
+
+    const acknowledgements = getValue(acknowledgementsData, 'acknowledgements');
+    if (!acknowledgements) return '';
+
+    const ackSection = ['## 🙏 Agradecimentos\n'];
+    nonEmptyLines(acknowledgements).forEach(ack => ackSection.push(`* ${ack}`));
+
+    return ackSection.join('\n');
+}
+
+function generateTeamSection(teamData) {
+    if (isBlank(teamData)) return '';
+
+    const teamMembers = getValue(teamData, 'team_members');
+    if (!teamMembers) return '';
+
+    const teamSection = ['## 👨‍💻 Equipe\n'];
+
+    teamMembers.trim().split('\n').forEach(member => {
+        if (!member.trim()) return;
+
+        // Formato "Nome - Função"
+        const separator = member.indexOf(' - ');
+        if (separator !== -1) {
+            teamSection.push(`* **${member.slice(0, separator).trim()}** - ${member.slice(separator + 3).trim()}`);
+        } else {
+            teamSection.push(`* **${member.trim()}**`);
+        }
+    });
+
+    return teamSection.join('\n');
+}
+
+/**
+ * Gera os fragmentos markdown de cada seção, na mesma ordem e com os mesmos
+ * IDs de generate_markdown_fragments
+ * @param {Object} project - Projeto no formato de Project.to_dict
+ * @returns {Array} - Pares [id_do_fragmento, markdown]
+ */
+function generateMarkdownFragments(project) {
+    const sections = project.sections || {};
+    const fragments = [['header', generateHeader(getValue(sections, 'project_info', {}))]];
+
+    const push = (id, content) => {
+        if (content) fragments.push([id, content]);
+    };
+
+    push('about', generateAboutSection(getValue(sections, 'about', {})));
+    push('toc', generateTableOfContents(project));
+    push('technology', generateTechnologiesSection(getValue(sections, 'technology', {})));
+    push('installation', generateInstallationSection(getValue(sections, 'installation', {})));
+    push('usage', generateUsageSection(getValue(sections, 'usage', {})));
+    push('structure', generateStructureSection(project.structure || null, getValue(sections, 'structure', {})));
+    push('api', generateApiSection(getValue(sections, 'api', {})));
+
+    const specificData = {};
+    (SPECIFIC_SECTIONS[project.type] || []).forEach(sectionId => {
+        if (sectionId in sections) specificData[sectionId] = sections[sectionId];
+    });
+    generateSpecificSections(project.type || '', specificData).forEach((content, index) => {
+        fragments.push([`specific-${index}`, content]);
+    });
+
+    push('roadmap', generateRoadmapSection(getValue(sections, 'roadmap', {})));
+    push('contributing', generateContributingSection(getValue(sections, 'contributing', {})));
+    push('license', generateLicenseSection(getValue(sections, 'license', {})));
+    push('contact', generateContactSection(getValue(sections, 'contact', {})));
+    push('faq', generateFaqSection(getValue(sections, 'faq', {})));
+    push('acknowledgements', generateAcknowledgementsSection(getValue(sections, 'acknowledgements', {})));
+    push('team', generateTeamSection(getValue(sections, 'team', {})));
+
+    fragments.push(['back_to_top', '\n\n<p align="right">(<a href="#top">Voltar ao topo ⬆️</a>)</p>']);
+    return fragments;
+}
+
+/**
+ * Gera o markdown completo do README
+ * @param {Object} project - Projeto no formato de Project.to_dict
+ * @returns {string} - Documento markdown
+ */
+function generateMarkdown(project) {
+    return generateMarkdownFragments(project).map(([, content]) => content).join('\n\n');
+}
@@ -0,0 +1,38 @@
+"""
+Configuração compartilhada dos testes.
+
+A aplicação lê os caminhos de armazenamento ao ser importada, então eles são
+apontados para um diretório temporário antes do primeiro import.
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+_TEST_DIR = tempfile.mkdtemp(prefix='docgen-tests-')
+os.environ.setdefault('DATABASE_PATH', os.path.join(_TEST_DIR, 'docgen.sqlite3'))
+os.environ.setdefault('ANALYSIS_CACHE_DIR', os.path.join(_TEST_DIR, 'analysis_cache'))
+
+@pytest.fixture(scope='session')
+def app():
+    from app import app as flask_app, analysis_jobs
+    flask_app.config['TESTING'] = True
+    analysis_jobs.jobs_dir = os.path.join(_TEST_DIR, 'analysis_jobs')
+    return flask_app
+
+@pytest.fixture
+def client(app):
+    """Cliente com sessão própria, sem projeto iniciado"""
+    return app.test_client()
+
+@pytest.fixture
+def project_client(client):
+    """Cliente com um projeto backend de exemplo já criado"""
+    client.post('/setup', data={'project_type': 'backend', 'use_example': 'true'})
+    return client
@@ -0,0 +1,135 @@
+/**
+ * Testes de patchPreviewFragments e applyPreviewUpdate (static/js/editor.js)
+ * Executados com `node --test`, sobre um DOM mínimo com apenas o que o editor usa
+ */
+
+const assert = require('node:assert');
+const fs = require('node:fs');
+const path = require('node:path');
+const test = require('node:test');
+const vm = require('node:vm');
+
+const EDITOR_JS = path.join(__dirname, '..', '..', 'static', 'js', 'editor.js');
+
+class FakeElement {
+    constructor(tagName) {
+        this.tagName = tagName.toUpperCase();
+        this.children = [];
+        this.parent = null;
+        this.className = '';
+        this.dataset = {};
+        this.html = '';
+    }
+
+    get classList() {
+        return { contains: name => this.className.split(/\s+/).includes(name) };
+    }
+
+    set innerHTML(html) {
+        this.html = html;
+        this.children = [];
+    }
+
+    get innerHTML() {
+        return this.html;
+    }
+
+    querySelectorAll() {
+        return [];
+    }
+
+    remove() {
+        if (!this.parent) return;
+        this.parent.children.splice(this.parent.children.indexOf(this), 1);
+        this.parent = null;
+    }
+
+    insertBefore(node, reference) {
+        node.remove();
+        const index = reference === null ? this.children.length : this.children.indexOf(reference);
+        this.children.splice(index, 0, node);
+        node.parent = this;
+        return node;
+    }
+
+    appendChild(node) {
+        return this.insertBefore(node, null);
+    }
+}
+
+function fragmentBlock(id, html) {
+    const block = new FakeElement('div');
+    block.className = 'preview-fragment';
+    block.dataset.fragmentId = id;
+    block.innerHTML = html;
+    return block;
+}
+
+function loadEditor(...children) {
+    const preview = new FakeElement('div');
+    children.forEach(child => preview.appendChild(child));
+
+    const document = {
+        getElementById: id => (id === 'markdown-preview' ? preview : null),
+        createElement: tagName => new FakeElement(tagName),
+        addEventListener: () => {}
+    };
+    const context = vm.createContext({ document, window: { innerWidth: 1280 }, console });
+    vm.runInContext(fs.readFileSync(EDITOR_JS, 'utf-8'), context, { filename: EDITOR_JS });
+    return { context, preview };
+}
+
+function fragmentIds(preview) {
+    return preview.children.map(child => child.dataset.fragmentId || child.tagName);
+}
+
+test('substitui, insere, reordena e remove fragmentos', () => {
+    const header = fragmentBlock('header', '<h1>Antigo</h1>');
+    const about = fragmentBlock('about', '<h2>Sobre</h2>');
+    const { context, preview } = loadEditor(
+        header, about, fragmentBlock('faq', '<h2>FAQ</h2>'), new FakeElement('p')
+    );
+
+    const patched = context.patchPreviewFragments(
+        ['about', 'header', 'usage'],
+        { header: { markdown: '# Novo', html: '<h1>Novo</h1>' }, usage: { markdown: '## Uso', html: '<h2>Uso</h2>' } }
+    );
+
+    assert.strictEqual(patched, true);
+    assert.deepStrictEqual(fragmentIds(preview), ['about', 'header', 'usage']);
+    // Blocos existentes são reaproveitados; apenas os enviados têm o conteúdo trocado
+    assert.strictEqual(preview.children[0], about);
+    assert.strictEqual(about.innerHTML, '<h2>Sobre</h2>');
+    assert.strictEqual(preview.children[1], header);
+    assert.strictEqual(header.innerHTML, '<h1>Novo</h1>');
+    assert.strictEqual(preview.children[2].className, 'preview-fragment');
+    assert.strictEqual(preview.children[2].innerHTML, '<h2>Uso</h2>');
+});
+
+test('retorna false sem alterar o preview quando falta um fragmento', () => {
+    const header = fragmentBlock('header', '<h1>Projeto</h1>');
+    const { context, preview } = loadEditor(header);
+
+    const patched = context.patchPreviewFragments(
+        ['header', 'license'],
+        { header: { markdown: '# Outro', html: '<h1>Outro</h1>' } }
+    );
+
+    assert.strictEqual(patched, false);
+    assert.deepStrictEqual(fragmentIds(preview), ['header']);
+    assert.strictEqual(header.innerHTML, '<h1>Projeto</h1>');
+});
+
+test('applyPreviewUpdate aplica o delta e avança a versão exibida', () => {
+    const { context, preview } = loadEditor(fragmentBlock('header', '<h1>Projeto</h1>'));
+
+    context.applyPreviewUpdate({
+        mode: 'delta',
+        version: 3,
+        order: ['header', 'toc'],
+        fragments: { toc: { markdown: '## Índice', html: '<h2>Índice</h2>' } }
+    });
+
+    assert.deepStrictEqual(fragmentIds(preview), ['header', 'toc']);
+    assert.strictEqual(vm.runInContext('editorState.previewVersion', context), 3);
+});
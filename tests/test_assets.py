@@ -0,0 +1,66 @@
+"""
+Bundles gerados por utils.asset_builder.
+"""
+
+import os
+import shutil
+from urllib.parse import urljoin, urlsplit
+
+import pytest
+from flask import Flask
+
+pytest.importorskip('cssmin')
+pytest.importorskip('jsmin')
+
+from utils.asset_builder import CSS_URL, STATIC_FOLDER, build_assets, rebase_css_urls
+from utils.assets import DIST_DIR, AssetManifest
+
+@pytest.fixture
+def built_static(tmp_path):
+    static_folder = str(tmp_path / 'static')
+    shutil.copytree(STATIC_FOLDER, static_folder, ignore=shutil.ignore_patterns(DIST_DIR))
+    return static_folder, build_assets(static_folder)
+
+@pytest.mark.parametrize('prefix', ['', '/docgen'])
+def test_every_css_url_in_built_bundles_resolves(built_static, prefix):
+    static_folder, manifest = built_static
+    app = Flask(__name__, static_folder=static_folder)
+    AssetManifest(static_folder).init_app(app)
+    client = app.test_client()
+
+    checked = 0
+    for entry in manifest.values():
+        if not entry['file'].endswith('.css'):
+            continue
+        with open(os.path.join(static_folder, DIST_DIR, entry['file']), encoding='utf-8') as bundle_file:
+            content = bundle_file.read()
+
+        # Resolvido como o navegador faria, a partir do endereço do bundle
+        bundle_url = f'http://localhost{prefix}/assets/{entry["file"]}'
+        for match in CSS_URL.finditer(content):
+            url = next(group for group in match.groups() if group is not None)
+            if url.startswith('data:'):
+                continue
+            path = urlsplit(urljoin(bundle_url, url)).path
+            assert path.startswith(prefix + '/'), url
+            response = client.get(path[len(prefix):], environ_base={'SCRIPT_NAME': prefix})
+            assert response.status_code == 200, f'{url} -> {path}'
+            response.close()
+            checked += 1
+    assert checked > 0
+
+def test_rebase_keeps_absolute_urls_and_suffixes():
+    source = (
+        "a{background:url('../img/a.svg')}"
+        "b{src:url(\"../fonts/b.woff?v=1#iefix\")}"
+        "c{background:url(data:image/png;base64,AA==)}"
+        "d{background:url('/e.png')}"
+        "f{background:url(https://example.com/g.png)}"
+    )
+    assert rebase_css_urls('css/site.css', 'css/main.css', source) == (
+        "a{background:url('../../static/img/a.svg')}"
+        "b{src:url('../../static/fonts/b.woff?v=1#iefix')}"
+        "c{background:url(data:image/png;base64,AA==)}"
+        "d{background:url('/e.png')}"
+        "f{background:url(https://example.com/g.png)}"
+    )
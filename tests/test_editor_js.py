@@ -0,0 +1,21 @@
+"""
+Executa os testes JavaScript do editor (tests/js) com o runner nativo do Node.
+"""
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+JS_TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'js')
+
+NODE = shutil.which('node')
+
+@pytest.mark.skipif(NODE is None, reason='Node.js não instalado')
+def test_patch_preview_fragments():
+    result = subprocess.run(
+        [NODE, '--test', os.path.join(JS_TESTS_DIR, 'patch_preview_fragments.test.js')],
+        capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
@@ -0,0 +1,30 @@
+"""
+ETags das respostas geradas a partir do projeto, que mudam também com a versão do código.
+"""
+
+from utils.cache import files_hash
+
+def test_export_etag_changes_with_build_version(app, project_client, monkeypatch):
+    first = project_client.get('/export')
+    assert first.status_code == 200
+    etag = first.headers['ETag']
+
+    # A mesma versão revalida com 304
+    cached = project_client.get('/export', headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+
+    # Após um deploy, o ETag anterior não pode mais ser aceito
+    monkeypatch.setitem(app.config, 'BUILD_VERSION', 'outra-versao')
+    deployed = project_client.get('/export', headers={'If-None-Match': etag})
+    assert deployed.status_code == 200
+    assert deployed.headers['ETag'] != etag
+
+def test_files_hash_ignores_install_location(tmp_path):
+    for root in (tmp_path / 'a', tmp_path / 'b'):
+        (root / 'templates').mkdir(parents=True)
+        (root / 'templates' / 'base.html').write_text('<html></html>')
+    assert files_hash(str(tmp_path / 'a'), ['templates', 'missing.json']) == \
+        files_hash(str(tmp_path / 'b'), ['templates', 'missing.json'])
+
+    (tmp_path / 'b' / 'templates' / 'base.html').write_text('<html><body></body></html>')
+    assert files_hash(str(tmp_path / 'a'), ['templates']) != files_hash(str(tmp_path / 'b'), ['templates'])
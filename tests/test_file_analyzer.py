@@ -0,0 +1,124 @@
+import io
+import os
+import signal
+import time
+import zipfile
+
+import pytest
+from werkzeug.datastructures import FileStorage
+
+from utils.analysis_jobs import AnalysisJobQueue
+from utils.file_analyzer import ArchiveAnalysisError, analyze_structure
+
+def _zip_bytes(names):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        for name in names:
+            archive.writestr(name, 'conteúdo')
+    return buffer.getvalue()
+
+def _wait_for_job(client, status_url):
+    for _ in range(200):
+        response = client.get(status_url)
+        if response.get_json().get('status') != 'pending':
+            return response
+        time.sleep(0.05)
+    raise AssertionError('A análise não terminou a tempo')
+
+def test_analyze_structure_lists_archive_members():
+    upload = FileStorage(stream=io.BytesIO(_zip_bytes(['app/main.py', 'app/utils/io.py'])), filename='proj.zip')
+    structure = analyze_structure(upload)
+    assert 'main.py' in structure
+    assert 'utils' in structure
+
+def test_analyze_structure_raises_for_corrupt_archive():
+    upload = FileStorage(stream=io.BytesIO(b'isto nao e um zip'), filename='bad.zip')
+    with pytest.raises(ArchiveAnalysisError):
+        analyze_structure(upload)
+
+def test_corrupt_upload_reports_error_and_is_not_cached(app, project_client):
+    from app import analysis_cache
+
+    data = {'project_files': (io.BytesIO(b'corrompido' * 100), 'bad.zip')}
+    response = project_client.post('/upload_structure', data=data, content_type='multipart/form-data')
+    assert response.status_code == 202
+
+    result = _wait_for_job(project_client, response.get_json()['status_url'])
+    body = result.get_json()
+    assert body['status'] == 'error'
+    assert not body['success']
+    assert 'inválido' in body['error']
+    cached = []
+    if os.path.isdir(analysis_cache.directory):
+        for name in os.listdir(analysis_cache.directory):
+            with open(os.path.join(analysis_cache.directory, name), encoding='utf-8') as cache_file:
+                cached.append(cache_file.read())
+    assert not any('inválido' in entry for entry in cached)
+
+    # Um novo envio do mesmo arquivo é analisado de novo, e não respondido pelo cache
+    data = {'project_files': (io.BytesIO(b'corrompido' * 100), 'bad.zip')}
+    response = project_client.post('/upload_structure', data=data, content_type='multipart/form-data')
+    assert response.status_code == 202
+
+def test_analyze_structure_stops_reading_at_member_limit():
+    names = [f'proj/pkg{i // 10}/mod_{i}.py' for i in range(200)]
+    upload = FileStorage(stream=io.BytesIO(_zip_bytes(names)), filename='proj.zip')
+    stats = {}
+    structure = analyze_structure(upload, max_members=50, stats=stats)
+    assert structure.endswith('leitura do arquivo interrompida após 50 itens')
+    assert 'mod_49.py' in structure
+    assert 'mod_60.py' not in structure
+    assert stats['entries'] <= 51
+
+def test_analyze_structure_stops_reading_at_deadline():
+    upload = FileStorage(stream=io.BytesIO(_zip_bytes(['proj/a.py', 'proj/b.py'])), filename='proj.zip')
+    structure = analyze_structure(upload, time_budget=0)
+    assert structure.endswith('leitura do arquivo interrompida (limite de tempo atingido)')
+
+def test_spooled_upload_is_handed_to_the_job_without_leftovers(app, project_client, monkeypatch):
+    from app import analysis_jobs
+
+    # Força o upload a passar para o disco antes de ser entregue à análise
+    monkeypatch.setitem(app.config, 'UPLOAD_SPOOL_THRESHOLD', 1024)
+    names = [f'grande/modulo_{i}.py' for i in range(300)]
+    data = {'project_files': (io.BytesIO(_zip_bytes(names)), 'grande.zip')}
+    response = project_client.post('/upload_structure', data=data, content_type='multipart/form-data')
+    assert response.status_code == 202
+
+    result = _wait_for_job(project_client, response.get_json()['status_url']).get_json()
+    assert result['status'] == 'done'
+    assert 'modulo_0.py' in result['structure']
+    leftovers = [name for name in os.listdir(analysis_jobs.jobs_dir) if not name.endswith('.json')]
+    assert leftovers == []
+
+def _wait_for_state(queue, job_id):
+    for _ in range(200):
+        state = queue.status(job_id)
+        if state['status'] != 'pending':
+            return state
+        time.sleep(0.05)
+    raise AssertionError('A análise não terminou a tempo')
+
+@pytest.mark.skipif(not hasattr(signal, 'SIGKILL'), reason='SIGKILL indisponível')
+def test_job_queue_recovers_after_a_pool_process_dies(tmp_path):
+    queue = AnalysisJobQueue(str(tmp_path), max_workers=1)
+    upload = io.BytesIO(_zip_bytes(['app/main.py']))
+
+    job_id = queue.submit(upload, 'proj.zip', {})
+    assert _wait_for_state(queue, job_id)['status'] == 'done'
+
+    # Um processo do pool morre (por exemplo, encerrado por falta de memória)
+    broken = queue._executor
+    for pid in list(broken._processes):
+        os.kill(pid, signal.SIGKILL)
+    for _ in range(200):
+        if broken._broken:
+            break
+        time.sleep(0.05)
+    assert broken._broken
+
+    job_id = queue.submit(io.BytesIO(_zip_bytes(['app/main.py'])), 'proj.zip', {})
+    assert _wait_for_state(queue, job_id)['status'] == 'done'
+    assert queue._executor is not broken
+    assert queue._pending == 0
+    queue._executor.shutdown()
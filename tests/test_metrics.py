@@ -0,0 +1,63 @@
+"""
+Soma das métricas entre processos (METRICS_DIR).
+"""
+
+import os
+
+import pytest
+
+from utils.metrics import MetricsRegistry
+
+def _registry(directory):
+    registry = MetricsRegistry(directory)
+    histogram = registry.histogram('docgen_test_seconds', 'Teste.', labelnames=('endpoint',), buckets=(0.1, 1.0))
+    return registry, histogram
+
+def _sample(text, name):
+    for line in text.splitlines():
+        if line.startswith(name + ' '):
+            return float(line.split()[-1])
+    raise AssertionError(f'{name} ausente em:\n{text}')
+
+def test_render_sums_every_process(tmp_path):
+    first, first_histogram = _registry(str(tmp_path))
+    second, second_histogram = _registry(str(tmp_path))
+
+    first_histogram.observe(0.05, 'index')
+    second_histogram.observe(0.5, 'index')
+    second_histogram.observe(2.0, 'index')
+    second.flush()
+
+    # Qualquer worker que receba a consulta expõe o total
+    text = first.render()
+    assert _sample(text, 'docgen_test_seconds_count{endpoint="index"}') == 3
+    assert _sample(text, 'docgen_test_seconds_bucket{endpoint="index",le="0.1"}') == 1
+    assert _sample(text, 'docgen_test_seconds_bucket{endpoint="index",le="1"}') == 2
+    assert _sample(text, 'docgen_test_seconds_sum{endpoint="index"}') == pytest.approx(2.55)
+    assert second.render() == text
+
+def test_without_directory_metrics_are_per_process(tmp_path):
+    registry, histogram = _registry(None)
+    histogram.observe(0.05, 'index')
+    registry.flush()
+    assert _sample(registry.render(), 'docgen_test_seconds_count{endpoint="index"}') == 1
+    assert os.listdir(tmp_path) == []
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='os.fork indisponível')
+def test_forked_worker_does_not_repeat_parent_measurements(tmp_path):
+    registry, histogram = _registry(str(tmp_path))
+    histogram.observe(0.05, 'index')
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            histogram.observe(0.5, 'editor')
+            registry.flush()
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+    text = registry.render()
+    assert _sample(text, 'docgen_test_seconds_count{endpoint="index"}') == 1
+    assert _sample(text, 'docgen_test_seconds_count{endpoint="editor"}') == 1
+    assert len(os.listdir(tmp_path)) == 2
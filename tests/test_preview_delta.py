@@ -0,0 +1,73 @@
+def _update(client, base_version=None, section='faq', **fields):
+    url = '/update_section?delta=1'
+    if base_version is not None:
+        url += f'&base_version={base_version}'
+    response = client.post(url, data=dict(fields, section=section))
+    assert response.status_code == 200
+    return response.get_json()
+
+def test_stale_tab_after_reset_receives_every_fragment(project_client):
+    old = _update(project_client, faq_items='P: a\nR: b')
+
+    project_client.get('/reset')
+    project_client.post('/setup', data={'project_type': 'backend', 'use_example': 'true'})
+
+    # A aba antiga ainda exibe o projeto anterior e informa a versão dele
+    data = _update(project_client, base_version=old['version'], faq_items='P: c\nR: d')
+    assert data['version'] > old['version']
+    # Inclusive os fragmentos das seções que a aba antiga mostrava com o conteúdo do projeto anterior
+    assert {'header', 'about', 'technology', 'faq'} <= set(data['fragments'])
+
+def test_without_base_version_sends_every_fragment(project_client):
+    data = _update(project_client, faq_items='P: a\nR: b')
+    assert data['mode'] == 'delta'
+    assert set(data['fragments']) == set(data['order'])
+
+def test_consecutive_edit_sends_only_changed_fragments(project_client):
+    first = _update(project_client, faq_items='P: a\nR: b')
+    data = _update(project_client, base_version=first['version'], faq_items='P: c\nR: d')
+
+    assert data['version'] == first['version'] + 1
+    # O índice sempre acompanha, pois depende das seções preenchidas
+    assert set(data['fragments']) == {'faq', 'toc'}
+    assert '### c\nd' in data['fragments']['faq']['markdown']
+    assert data['order'] == first['order']
+
+def test_delta_includes_sections_saved_by_another_tab(project_client):
+    first = _update(project_client, faq_items='P: a\nR: b')
+    _update(project_client, section='about', description='Editado em outra aba', key_features='A')
+
+    # A aba ainda exibe a primeira versão: recebe também a seção gravada pela outra
+    data = _update(project_client, base_version=first['version'], faq_items='P: c\nR: d')
+    assert {'about', 'faq', 'toc'} <= set(data['fragments'])
+    assert 'Editado em outra aba' in data['fragments']['about']['markdown']
+
+def test_unknown_base_version_falls_back_to_every_fragment(project_client):
+    first = _update(project_client, faq_items='P: a\nR: b')
+    data = _update(project_client, base_version=first['version'] + 5, faq_items='P: c\nR: d')
+    assert set(data['fragments']) == set(data['order'])
+
+def test_concurrent_write_falls_back_to_every_fragment(app, project_client, monkeypatch):
+    import app as app_module
+
+    first = _update(project_client, faq_items='P: a\nR: b')
+    save_changes = app_module.store.save_changes
+
+    def save_after_another_request(sid, project):
+        # Outra requisição grava entre a leitura do projeto e esta gravação
+        app_module.store.save_section(sid, 'about', {'description': 'Concorrente'})
+        return save_changes(sid, project)
+
+    monkeypatch.setattr(app_module.store, 'save_changes', save_after_another_request)
+    data = _update(project_client, base_version=first['version'], faq_items='P: c\nR: d')
+
+    assert data['version'] == first['version'] + 2
+    assert set(data['fragments']) == set(data['order'])
+
+def test_full_update_without_delta(project_client):
+    response = project_client.post('/update_section', data={'section': 'faq', 'faq_items': 'P: a\nR: b'})
+    data = response.get_json()
+    assert data['success'] is True
+    assert 'fragments' not in data
+    assert '### a\nb' in data['markdown']
+    assert 'preview-fragment' in data['html_preview']
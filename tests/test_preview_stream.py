@@ -0,0 +1,41 @@
+import pytest
+
+from utils.preview_stream import format_event
+
+THREADED = {'wsgi.multithread': True}
+
+@pytest.fixture
+def channel(app, monkeypatch):
+    from app import preview_channel
+    from utils.preview_stream import PreviewChannel
+
+    # Canal com uma única conexão, para testar o limite
+    limited = PreviewChannel(preview_channel.store, max_connections=1)
+    monkeypatch.setattr('app.preview_channel', limited)
+    return limited
+
+def test_format_event():
+    assert format_event('preview', {'a': 1}, event_id=3) == 'id: 3\nevent: preview\ndata: {"a":1}\n\n'
+
+def test_sync_workers_never_hold_preview_connections(project_client, channel):
+    response = project_client.get('/preview/stream')
+    assert response.status_code == 503
+    assert response.headers['Retry-After']
+
+    # Sem conexão aberta, o poll responde na hora e indica o intervalo da próxima consulta
+    response = project_client.get('/preview/poll?since=0')
+    assert response.status_code == 200
+    assert response.headers['X-Preview-Poll-Interval']
+    assert response.get_json()['mode'] == 'delta'
+
+def test_stream_connections_are_limited_and_released(project_client, channel):
+    first = project_client.get('/preview/stream', environ_overrides=THREADED, buffered=False)
+    assert first.status_code == 200
+    assert first.mimetype == 'text/event-stream'
+
+    # A única conexão está ocupada: o segundo canal é recusado
+    assert project_client.get('/preview/stream', environ_overrides=THREADED).status_code == 503
+
+    first.close()
+    assert channel.acquire_connection()
+    channel.release_connection()
@@ -0,0 +1,38 @@
+"""
+Controle de alterações de Project (changed_since, dirty_sections).
+"""
+
+from models.project import Project
+
+def _saved_project():
+    return Project.from_dict({
+        'type': 'backend',
+        'name': 'Projeto',
+        'sections': {'project_info': {'name': 'Projeto'}, 'about': {'description': 'x'}, 'faq': {}},
+        'version': 5,
+        'section_versions': {'project_info': 1, 'about': 3, 'faq': 5},
+        'structure_version': 2
+    })
+
+def test_changed_since_compares_section_versions():
+    project = _saved_project()
+    assert project.changed_since(5) == set()
+    assert project.changed_since(3) == {'faq'}
+    assert project.changed_since(2) == {'about', 'faq'}
+    assert project.changed_since(1) == {'about', 'faq', 'structure'}
+    assert project.changed_since(0) == {'project_info', 'about', 'faq', 'structure'}
+
+def test_changed_since_includes_unsaved_changes():
+    project = _saved_project()
+    project.update_section('project_info', {'name': 'Outro'})
+    project.set_structure('projeto/')
+
+    assert project.dirty_sections() == {'project_info': {'name': 'Outro'}}
+    assert project.changed_since(5) == {'project_info', 'structure'}
+
+    project.mark_saved(6, {'project_info': True})
+    assert not project.is_dirty
+    assert project.changed_since(5) == {'project_info', 'structure'}
+    assert project.changed_since(6) == set()
+    assert project.section_versions['project_info'] == 6
+    assert project.structure_version == 6
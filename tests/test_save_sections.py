@@ -0,0 +1,40 @@
+"""
+Validação de /save_sections (modo de preview no navegador).
+"""
+
+import pytest
+
+def _save(client, sections):
+    return client.post('/save_sections', json={'sections': sections})
+
+def test_saves_form_shaped_sections(project_client):
+    response = _save(project_client, {
+        'about': {'description': 'Nova descrição', 'key_features': 'A\nB'},
+        'technology': {'languages': ['Python', 'Go']}
+    })
+    assert response.status_code == 200
+    assert response.get_json()['success'] is True
+
+    export = project_client.get('/export').get_json()
+    assert 'Nova descrição' in export['markdown']
+
+@pytest.mark.parametrize('sections', [
+    {'about': {'key_features': 5}},
+    {'about': {'key_features': None}},
+    {'technology': {'languages': ['Python', 3]}},
+    {'technology': {'languages': {'nested': 'x'}}},
+    {'about': 'texto'},
+    {'secao_inexistente': {'campo': 'valor'}},
+    ['about'],
+])
+def test_rejects_invalid_sections_without_writing(project_client, sections):
+    before = project_client.get('/export').get_json()['markdown']
+
+    response = _save(project_client, sections)
+    assert response.status_code == 400
+    assert response.get_json()['error']
+
+    # Nada foi gravado e o projeto continua sendo gerado normalmente
+    after = project_client.get('/export')
+    assert after.status_code == 200
+    assert after.get_json()['markdown'] == before
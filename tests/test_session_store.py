@@ -0,0 +1,100 @@
+import sqlite3
+import time
+
+import pytest
+
+from models.project import Project
+from utils.session_store import SQLiteStore
+
+@pytest.fixture
+def store(tmp_path):
+    return SQLiteStore(str(tmp_path / 'docgen.sqlite3'))
+
+def _project(**sections):
+    return {'type': 'backend', 'name': 'Projeto', 'sections': sections, 'structure': None, 'theme': 'default'}
+
+def test_versions_keep_increasing_after_reset(store):
+    store.save_project('sid', _project(project_info={'name': 'Antigo'}))
+    store.save_section('sid', 'about', {'description': 'x'})
+    old_version = store.load_project_version('sid')
+
+    store.delete_project('sid')
+    assert store.load_project_version('sid') is None
+
+    new_version = store.save_project('sid', _project(project_info={'name': 'Novo'}))
+    assert new_version > old_version
+    # Todas as seções do projeto novo são posteriores a qualquer versão do antigo
+    assert all(version > old_version for version in store.load_project('sid')['section_versions'].values())
+
+def test_save_changes_writes_only_dirty_sections(store):
+    version = store.save_project('sid', _project(project_info={'name': 'Projeto'}, about={'description': 'x'}))
+    project = Project.from_dict(store.load_project('sid'))
+
+    project.update_section('about', {'description': 'y'})
+    project.set_structure('projeto/\n└── app.py')
+    saved = store.save_changes('sid', project)
+
+    assert saved == version + 1
+    assert project.version == saved
+    assert not project.is_dirty
+    assert project.changed_since(version) == {'about', 'structure'}
+
+    loaded = store.load_project('sid')
+    assert loaded['version'] == saved
+    assert loaded['sections']['about'] == {'description': 'y'}
+    assert loaded['section_versions'] == {'project_info': version, 'about': saved}
+    assert loaded['structure'] == 'projeto/\n└── app.py'
+    assert loaded['structure_version'] == saved
+    assert loaded['section_complete'] == project.section_complete
+
+def test_save_changes_without_changes_keeps_version(store):
+    version = store.save_project('sid', _project(about={'description': 'x'}))
+    project = Project.from_dict(store.load_project('sid'))
+    assert store.save_changes('sid', project) == version
+    assert store.load_project_version('sid') == version
+
+def test_migrates_database_from_older_schema(tmp_path):
+    path = str(tmp_path / 'antigo.sqlite3')
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE projects (sid TEXT PRIMARY KEY, type TEXT, name TEXT, structure TEXT,
+                               theme TEXT NOT NULL DEFAULT 'default');
+        CREATE TABLE project_sections (sid TEXT NOT NULL, section_id TEXT NOT NULL, data TEXT NOT NULL,
+                                       PRIMARY KEY (sid, section_id));
+        INSERT INTO projects (sid, type, name) VALUES ('sid', 'backend', 'Antigo');
+        INSERT INTO project_sections VALUES ('sid', 'about', '{"description": "x"}');
+    """)
+    conn.commit()
+    conn.close()
+
+    store = SQLiteStore(path)
+    loaded = store.load_project('sid')
+    assert loaded['version'] == 0
+    assert loaded['section_versions'] == {'about': 0}
+    # Seções anteriores à coluna de completude são validadas na leitura
+    assert loaded['section_complete'] == {}
+    assert loaded['sections']['about'] == {'description': 'x'}
+
+    assert store.save_section('sid', 'faq', {'faq_items': 'P: a\nR: b'}) == 1
+    assert store.load_project('sid')['section_versions'] == {'about': 0, 'faq': 1}
+
+def test_delete_expired_removes_sessions_and_projects_in_batches(store):
+    now = time.time()
+    for sid in ('expirada-1', 'expirada-2', 'expirada-3'):
+        store.save_session(sid, '{}', now - 10)
+        store.save_project(sid, _project(about={'description': sid}))
+        store.delete_project(sid)
+        store.save_project(sid, _project(about={'description': sid}))
+    store.save_session('valida', '{}', now + 3600)
+    store.save_project('valida', _project(about={'description': 'valida'}))
+
+    assert store.delete_expired(now, batch_size=2) == 3
+
+    for sid in ('expirada-1', 'expirada-2', 'expirada-3'):
+        assert store.load_session(sid) is None
+        assert store.load_project(sid) is None
+        # A versão guardada do /reset também é removida: um projeto novo recomeça do 1
+        assert store.save_project(sid, _project()) == 1
+    assert store.load_session('valida') is not None
+    assert store.load_project('valida')['sections'] == {'about': {'description': 'valida'}}
+    assert store.delete_expired(now) == 0
@@ -0,0 +1,37 @@
+"""
+Registro de badges de tecnologias (utils/data/technologies.json).
+"""
+
+import json
+import re
+
+import pytest
+
+from utils.tech_badges import REGISTRY_PATH, get_badge_url, normalize_tech_name
+
+def _technologies():
+    with open(REGISTRY_PATH, encoding='utf-8') as registry_file:
+        return json.load(registry_file)['technologies']
+
+@pytest.mark.parametrize('names', [
+    ('nodejs', 'node', 'Node.js', 'Node JS'),
+    ('postgres', 'postgresql', 'PostgreSQL'),
+    ('react', 'React.js', 'reactjs'),
+])
+def test_aliases_resolve_to_the_same_badge(names):
+    urls = {get_badge_url(name) for name in names}
+    assert len(urls) == 1
+    assert None not in urls
+
+def test_unknown_technology_has_no_badge():
+    assert get_badge_url('Tecnologia Inexistente') is None
+
+def test_registry_entries_are_valid_and_aliases_unique():
+    owners = {}
+    for entry in _technologies():
+        assert entry['label'].strip() and entry['logo'].strip()
+        assert re.fullmatch(r'[0-9A-Fa-f]{6}', entry['color']), entry['label']
+        for alias in [entry['label']] + entry.get('aliases', []):
+            # Um alias repetido em outra tecnologia seria ignorado silenciosamente no índice
+            owner = owners.setdefault(normalize_tech_name(alias), entry['label'])
+            assert owner == entry['label'], f'{alias!r} pertence a {owner} e a {entry["label"]}'
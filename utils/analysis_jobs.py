@@ -0,0 +1,240 @@
+"""
+Fila de análise de estrutura em segundo plano.
+
+As análises de arquivos enviados rodam em um pool de processos local, fora
+dos workers que atendem as requisições interativas. O estado de cada job é
+gravado em um diretório compartilhado, de modo que qualquer worker consiga
+responder à consulta de status.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from werkzeug.datastructures import FileStorage
+
+from utils.file_analyzer import analyze_structure
+from utils.metrics import observe_archive_analysis
+
+# Tempo (segundos) que o resultado de um job fica disponível para consulta
+JOB_TTL = 60 * 60
+
+# Tempo (segundos) após o qual um job pendente é considerado perdido
+JOB_TIMEOUT = 5 * 60
+
+class QueueFullError(Exception):
+    """Indica que a fila de análises atingiu o limite de jobs pendentes"""
+
+def _run_analysis(path, filename, options):
+    """
+    Executa a análise de estrutura no processo do pool, removendo o arquivo ao final.
+
+    Args:
+        path (str): Caminho do arquivo compactado recebido
+        filename (str): Nome original do arquivo
+        options (dict): Limites repassados para analyze_structure
+
+    Returns:
+        tuple: (estrutura do projeto em formato de árvore, estatísticas da análise)
+    
+    Raises:
+        ArchiveAnalysisError: Se o arquivo não puder ser analisado
+    """
+    stats = {}
+    try:
+        with open(path, 'rb') as archive_file:
+            structure = analyze_structure(FileStorage(stream=archive_file, filename=filename),
+                                          stats=stats, **options)
+    finally:
+        _remove(path)
+    return structure, stats
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+class AnalysisJobQueue:
+    """
+    Fila limitada de análises de estrutura executadas em um pool de processos.
+    """
+
+    def __init__(self, jobs_dir, max_workers=2, max_pending=8, result_cache=None):
+        self.jobs_dir = jobs_dir
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.result_cache = result_cache
+        self._executor = None
+        self._executor_pid = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        """Cria o pool no processo atual (após o fork dos workers do servidor)"""
+        if self._executor is None or self._executor_pid != os.getpid():
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            self._executor_pid = os.getpid()
+            self._pending = 0
+        return self._executor
+
+    def _replace_broken_executor(self, broken):
+        """
+        Substitui um pool que deixou de aceitar tarefas.
+
+        Quando um processo do pool é encerrado abruptamente (falta de memória,
+        falha ao ler um arquivo patológico), o ProcessPoolExecutor recusa todas
+        as tarefas seguintes. Os jobs que estavam no pool quebrado terminam com
+        erro e são descontados de _pending pelos próprios callbacks.
+
+        Args:
+            broken (ProcessPoolExecutor): Pool que recusou a tarefa
+
+        Returns:
+            ProcessPoolExecutor: Pool atual do processo
+        """
+        with self._lock:
+            # Outra thread pode já ter substituído o pool
+            if self._executor is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def submit(self, stream, filename, options, cache_key=None):
+        """
+        Enfileira a análise de um arquivo compactado.
+
+        O conteúdo é entregue ao pool como um arquivo no diretório dos jobs:
+        uploads já em disco (HashingSpooledFile) são apenas movidos para lá,
+        sem passar pela memória do worker nem pelo pipe do pool.
+
+        Args:
+            stream: Arquivo recebido (HashingSpooledFile ou qualquer arquivo binário)
+            filename (str): Nome original do arquivo
+            options (dict): Limites repassados para analyze_structure
+            cache_key (str): Chave sob a qual o resultado é gravado em result_cache
+
+        Returns:
+            str: Identificador do job
+
+        Raises:
+            QueueFullError: Se a fila estiver cheia
+        """
+        with self._lock:
+            executor = self._get_executor()
+            if self._pending >= self.max_pending:
+                raise QueueFullError('Fila de análises cheia')
+            self._pending += 1
+
+        job_id = uuid.uuid4().hex
+        self._write(job_id, {'status': 'pending', 'created_at': time.time()})
+
+        upload_path = os.path.join(self.jobs_dir, job_id + '.upload')
+        try:
+            self._persist_upload(stream, upload_path)
+            try:
+                future = executor.submit(_run_analysis, upload_path, filename, options)
+            except BrokenProcessPool:
+                executor = self._replace_broken_executor(executor)
+                future = executor.submit(_run_analysis, upload_path, filename, options)
+        except Exception:
+            _remove(upload_path)
+            with self._lock:
+                self._pending -= 1
+            self._write(job_id, {'status': 'error', 'error': 'Não foi possível iniciar a análise',
+                                 'created_at': time.time()})
+            raise
+        future.add_done_callback(lambda f: self._finish(job_id, f, cache_key))
+        return job_id
+
+    def _persist_upload(self, stream, path):
+        """Grava o arquivo recebido no caminho lido pelo processo do pool"""
+        if hasattr(stream, 'persist'):
+            stream.persist(path)
+            return
+        stream.seek(0)
+        with open(path, 'wb') as output_file:
+            shutil.copyfileobj(stream, output_file)
+
+    def _finish(self, job_id, future, cache_key):
+        """Grava o resultado do job quando o processo do pool termina"""
+        with self._lock:
+            self._pending -= 1
+
+        try:
+            structure, stats = future.result()
+            state = {'status': 'done', 'structure': structure}
+        except BrokenProcessPool:
+            # O processo do pool foi encerrado durante a análise (por exemplo, sem memória)
+            state = {'status': 'error', 'error': 'A análise foi interrompida. Tente enviar o arquivo novamente.'}
+            stats = {}
+        except Exception as e:
+            # Falhas nunca vão para o cache: um novo envio do mesmo arquivo é analisado de novo
+            state = {'status': 'error', 'error': str(e)}
+            stats = {}
+        # A análise roda em outro processo; as métricas são registradas neste
+        observe_archive_analysis(stats)
+        state['created_at'] = time.time()
+        self._write(job_id, state)
+        
+        if state['status'] == 'done' and self.result_cache is not None and cache_key is not None:
+            try:
+                self.result_cache.set(cache_key, {
+                    'structure': state['structure'],
+                    'analyzed_at': state['created_at']
+                })
+            except OSError:
+                pass
+
+    def status(self, job_id):
+        """
+        Retorna o estado de um job.
+
+        Args:
+            job_id (str): Identificador do job
+
+        Returns:
+            dict: Estado do job ('pending', 'done' ou 'error'), ou None se não existir
+        """
+        try:
+            with open(self._path(job_id), encoding='utf-8') as job_file:
+                state = json.load(job_file)
+        except (OSError, ValueError):
+            return None
+
+        if state['status'] == 'pending' and time.time() - state['created_at'] > JOB_TIMEOUT:
+            return {'status': 'error', 'error': 'Tempo limite da análise excedido'}
+        return state
+
+    def purge_expired(self):
+        """Remove os arquivos de jobs mais antigos que JOB_TTL"""
+        limit = time.time() - JOB_TTL
+        try:
+            entries = list(os.scandir(self.jobs_dir))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < limit:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+    def _path(self, job_id):
+        if not job_id.isalnum():
+            raise ValueError('Identificador de job inválido')
+        return os.path.join(self.jobs_dir, job_id + '.json')
+
+    def _write(self, job_id, state):
+        """Grava o estado do job de forma atômica"""
+        os.makedirs(self.jobs_dir, exist_ok=True)
+        path = self._path(job_id)
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as job_file:
+            json.dump(state, job_file, ensure_ascii=False)
+        os.replace(temp_path, path)
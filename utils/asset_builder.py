@@ -0,0 +1,183 @@
+"""
+Build dos arquivos estáticos: agrupa, minifica e comprime os bundles de utils.assets.
+
+Cada bundle é gravado em static/dist com os primeiros caracteres do SHA-256
+do conteúdo no nome, acompanhado das versões .gz e .br (esta apenas quando o
+pacote brotli está instalado). Os url() relativos do CSS são reescritos
+para continuar apontando para os arquivos de static/. O manifest.json é
+gravado por último, para que a aplicação nunca encontre um manifest
+apontando para arquivos ainda inexistentes. Os bundles de builds anteriores são mantidos, já que páginas
+em cache podem continuar a referenciá-los.
+
+Uso:
+    python -m utils.asset_builder
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import posixpath
+import re
+import sys
+
+from cssmin import cssmin
+from jsmin import jsmin
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from utils.assets import ASSETS_URL_PATH, BUNDLES, DIST_DIR, ENCODING_SUFFIXES, MANIFEST_NAME, STATIC_URL_PATH
+
+# Caracteres do hash incluídos no nome dos arquivos
+HASH_LENGTH = 12
+
+STATIC_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+
+# url() do CSS, com aspas simples, duplas ou sem aspas
+CSS_URL = re.compile(r"""url\(\s*(?:'([^']*)'|"([^"]*)"|([^'")\s]+))\s*\)""")
+
+# Referências que não dependem da localização do arquivo CSS
+_ABSOLUTE_URL = re.compile(r'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|/|#)')
+
+def minify(name, source):
+    """Minifica um arquivo CSS ou JavaScript conforme a extensão"""
+    if name.endswith('.css'):
+        return cssmin(source)
+    return jsmin(source)
+
+def rebase_css_urls(bundle, name, source):
+    """
+    Ajusta os url() relativos de um arquivo CSS ao endereço do bundle.
+
+    O bundle é servido em /assets/, e não ao lado do original em /static/,
+    então '../img/icons/backend.svg' em css/main.css passaria a apontar para
+    /assets/img/icons/. O caminho é recalculado do bundle até o arquivo em
+    /static/ e continua relativo, para funcionar também com a aplicação
+    montada em um subcaminho.
+
+    Args:
+        bundle (str): Nome lógico do bundle, por exemplo 'css/site.css'
+        name (str): Arquivo CSS de origem, relativo à pasta static
+        source (str): Conteúdo do arquivo
+
+    Returns:
+        str: Conteúdo com os url() relativos reescritos
+    """
+    bundle_dir = posixpath.join(ASSETS_URL_PATH, posixpath.dirname(bundle))
+
+    def rebase(match):
+        url = next(group for group in match.groups() if group is not None)
+        if not url or _ABSOLUTE_URL.match(url):
+            return match.group(0)
+        # Sufixos como "?v=1" ou "#iefix" são mantidos
+        path, suffix = re.match(r'([^?#]*)(.*)', url).groups()
+        target = posixpath.normpath(posixpath.join(STATIC_URL_PATH, posixpath.dirname(name), path))
+        return f"url('{posixpath.relpath(target, bundle_dir)}{suffix}')"
+
+    return CSS_URL.sub(rebase, source)
+
+def bundle_content(static_folder, sources, bundle=None):
+    """
+    Concatena e minifica os arquivos de um bundle.
+
+    Args:
+        static_folder (str): Pasta static da aplicação
+        sources (tuple): Arquivos do bundle, relativos à pasta static
+        bundle (str): Nome lógico do bundle, usado para reescrever os url() do CSS
+
+    Returns:
+        bytes: Conteúdo do bundle em UTF-8
+    """
+    parts = []
+    for name in sources:
+        with open(os.path.join(static_folder, name), encoding='utf-8') as source_file:
+            source = source_file.read()
+        if bundle is not None and name.endswith('.css'):
+            source = rebase_css_urls(bundle, name, source)
+        parts.append(minify(name, source))
+    # O ";" evita que um script sem ponto e vírgula final se junte ao seguinte
+    separator = '\n' if sources[0].endswith('.css') else ';\n'
+    return separator.join(parts).encode('utf-8')
+
+def hashed_name(name, content):
+    """Inclui o hash do conteúdo no nome do arquivo (css/site.css -> css/site.<hash>.css)"""
+    root, extension = os.path.splitext(name)
+    return f'{root}.{hashlib.sha256(content).hexdigest()[:HASH_LENGTH]}{extension}'
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as output_file:
+        output_file.write(data)
+    os.replace(temp_path, path)
+
+def compress(content):
+    """
+    Gera as versões pré-comprimidas de um bundle.
+
+    Returns:
+        dict: Conteúdo comprimido, indexado pela codificação ('gzip', 'br')
+    """
+    variants = {'gzip': gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants['br'] = brotli.compress(content, mode=brotli.MODE_TEXT, quality=11)
+    return variants
+
+def build_assets(static_folder=STATIC_FOLDER, bundles=BUNDLES):
+    """
+    Gera todos os bundles e o manifest.
+
+    Args:
+        static_folder (str): Pasta static da aplicação
+        bundles (dict): Nome lógico -> arquivos de origem
+
+    Returns:
+        dict: Manifest gravado (nome lógico -> arquivo, tamanhos e codificações)
+    """
+    dist_folder = os.path.join(static_folder, DIST_DIR)
+    manifest = {}
+
+    for name, sources in bundles.items():
+        content = bundle_content(static_folder, sources, name)
+        filename = hashed_name(name, content)
+        path = os.path.join(dist_folder, filename)
+        _write(path, content)
+
+        variants = compress(content)
+        for encoding, data in variants.items():
+            _write(path + ENCODING_SUFFIXES[encoding], data)
+
+        manifest[name] = {
+            'file': filename,
+            'encodings': sorted(variants),
+            'size': len(content),
+            'compressed': {encoding: len(data) for encoding, data in variants.items()}
+        }
+
+    _write(os.path.join(dist_folder, MANIFEST_NAME),
+           json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True).encode('utf-8'))
+    return manifest
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m utils.asset_builder',
+        description='Agrupa, minifica e comprime o CSS e o JavaScript em static/dist.'
+    )
+    parser.add_argument('--static', default=STATIC_FOLDER, help='Pasta static da aplicação')
+    args = parser.parse_args(argv)
+
+    if brotli is None:
+        print('Pacote brotli não instalado: apenas as versões .gz serão geradas.', file=sys.stderr)
+
+    manifest = build_assets(args.static)
+    for name, entry in manifest.items():
+        sizes = ', '.join(f'{encoding} {size} B' for encoding, size in sorted(entry['compressed'].items()))
+        print(f'{name} -> {DIST_DIR}/{entry["file"]} ({entry["size"]} B; {sizes})')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+Arquivos estáticos agrupados, minificados e com o hash do conteúdo no nome.
+
+O comando `python -m utils.asset_builder` gera os bundles em static/dist,
+junto com as versões .gz e .br de cada um e um manifest.json que relaciona o
+nome lógico do bundle ao arquivo gerado. Os templates pedem os arquivos pelo
+nome lógico (asset_urls): com o manifest presente, recebem o arquivo com
+hash, servido com cache imutável de um ano; sem ele, como no
+desenvolvimento, recebem os arquivos originais um a um.
+"""
+
+import json
+import mimetypes
+import os
+
+from flask import abort, request, send_from_directory, url_for
+
+from utils.page_cache import choose_encoding
+
+# Bundles gerados, na ordem em que os arquivos de cada um são concatenados
+BUNDLES = {
+    'css/site.css': ('css/main.css', 'css/themes.css', 'css/animations.css'),
+    'js/site.js': ('js/main.js',),
+    'js/editor.js': ('js/editor.js', 'js/preview.js'),
+    'js/readme_generator.js': ('js/readme_generator.js',)
+}
+
+# Diretório dos bundles, dentro da pasta static
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+
+# Caminhos em que os bundles e os arquivos originais (padrão do Flask) são servidos
+ASSETS_URL_PATH = 'assets'
+STATIC_URL_PATH = 'static'
+
+# Extensão de cada versão pré-comprimida
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+# O nome muda junto com o conteúdo, então o navegador nunca precisa revalidar
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+class AssetManifest:
+    """
+    Resolve os nomes lógicos dos bundles e serve os arquivos gerados.
+    """
+
+    def __init__(self, static_folder):
+        self.dist_folder = os.path.join(static_folder, DIST_DIR)
+        self.bundles = {}
+        # Arquivo gerado -> codificações pré-comprimidas disponíveis
+        self.files = {}
+        self.load()
+
+    def load(self):
+        """Lê o manifest gerado pelo build; sem ele, os arquivos originais são usados"""
+        try:
+            with open(os.path.join(self.dist_folder, MANIFEST_NAME), encoding='utf-8') as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            manifest = {}
+
+        self.bundles = {name: entry['file'] for name, entry in manifest.items()}
+        self.files = {entry['file']: tuple(entry.get('encodings', ())) for entry in manifest.values()}
+
+    def init_app(self, app):
+        """Registra a rota dos bundles e a função asset_urls nos templates"""
+        app.add_url_rule(f'/{ASSETS_URL_PATH}/<path:filename>', 'hashed_asset', self.send)
+        app.context_processor(lambda: {'asset_urls': self.urls})
+
+    def urls(self, bundle):
+        """
+        Retorna as URLs que carregam um bundle.
+
+        Args:
+            bundle (str): Nome lógico do bundle, por exemplo 'css/site.css'
+
+        Returns:
+            list: URL do arquivo com hash ou, sem build, dos arquivos originais
+        """
+        hashed = self.bundles.get(bundle)
+        if hashed is not None:
+            return [url_for('hashed_asset', filename=hashed)]
+        return [url_for('static', filename=name) for name in BUNDLES[bundle]]
+
+    def send(self, filename):
+        """
+        Serve um bundle gerado, na versão pré-comprimida aceita pelo navegador.
+
+        Apenas arquivos listados no manifest são servidos.
+        """
+        encodings = self.files.get(filename)
+        if encodings is None:
+            abort(404)
+
+        encoding = choose_encoding(request.accept_encodings, encodings)
+        response = send_from_directory(
+            self.dist_folder,
+            filename + ENCODING_SUFFIXES.get(encoding, ''),
+            mimetype=mimetypes.guess_type(filename)[0],
+            max_age=IMMUTABLE_MAX_AGE
+        )
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        response.vary.add('Accept-Encoding')
+        return response
@@ -0,0 +1,180 @@
+"""
+Geração de READMEs em lote a partir de projetos salvos em JSON.
+
+Uso:
+    python -m utils.batch_generator projetos/ -o saida/
+    python -m utils.batch_generator projetos.jsonl -o saida/ --workers 8
+    cat projetos.jsonl | python -m utils.batch_generator - -o saida/
+
+A entrada pode ser um diretório com um arquivo .json por projeto, um
+arquivo JSONL (um projeto por linha) ou "-" para ler JSONL da entrada
+padrão. Cada projeto segue o formato de Project.to_dict.
+
+Os projetos são lidos sob demanda e distribuídos entre um pool de
+processos com um número limitado de tarefas em andamento; cada processo
+grava o README assim que termina, então o consumo de memória não depende
+do tamanho do lote.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from werkzeug.utils import secure_filename
+
+from utils.markdown_generator import generate_markdown
+
+def iter_batch_items(source):
+    """
+    Percorre os projetos de uma entrada sem carregá-los todos na memória.
+
+    Args:
+        source (str): Diretório, arquivo JSONL ou "-" para a entrada padrão
+
+    Yields:
+        tuple: (nome do arquivo de saída, tipo da origem, origem), em que o tipo
+            é 'path' para arquivos .json e 'text' para linhas JSONL
+    """
+    if source != '-' and os.path.isdir(source):
+        for name in sorted(os.listdir(source)):
+            if name.endswith('.json'):
+                yield name[:-len('.json')] + '.md', 'path', os.path.join(source, name)
+        return
+
+    stream = sys.stdin if source == '-' else open(source, encoding='utf-8')
+    try:
+        for line_number, line in enumerate(stream, 1):
+            if line.strip():
+                yield f'{line_number:06d}.md', 'text', line
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def _load_project(kind, origin):
+    """Carrega o dicionário do projeto a partir de um arquivo ou de uma linha JSONL"""
+    if kind == 'path':
+        with open(origin, encoding='utf-8') as project_file:
+            return json.load(project_file)
+    return json.loads(origin)
+
+def render_batch_item(kind, origin, output_dir, output_name):
+    """
+    Gera e grava o README de um projeto (executado nos processos do pool).
+
+    Args:
+        kind (str): 'path' ou 'text'
+        origin (str): Caminho do arquivo .json ou linha JSONL
+        output_dir (str): Diretório de saída
+        output_name (str): Nome sugerido para o arquivo de saída
+
+    Returns:
+        tuple: (caminho gravado, tamanho em bytes, segundos gastos)
+    """
+    started = time.perf_counter()
+    project = _load_project(kind, origin)
+
+    if kind == 'text' and project.get('name'):
+        # Em JSONL o nome do projeto identifica melhor o arquivo que o número da linha
+        output_name = output_name[:-len('.md')] + '_' + (secure_filename(project['name']) or 'projeto') + '.md'
+
+    content = generate_markdown(project).encode('utf-8')
+    path = os.path.join(output_dir, output_name)
+    temp_path = f'{path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as output_file:
+        output_file.write(content)
+    os.replace(temp_path, path)
+
+    return path, len(content), time.perf_counter() - started
+
+def run_batch(source, output_dir, workers=None, max_in_flight=None, log=None, verbose=True):
+    """
+    Gera os READMEs de todos os projetos de uma entrada.
+
+    Args:
+        source (str): Diretório, arquivo JSONL ou "-" para a entrada padrão
+        output_dir (str): Diretório onde os READMEs serão gravados
+        workers (int): Número de processos (padrão: número de CPUs)
+        max_in_flight (int): Máximo de projetos em andamento (padrão: 2 por processo)
+        log: Arquivo onde falhas e progresso são registrados (None para não registrar)
+        verbose (bool): Registra também o tempo de cada projeto gerado
+
+    Returns:
+        dict: Totais do lote (gerados, falhas, bytes, tempo e vazão)
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+
+    stats = {'generated': 0, 'failed': 0, 'bytes': 0, 'item_seconds': 0.0, 'slowest': 0.0}
+    started = time.perf_counter()
+
+    def collect(done, pending):
+        for future in done:
+            name = pending.pop(future)
+            try:
+                path, size, seconds = future.result()
+            except Exception as e:
+                stats['failed'] += 1
+                if log:
+                    print(f'ERRO  {name}: {e}', file=log)
+                continue
+            stats['generated'] += 1
+            stats['bytes'] += size
+            stats['item_seconds'] += seconds
+            stats['slowest'] = max(stats['slowest'], seconds)
+            if log and verbose:
+                print(f'ok    {path} ({size} bytes, {seconds * 1000:.1f} ms)', file=log)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        for output_name, kind, origin in iter_batch_items(source):
+            if len(pending) >= max_in_flight:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done, pending)
+            future = executor.submit(render_batch_item, kind, origin, output_dir, output_name)
+            pending[future] = output_name
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done, pending)
+
+    elapsed = time.perf_counter() - started
+    stats['elapsed'] = elapsed
+    stats['per_second'] = stats['generated'] / elapsed if elapsed > 0 else 0.0
+    stats['mean_ms'] = stats['item_seconds'] * 1000 / stats['generated'] if stats['generated'] else 0.0
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m utils.batch_generator',
+        description='Gera READMEs em lote a partir de projetos em JSON.'
+    )
+    parser.add_argument('source', help='Diretório com arquivos .json, arquivo JSONL ou "-" para a entrada padrão')
+    parser.add_argument('-o', '--output', required=True, help='Diretório de saída dos READMEs')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='Número de processos (padrão: número de CPUs)')
+    parser.add_argument('--max-in-flight', type=int, default=None,
+                        help='Máximo de projetos em andamento ao mesmo tempo (padrão: 2 por processo)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='Não exibe o tempo de cada projeto')
+    args = parser.parse_args(argv)
+
+    stats = run_batch(
+        args.source,
+        args.output,
+        workers=args.workers,
+        max_in_flight=args.max_in_flight,
+        log=sys.stderr,
+        verbose=not args.quiet
+    )
+
+    print(
+        f"{stats['generated']} READMEs gerados, {stats['failed']} falhas em {stats['elapsed']:.2f} s "
+        f"({stats['per_second']:.1f} projetos/s, média de {stats['mean_ms']:.1f} ms por projeto, "
+        f"mais lento {stats['slowest'] * 1000:.1f} ms)",
+        file=sys.stderr
+    )
+    return 1 if stats['failed'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
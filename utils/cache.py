@@ -0,0 +1,169 @@
+"""
+Utilitários de cache usados pelo gerador de documentação.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+def content_hash(data):
+    """
+    Calcula um hash determinístico do conteúdo de uma estrutura serializável.
+
+    Args:
+        data: Estrutura composta por dicts, listas, strings e números
+
+    Returns:
+        str: Hash hexadecimal (SHA-1) do conteúdo
+    """
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def files_hash(root, names):
+    """
+    Calcula um hash do conteúdo de arquivos e diretórios (percorridos recursivamente).
+
+    Caminhos inexistentes são ignorados. Os caminhos relativos a root entram
+    no hash junto com o conteúdo, de modo que renomear ou remover um arquivo
+    também o altera, mas o resultado não depende de onde a aplicação está
+    instalada.
+
+    Args:
+        root (str): Diretório base
+        names (list): Arquivos e diretórios, relativos a root
+
+    Returns:
+        str: Hash hexadecimal (SHA-1) do conteúdo
+    """
+    digest = hashlib.sha1()
+    for name in names:
+        path = os.path.join(root, name)
+        if os.path.isdir(path):
+            files = sorted(os.path.join(directory, name)
+                           for directory, subdirectories, names in os.walk(path)
+                           if '__pycache__' not in directory
+                           for name in names)
+        else:
+            files = [path] if os.path.isfile(path) else []
+        for file_path in files:
+            digest.update(os.path.relpath(file_path, root).replace(os.sep, '/').encode('utf-8'))
+            with open(file_path, 'rb') as source_file:
+                digest.update(hashlib.sha1(source_file.read()).digest())
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """
+    Cache LRU limitado e seguro para uso entre threads.
+    """
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Retorna o valor associado à chave, marcando-o como usado recentemente.
+        """
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key, value):
+        """
+        Armazena um valor, removendo as entradas menos usadas se necessário.
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove todas as entradas do cache.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class DiskLRUCache:
+    """
+    Cache em disco limitado por tamanho e compartilhado entre processos.
+
+    Cada entrada é um arquivo JSON cujo mtime marca o último uso; ao passar
+    do limite, as entradas usadas há mais tempo são removidas.
+    """
+
+    def __init__(self, directory, max_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        if not key.isalnum():
+            raise ValueError('Chave de cache inválida')
+        return os.path.join(self.directory, key + '.json')
+
+    def get(self, key, default=None):
+        """
+        Retorna o valor associado à chave, marcando-o como usado recentemente.
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as cache_file:
+                value = json.load(cache_file)
+            os.utime(path)
+        except (OSError, ValueError):
+            return default
+        return value
+
+    def set(self, key, value):
+        """
+        Armazena um valor de forma atômica e aplica o limite de tamanho.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(value, cache_file, ensure_ascii=False)
+        os.replace(temp_path, path)
+        self._evict()
+
+    def _evict(self):
+        """Remove as entradas menos usadas até o cache caber no limite"""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
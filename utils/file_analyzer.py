@@ -3,150 +3,581 @@ Analisador de estrutura de projeto a partir de arquivos enviados.
 """
 
 import os
+import time
+import shutil
+import struct
+import hashlib
 import tempfile
 import zipfile
 import tarfile
-import shutil
 from werkzeug.utils import secure_filename
 
-def analyze_structure(uploaded_file):
+# Padrões ignorados por padrão na geração da árvore
+DEFAULT_IGNORE_PATTERNS = [
+    '__pycache__',
+    '.git',
+    '.idea', 
+    '.vscode', 
+    'node_modules',
+    '.DS_Store',
+    '*.pyc',
+    '*.pyo',
+    '*.pyd',
+    '.pytest_cache',
+    '.coverage',
+    'venv',
+    'env',
+    '.env'
+]
+
+# Limites padrão da árvore gerada: itens exibidos, profundidade e tempo (segundos)
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MAX_DEPTH = 12
+DEFAULT_TIME_BUDGET = 5.0
+
+# Máximo de membros lidos do índice do arquivo; o restante não chega a ser lido
+DEFAULT_MAX_MEMBERS = 50000
+
+# Extensões de arquivo compactado suportadas, na ordem de verificação
+ARCHIVE_EXTENSIONS = ('.tar.gz', '.tgz', '.zip')
+
+class ArchiveAnalysisError(Exception):
+    """Indica que o arquivo enviado não pôde ser analisado (formato não suportado ou corrompido)"""
+
+class HashingSpooledFile(tempfile.SpooledTemporaryFile):
+    """
+    Arquivo temporário que mantém o upload em memória até o limite informado,
+    passando para um único arquivo em disco acima dele, e calcula o SHA-256
+    do conteúdo à medida que ele é escrito.
+    
+    O arquivo em disco tem nome (em spool_dir), para que persist() possa
+    entregá-lo a outro processo apenas renomeando-o, sem copiar o conteúdo.
+    """
+    
+    def __init__(self, max_size, spool_dir=None):
+        super().__init__(max_size=max_size, mode='rb+')
+        self.sha256 = hashlib.sha256()
+        self.spool_dir = spool_dir
+        self._persisted = False
+    
+    def write(self, data):
+        self.sha256.update(data)
+        return super().write(data)
+    
+    def rollover(self):
+        """Passa o conteúdo da memória para um arquivo nomeado em spool_dir"""
+        if self._rolled:
+            return
+        if self.spool_dir:
+            os.makedirs(self.spool_dir, exist_ok=True)
+        memory_file = self._file
+        self._file = tempfile.NamedTemporaryFile(dir=self.spool_dir, prefix='upload-', suffix='.tmp',
+                                                 delete=False)
+        position = memory_file.tell()
+        self._file.write(memory_file.getbuffer())
+        self._file.seek(position)
+        self._rolled = True
+    
+    def persist(self, path):
+        """
+        Grava o conteúdo em path e fecha o arquivo temporário.
+        
+        Se o upload já estiver em disco, o arquivo é apenas movido; caso
+        contrário (até max_size bytes), o conteúdo em memória é gravado uma vez.
+        """
+        if self._rolled:
+            self._file.close()
+            shutil.move(self._file.name, path)
+            self._persisted = True
+        else:
+            with open(path, 'wb') as output_file:
+                output_file.write(self._file.getbuffer())
+        self.close()
+    
+    def close(self):
+        super().close()
+        # O arquivo nomeado não é removido automaticamente
+        if self._rolled and not self._persisted:
+            try:
+                os.remove(self._file.name)
+            except OSError:
+                pass
+            self._persisted = True
+
+def upload_digest(uploaded_file):
+    """
+    Retorna o SHA-256 do conteúdo enviado, reaproveitando o hash calculado
+    durante o recebimento quando o upload usa HashingSpooledFile.
+    
+    Args:
+        uploaded_file: Objeto de arquivo enviado pelo formulário.
+    
+    Returns:
+        str: Hash hexadecimal do conteúdo
+    """
+    stream = getattr(uploaded_file, 'stream', uploaded_file)
+    if isinstance(stream, HashingSpooledFile):
+        return stream.sha256.hexdigest()
+    
+    digest = hashlib.sha256()
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(64 * 1024), b''):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+def analyze_structure(uploaded_file, max_entries=DEFAULT_MAX_ENTRIES,
+                      max_depth=DEFAULT_MAX_DEPTH, time_budget=DEFAULT_TIME_BUDGET,
+                      max_members=DEFAULT_MAX_MEMBERS, stats=None):
     """
     Analisa a estrutura de um arquivo zip ou tar.gz enviado.
     Retorna uma representação em string da estrutura de diretórios.
     
+    A árvore é montada a partir do índice do arquivo (diretório central do zip
+    ou cabeçalhos do tar), sem extrair nenhum arquivo para o disco. A leitura
+    do índice para ao atingir max_members ou time_budget, o que limita a
+    memória e o tempo gastos com arquivos patológicos; a árvore então termina
+    com uma linha indicando que a leitura foi interrompida.
+    
     Args:
         uploaded_file: Objeto de arquivo enviado pelo formulário.
+        max_entries (int): Máximo de linhas exibidas na árvore (None = sem limite)
+        max_depth (int): Profundidade máxima exibida (None = sem limite)
+        time_budget (float): Tempo máximo em segundos para ler o índice e, depois,
+            para gerar a árvore (None = sem limite)
+        max_members (int): Máximo de membros lidos do índice (None = sem limite)
+        stats (dict): Se informado, recebe o formato ('format'), os bytes lidos
+            ('bytes_read'), os membros ('entries') e a duração ('seconds') da análise
     
     Returns:
         str: Estrutura do projeto em formato de árvore.
+    
+    Raises:
+        ArchiveAnalysisError: Se o formato não for suportado ou o arquivo não puder ser lido
     """
     filename = secure_filename(uploaded_file.filename)
-    
-    # Cria diretório temporário para extração
-    temp_dir = tempfile.mkdtemp()
-    temp_file_path = os.path.join(temp_dir, filename)
+    stream = getattr(uploaded_file, 'stream', uploaded_file)
+    started = time.perf_counter()
     
     try:
-        # Salva o arquivo enviado
-        uploaded_file.save(temp_file_path)
-        
-        # Extrai o arquivo baseado no tipo
-        extract_dir = os.path.join(temp_dir, "extracted")
-        os.makedirs(extract_dir, exist_ok=True)
+        stream.seek(0)
+        if stats is not None:
+            stream = _CountingReader(stream)
         
+        # Lê apenas os nomes dos membros, baseado no tipo
         if filename.endswith('.zip'):
-            with zipfile.ZipFile(temp_file_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
+            archive_format = 'zip'
+            members = _iter_zip_members(stream)
         elif filename.endswith('.tar.gz') or filename.endswith('.tgz'):
-            with tarfile.open(temp_file_path, 'r:gz') as tar_ref:
-                tar_ref.extractall(extract_dir)
+            archive_format = 'tar.gz'
+            members = _iter_tar_members(stream)
         else:
-            return "Formato de arquivo não suportado. Use .zip ou .tar.gz"
+            raise ArchiveAnalysisError("Formato de arquivo não suportado. Use .zip ou .tar.gz")
         
-        # Gera a representação em árvore da estrutura
-        tree_structure = generate_tree_structure(extract_dir)
+        if stats is not None:
+            stats.update(format=archive_format, entries=0)
+            members = _count_members(members, stats)
         
-        return tree_structure
+        limits = {}
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
+        tree = build_archive_tree(_limit_members(members, max_members, deadline, limits))
+        
+        # Gera a representação em árvore da estrutura
+        structure = generate_archive_tree_structure(tree, _archive_root_name(filename),
+                                                    max_entries=max_entries,
+                                                    max_depth=max_depth,
+                                                    time_budget=time_budget)
+        if 'stopped' in limits:
+            structure += "\n    └── " + _stopped_line(limits['stopped'], max_members)
+        return structure
+    except ArchiveAnalysisError:
+        raise
     except Exception as e:
-        return f"Erro ao analisar a estrutura: {str(e)}"
+        # Repassa apenas a mensagem: a exceção original pode não ser serializável entre processos
+        raise ArchiveAnalysisError(f"Arquivo compactado inválido: {str(e)}") from None
     finally:
-        # Limpa os arquivos temporários
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        if stats is not None:
+            stats['seconds'] = time.perf_counter() - started
+            stats['bytes_read'] = getattr(stream, 'bytes_read', 0)
+
+class _CountingReader:
+    """Repassa as operações a um arquivo, contando os bytes lidos"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self.bytes_read = 0
+    
+    def read(self, size=-1):
+        data = self._stream.read(size)
+        self.bytes_read += len(data)
+        return data
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+def _count_members(members, stats):
+    """Repassa os membros do arquivo, contando-os em stats['entries']"""
+    for member in members:
+        stats['entries'] += 1
+        yield member
+
+def _limit_members(members, max_members, deadline, limits):
+    """
+    Repassa os membros do arquivo até o limite de quantidade ou de tempo,
+    registrando em limits['stopped'] o motivo da interrupção ('members' ou 'time').
+    """
+    count = 0
+    for member in members:
+        if max_members is not None and count >= max_members:
+            limits['stopped'] = 'members'
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            limits['stopped'] = 'time'
+            break
+        count += 1
+        yield member
+    # Encerra a leitura do arquivo sem percorrer os membros restantes
+    members.close()
+
+def _stopped_line(reason, max_members):
+    """Monta a linha que indica que a leitura do índice do arquivo foi interrompida"""
+    if reason == 'time':
+        return "… leitura do arquivo interrompida (limite de tempo atingido)"
+    return f"… leitura do arquivo interrompida após {_format_count(max_members)} itens"
+
+def _archive_root_name(filename):
+    """Retorna o nome do arquivo compactado sem a extensão"""
+    for extension in ARCHIVE_EXTENSIONS:
+        if filename.endswith(extension):
+            return filename[:-len(extension)] or filename
+    return filename
+
+def _iter_zip_members(stream):
+    """
+    Percorre o diretório central do zip retornando (nome, é_diretório).
+    
+    As entradas são lidas uma a uma, como em zipfile.ZipFile, mas sem montar
+    a lista completa de ZipInfo antes de retornar a primeira: assim a leitura
+    pode parar em qualquer ponto sem ter custado memória proporcional ao
+    total de entradas do arquivo.
+    """
+    try:
+        endrec = zipfile._EndRecData(stream)
+    except OSError:
+        endrec = None
+    if not endrec:
+        raise zipfile.BadZipFile("File is not a zip file")
+    
+    size_cd = endrec[zipfile._ECD_SIZE]
+    # Diferente de zero quando o zip foi concatenado a outro arquivo
+    concat = endrec[zipfile._ECD_LOCATION] - size_cd - endrec[zipfile._ECD_OFFSET]
+    if endrec[zipfile._ECD_SIGNATURE] == zipfile.stringEndArchive64:
+        concat -= zipfile.sizeEndCentDir64 + zipfile.sizeEndCentDir64Locator
+    start = endrec[zipfile._ECD_OFFSET] + concat
+    if start < 0:
+        raise zipfile.BadZipFile("Bad offset for central directory")
+    
+    stream.seek(start)
+    total = 0
+    while total < size_cd:
+        header = stream.read(zipfile.sizeCentralDir)
+        if len(header) != zipfile.sizeCentralDir:
+            raise zipfile.BadZipFile("Truncated central directory")
+        fields = struct.unpack(zipfile.structCentralDir, header)
+        if fields[zipfile._CD_SIGNATURE] != zipfile.stringCentralDir:
+            raise zipfile.BadZipFile("Bad magic number for central directory")
+        
+        name = stream.read(fields[zipfile._CD_FILENAME_LENGTH])
+        # Nomes em UTF-8 têm o bit 11 marcado; os demais usam a codificação histórica
+        name = name.decode('utf-8' if fields[zipfile._CD_FLAG_BITS] & 0x800 else 'cp437')
+        skip = fields[zipfile._CD_EXTRA_FIELD_LENGTH] + fields[zipfile._CD_COMMENT_LENGTH]
+        stream.seek(skip, os.SEEK_CUR)
+        total += zipfile.sizeCentralDir + fields[zipfile._CD_FILENAME_LENGTH] + skip
+        yield name, name.endswith('/')
+
+def _iter_tar_members(stream):
+    """Lê os cabeçalhos do tar.gz em modo stream retornando (nome, é_diretório)"""
+    with tarfile.open(fileobj=stream, mode='r|gz') as tar_ref:
+        for member in tar_ref:
+            yield member.name, member.isdir()
+
+def build_archive_tree(members):
+    """
+    Monta uma árvore em memória a partir dos nomes dos membros de um arquivo compactado.
+    
+    Args:
+        members (iterable): Pares (caminho, é_diretório)
+    
+    Returns:
+        dict: Árvore onde diretórios são dicts e arquivos são None
+    """
+    root = {}
+    for name, is_dir in members:
+        parts = [part for part in name.replace('\\', '/').split('/') if part not in ('', '.')]
+        # Ignora caminhos que tentam sair da raiz do arquivo
+        if not parts or '..' in parts:
+            continue
+        
+        node = root
+        for part in parts[:-1]:
+            child = node.get(part)
+            if child is None:
+                child = node[part] = {}
+            node = child
+        
+        leaf = parts[-1]
+        if is_dir:
+            if node.get(leaf) is None:
+                node[leaf] = {}
+        elif leaf not in node:
+            node[leaf] = None
+    return root
+
+class IgnoreMatcher:
+    """
+    Verificador de padrões ignorados compilado uma única vez: nomes exatos
+    ficam em um conjunto e padrões "*sufixo" em uma única tupla de sufixos.
+    """
+    
+    def __init__(self, patterns):
+        self.names = frozenset(pattern for pattern in patterns if not pattern.startswith('*'))
+        self.suffixes = tuple(pattern[1:] for pattern in patterns if pattern.startswith('*'))
+    
+    def __call__(self, name):
+        return name in self.names or (bool(self.suffixes) and name.endswith(self.suffixes))
+
+_DEFAULT_IGNORE_MATCHER = IgnoreMatcher(DEFAULT_IGNORE_PATTERNS)
+
+def _get_ignore_matcher(ignore_patterns):
+    """Retorna o verificador compilado para a lista de padrões informada"""
+    if ignore_patterns is None:
+        return _DEFAULT_IGNORE_MATCHER
+    if isinstance(ignore_patterns, IgnoreMatcher):
+        return ignore_patterns
+    return IgnoreMatcher(ignore_patterns)
+
+def generate_archive_tree_structure(node, name, prefix="", is_last=True, ignore_patterns=None,
+                                    max_entries=None, max_depth=None, time_budget=None):
+    """
+    Gera a representação em árvore de uma estrutura montada por build_archive_tree,
+    no mesmo formato de generate_tree_structure.
+    
+    Args:
+        node (dict): Nó de diretório da árvore
+        name (str): Nome exibido para o nó
+        prefix (str): Prefixo para a linha da raiz
+        is_last (bool): Se a raiz é o último item no seu nível
+        ignore_patterns (list): Lista de padrões a serem ignorados
+        max_entries (int): Máximo de linhas exibidas (None = sem limite)
+        max_depth (int): Profundidade máxima exibida (None = sem limite)
+        time_budget (float): Tempo máximo em segundos (None = sem limite)
+    
+    Returns:
+        str: Representação em árvore da estrutura
+    """
+    return _render_tree(node, name, _list_archive_node, _count_archive_node, prefix, is_last,
+                        _get_ignore_matcher(ignore_patterns), max_entries, max_depth, time_budget)
 
-def generate_tree_structure(directory, prefix="", is_last=True, ignore_patterns=None):
+def generate_tree_structure(directory, prefix="", is_last=True, ignore_patterns=None,
+                            max_entries=None, max_depth=None, time_budget=None):
     """
     Gera uma representação em árvore da estrutura de diretórios.
     
     Args:
         directory (str): Caminho do diretório a ser analisado
-        prefix (str): Prefixo para a linha atual (usado na recursão)
-        is_last (bool): Se é o último item no nível atual
+        prefix (str): Prefixo para a linha da raiz
+        is_last (bool): Se a raiz é o último item no seu nível
         ignore_patterns (list): Lista de padrões a serem ignorados
+        max_entries (int): Máximo de linhas exibidas (None = sem limite)
+        max_depth (int): Profundidade máxima exibida (None = sem limite)
+        time_budget (float): Tempo máximo em segundos (None = sem limite)
     
     Returns:
         str: Representação em árvore da estrutura
     """
-    if ignore_patterns is None:
-        ignore_patterns = [
-            '__pycache__', 
-            '.git', 
-            '.idea', 
-            '.vscode', 
-            'node_modules',
-            '.DS_Store',
-            '*.pyc',
-            '*.pyo',
-            '*.pyd',
-            '.pytest_cache',
-            '.coverage',
-            'venv',
-            'env',
-            '.env'
-        ]
-    
-    base_name = os.path.basename(directory)
+    return _render_tree(directory, os.path.basename(directory), _list_directory, _count_directory,
+                        prefix, is_last, _get_ignore_matcher(ignore_patterns),
+                        max_entries, max_depth, time_budget)
+
+def _list_archive_node(node):
+    """Lista os filhos de um nó da árvore em memória como pares (nome, nó ou None)"""
+    return sorted(node.items(), key=_entry_name)
+
+def _count_archive_node(node, is_ignored, deadline):
+    """
+    Conta arquivos e diretórios (não ignorados) abaixo de um nó da árvore em memória.
+    Retorna None se o prazo terminar antes da contagem.
+    """
+    files = dirs = 0
+    pending = [node]
+    while pending:
+        if deadline is not None and time.monotonic() > deadline:
+            return None
+        for name, child in pending.pop().items():
+            if is_ignored(name):
+                continue
+            if child is None:
+                files += 1
+            else:
+                dirs += 1
+                pending.append(child)
+    return files, dirs
+
+def _list_directory(path):
+    """
+    Lista os itens de um diretório como pares (nome, caminho ou None),
+    usando o tipo já obtido pelo os.scandir para evitar um stat por item.
+    """
+    try:
+        with os.scandir(path) as entries:
+            items = [(entry.name, entry.path if entry.is_dir() else None) for entry in entries]
+    except OSError:
+        return None
+    items.sort(key=_entry_name)
+    return items
+
+def _count_directory(path, is_ignored, deadline):
+    """
+    Conta arquivos e diretórios (não ignorados) abaixo de um diretório.
+    Retorna None se o prazo terminar antes da contagem.
+    """
+    files = dirs = 0
+    pending = [path]
+    while pending:
+        if deadline is not None and time.monotonic() > deadline:
+            return None
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if is_ignored(entry.name):
+                        continue
+                    if entry.is_dir():
+                        dirs += 1
+                        pending.append(entry.path)
+                    else:
+                        files += 1
+        except OSError:
+            continue
+    return files, dirs
+
+def _entry_name(item):
+    return item[0]
+
+def _format_count(value):
+    """Formata um número com separador de milhar"""
+    return f"{value:,}".replace(',', '.')
+
+def _summary_line(counts):
+    """Monta a linha que resume uma parte da árvore que não foi exibida"""
+    if counts is None:
+        return "… conteúdo omitido (limite de tempo atingido)"
+    files, dirs = counts
+    return f"… {_format_count(files)} arquivos em {_format_count(dirs)} diretórios"
+
+def _render_tree(root, root_name, list_children, count_subtree, prefix, is_last, is_ignored,
+                 max_entries=None, max_depth=None, time_budget=None):
+    """
+    Percorre a árvore de forma iterativa (pilha explícita, em pré-ordem)
+    gerando as linhas no formato de árvore.
     
+    Quando algum limite é atingido, a parte restante da árvore é resumida
+    em uma única linha com a contagem de arquivos e diretórios omitidos.
+    
+    Args:
+        root: Identificador do diretório raiz repassado a list_children
+        root_name (str): Nome exibido para a raiz
+        list_children (callable): Retorna os filhos ordenados de um diretório
+            como pares (nome, identificador ou None para arquivos), ou None
+            se o diretório não puder ser listado
+        count_subtree (callable): Retorna (arquivos, diretórios) abaixo de um
+            diretório, ou None se o prazo terminar antes da contagem
+        prefix (str): Prefixo para a linha da raiz
+        is_last (bool): Se a raiz é o último item no seu nível
+        is_ignored (callable): Verificador de padrões ignorados
+        max_entries (int): Máximo de linhas exibidas
+        max_depth (int): Profundidade máxima exibida (a raiz tem profundidade 0)
+        time_budget (float): Tempo máximo em segundos
+    
+    Returns:
+        str: Representação em árvore da estrutura
+    """
     # Verificar se o diretório deve ser ignorado
-    for pattern in ignore_patterns:
-        if pattern.startswith('*'):
-            if base_name.endswith(pattern[1:]):
-                return ""
-        elif pattern == base_name:
-            return ""
-    
-    # Símbolo para o item atual
-    if is_last:
-        tree_head = "└── "
-        next_prefix = prefix + "    "
-    else:
-        tree_head = "├── "
-        next_prefix = prefix + "│   "
-    
-    tree_structure = [prefix + tree_head + base_name]
-    
-    # Listar e ordenar itens no diretório
-    try:
-        items = sorted(os.listdir(directory))
-    except:
-        # Se não conseguir listar o diretório, retorna apenas o nome
-        return "\n".join(tree_structure)
-    
-    # Filtrar itens a serem ignorados
-    filtered_items = []
-    for item in items:
-        ignore = False
-        for pattern in ignore_patterns:
-            if pattern.startswith('*'):
-                if item.endswith(pattern[1:]):
-                    ignore = True
-                    break
-            elif pattern == item:
-                ignore = True
-                break
-        if not ignore:
-            filtered_items.append(item)
-    
-    # Processar arquivos e diretórios
-    for i, item in enumerate(filtered_items):
-        item_path = os.path.join(directory, item)
-        is_last_item = (i == len(filtered_items) - 1)
+    if is_ignored(root_name):
+        return ""
+    
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+    
+    lines = []
+    # Cada item da pilha é (identificador, nome, prefixo, é_último, profundidade);
+    # arquivos entram com identificador None e o prefixo já com o ramo
+    stack = [(root, root_name, prefix, is_last, 0)]
+    
+    while stack:
+        out_of_entries = max_entries is not None and len(lines) >= max_entries
+        out_of_time = deadline is not None and time.monotonic() > deadline
+        if out_of_entries or out_of_time:
+            lines.append(_summarize_pending(stack, count_subtree, is_ignored, deadline, out_of_time))
+            break
+        
+        handle, name, prefix, is_last, depth = stack.pop()
+        if handle is None:
+            lines.append(prefix + name)
+            continue
         
-        if os.path.isdir(item_path):
-            # Recursivamente processar subdiretórios
-            subtree = generate_tree_structure(
-                item_path, 
-                next_prefix, 
-                is_last_item, 
-                ignore_patterns
-            )
-            if subtree:
-                tree_structure.append(subtree)
+        # Símbolo para o item atual
+        if is_last:
+            lines.append(prefix + "└── " + name)
+            next_prefix = prefix + "    "
         else:
-            # Adicionar arquivo
-            if is_last_item:
-                file_prefix = prefix + "    └── "
+            lines.append(prefix + "├── " + name)
+            next_prefix = prefix + "│   "
+        
+        # Diretórios além da profundidade máxima são resumidos em uma linha
+        if max_depth is not None and depth >= max_depth:
+            counts = count_subtree(handle, is_ignored, deadline)
+            if counts != (0, 0):
+                lines.append(next_prefix + "└── " + _summary_line(counts))
+            continue
+        
+        children = list_children(handle)
+        if not children:
+            continue
+        
+        filtered_items = [item for item in children if not is_ignored(item[0])]
+        last_index = len(filtered_items) - 1
+        
+        # Empilha em ordem reversa para que o primeiro item seja processado primeiro
+        for i in range(last_index, -1, -1):
+            item, child = filtered_items[i]
+            is_last_item = (i == last_index)
+            if child is None:
+                file_prefix = prefix + ("    └── " if is_last_item else "    ├── ")
+                stack.append((None, item, file_prefix, None, None))
             else:
-                file_prefix = prefix + "    ├── "
-            tree_structure.append(file_prefix + item)
+                stack.append((child, item, next_prefix, is_last_item, depth + 1))
+    
+    return "\n".join(lines)
+
+def _summarize_pending(stack, count_subtree, is_ignored, deadline, timed_out):
+    """
+    Resume os itens ainda não exibidos da pilha em uma única linha,
+    alinhada ao próximo item que seria exibido.
+    """
+    handle, name, prefix, is_last, depth = stack[-1]
+    line_prefix = (prefix[:-4] if handle is None else prefix) + "└── "
+    
+    if timed_out:
+        return line_prefix + _summary_line(None)
+    
+    files = dirs = 0
+    for handle, *_ in stack:
+        if handle is None:
+            files += 1
+            continue
+        counts = count_subtree(handle, is_ignored, deadline)
+        if counts is None:
+            return line_prefix + _summary_line(None)
+        files += counts[0]
+        dirs += counts[1] + 1
     
-    return "\n".join(tree_structure)
\ No newline at end of file
+    return line_prefix + _summary_line((files, dirs))
@@ -0,0 +1,55 @@
+"""
+Limpeza periódica em segundo plano (sessões expiradas, jobs antigos).
+"""
+
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+class Janitor:
+    """
+    Executa tarefas de limpeza em intervalos fixos numa thread de fundo,
+    fora do caminho das requisições.
+    """
+
+    def __init__(self, interval, tasks):
+        self.interval = interval
+        self.tasks = list(tasks)
+        self._pid = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def ensure_started(self):
+        """
+        Inicia a thread no processo atual, se ainda não estiver rodando.
+        Threads não sobrevivem ao fork dos workers, por isso o PID é verificado.
+        """
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._stop = threading.Event()
+            thread = threading.Thread(target=self._run, name='docgen-janitor', daemon=True)
+            thread.start()
+            self._pid = os.getpid()
+
+    def stop(self):
+        """Interrompe a thread de limpeza do processo atual"""
+        self._stop.set()
+        self._pid = None
+
+    def run_once(self):
+        """Executa todas as tarefas uma vez, registrando falhas sem interromper as demais"""
+        for task in self.tasks:
+            try:
+                task()
+            except Exception:
+                logger.exception('Falha na tarefa de limpeza %r', task)
+
+    def _run(self):
+        stop = self._stop
+        while not stop.wait(self.interval):
+            self.run_once()
@@ -2,6 +2,81 @@
 Gerador de documentação Markdown para README.md baseado nos dados do projeto.
 """
 
+import time
+
+from utils.cache import LRUCache, content_hash
+from utils.metrics import SECTION_RENDER_DURATION
+from utils.tech_badges import get_badge_url
+
+# Quantidade máxima de fragmentos de seção mantidos em cache
+FRAGMENT_CACHE_SIZE = 1024
+
+# Seções consultadas por _generate_specific_sections para cada tipo de projeto
+SPECIFIC_SECTIONS = {
+    'backend': ('database',),
+    'frontend': ('ui_components', 'state_management'),
+    'mobile': ('platforms',),
+}
+
+_fragment_cache = LRUCache(FRAGMENT_CACHE_SIZE)
+
+def _render_fragment(generator, *args):
+    """
+    Renderiza uma seção reaproveitando o resultado em cache quando os dados
+    de entrada não mudaram desde a última renderização.
+    
+    Args:
+        generator (callable): Função _generate_* responsável pela seção
+        *args: Dados da seção repassados ao gerador
+        
+    Returns:
+        O fragmento gerado (string ou tupla de strings)
+    """
+    key = (generator.__name__, content_hash(args))
+    fragment = _fragment_cache.get(key)
+    if fragment is None:
+        started = time.perf_counter()
+        fragment = generator(*args)
+        SECTION_RENDER_DURATION.observe(time.perf_counter() - started, generator.__name__[len('_generate_'):])
+        if isinstance(fragment, list):
+            fragment = tuple(fragment)
+        _fragment_cache.set(key, fragment)
+    return fragment
+
+def clear_fragment_cache():
+    """Descarta todos os fragmentos de seção em cache"""
+    _fragment_cache.clear()
+
+# Seções cujo fragmento no documento tem outro ID; as demais usam o próprio ID da seção
+FRAGMENT_IDS = {
+    'project_info': 'header',
+}
+
+def fragments_for_sections(fragments, project_type, section_ids):
+    """
+    Seleciona os fragmentos que dependem das seções informadas.
+    
+    O índice é sempre incluído, pois depende de quais seções estão preenchidas.
+    
+    Args:
+        fragments (list): Pares (id_do_fragmento, markdown) do documento atual
+        project_type (str): Tipo do projeto
+        section_ids (iterable): IDs das seções alteradas
+        
+    Returns:
+        list: Pares (id_do_fragmento, markdown) afetados, na ordem do documento
+    """
+    specific = SPECIFIC_SECTIONS.get(project_type, ())
+    fragment_ids = {'toc'}
+    include_specific = False
+    for section_id in section_ids:
+        if section_id in specific:
+            include_specific = True
+        else:
+            fragment_ids.add(FRAGMENT_IDS.get(section_id, section_id))
+    return [(fragment_id, content) for fragment_id, content in fragments
+            if fragment_id in fragment_ids or (include_specific and fragment_id.startswith('specific-'))]
+
 def generate_markdown(project):
     """
     Gera o markdown completo para o README.md com base nos dados do projeto.
@@ -12,97 +87,114 @@ def generate_markdown(project):
     Returns:
         str: Conteúdo markdown completo
     """
+    # Junta todas as seções em um único documento markdown
+    return "\n\n".join(content for _, content in generate_markdown_fragments(project))
+
+def generate_markdown_fragments(project):
+    """
+    Gera os fragmentos markdown de cada seção, na ordem do documento final.
+    
+    Args:
+        project (dict): Dicionário com os dados do projeto
+        
+    Returns:
+        list: Pares (id_do_fragmento, markdown) das seções não vazias
+    """
     sections = project.get('sections', {})
-    project_name = sections.get('project_info', {}).get('name', 'Projeto')
     
     # Lista de seções na ordem desejada
-    markdown_content = []
+    fragments = []
     
     # 1. Cabeçalho com Logo e Badges
-    header = _generate_header(sections.get('project_info', {}))
-    markdown_content.append(header)
+    header = _render_fragment(_generate_header, sections.get('project_info', {}))
+    fragments.append(('header', header))
     
     # 2. Sobre o Projeto
-    about = _generate_about_section(sections.get('about', {}))
+    about = _render_fragment(_generate_about_section, sections.get('about', {}))
     if about:
-        markdown_content.append(about)
+        fragments.append(('about', about))
     
     # 3. Índice - gerado automaticamente
-    toc = _generate_table_of_contents(project)
+    with SECTION_RENDER_DURATION.time('table_of_contents'):
+        toc = _generate_table_of_contents(project)
     if toc:
-        markdown_content.append(toc)
+        fragments.append(('toc', toc))
     
     # 4. Tecnologias
-    technologies = _generate_technologies_section(sections.get('technology', {}))
+    technologies = _render_fragment(_generate_technologies_section, sections.get('technology', {}))
     if technologies:
-        markdown_content.append(technologies)
+        fragments.append(('technology', technologies))
     
     # 5. Instalação
-    installation = _generate_installation_section(sections.get('installation', {}))
+    installation = _render_fragment(_generate_installation_section, sections.get('installation', {}))
     if installation:
-        markdown_content.append(installation)
+        fragments.append(('installation', installation))
     
     # 6. Uso
-    usage = _generate_usage_section(sections.get('usage', {}))
+    usage = _render_fragment(_generate_usage_section, sections.get('usage', {}))
     if usage:
-        markdown_content.append(usage)
+        fragments.append(('usage', usage))
     
     # 7. Estrutura do Projeto
-    structure = _generate_structure_section(project.get('structure', None), 
-                                           sections.get('structure', {}))
+    structure = _render_fragment(_generate_structure_section,
+                                 project.get('structure', None),
+                                 sections.get('structure', {}))
     if structure:
-        markdown_content.append(structure)
+        fragments.append(('structure', structure))
     
     # 8. API e Endpoints (se aplicável)
-    api = _generate_api_section(sections.get('api', {}))
+    api = _render_fragment(_generate_api_section, sections.get('api', {}))
     if api:
-        markdown_content.append(api)
+        fragments.append(('api', api))
     
     # Gerar seções específicas por tipo de projeto
-    specific_sections = _generate_specific_sections(project.get('type', ''), sections)
-    if specific_sections:
-        markdown_content.extend(specific_sections)
+    project_type = project.get('type', '')
+    specific_data = {section_id: sections[section_id]
+                     for section_id in SPECIFIC_SECTIONS.get(project_type, ())
+                     if section_id in sections}
+    specific_sections = _render_fragment(_generate_specific_sections, project_type, specific_data)
+    for index, specific in enumerate(specific_sections):
+        fragments.append((f'specific-{index}', specific))
     
     # 9. Roadmap
-    roadmap = _generate_roadmap_section(sections.get('roadmap', {}))
+    roadmap = _render_fragment(_generate_roadmap_section, sections.get('roadmap', {}))
     if roadmap:
-        markdown_content.append(roadmap)
+        fragments.append(('roadmap', roadmap))
     
     # 10. Contribuição
-    contributing = _generate_contributing_section(sections.get('contributing', {}))
+    contributing = _render_fragment(_generate_contributing_section, sections.get('contributing', {}))
     if contributing:
-        markdown_content.append(contributing)
+        fragments.append(('contributing', contributing))
     
     # 11. Licença
-    license_section = _generate_license_section(sections.get('license', {}))
+    license_section = _render_fragment(_generate_license_section, sections.get('license', {}))
     if license_section:
-        markdown_content.append(license_section)
+        fragments.append(('license', license_section))
     
     # 12. Contato
-    contact = _generate_contact_section(sections.get('contact', {}))
+    contact = _render_fragment(_generate_contact_section, sections.get('contact', {}))
     if contact:
-        markdown_content.append(contact)
+        fragments.append(('contact', contact))
     
     # 13. FAQ
-    faq = _generate_faq_section(sections.get('faq', {}))
+    faq = _render_fragment(_generate_faq_section, sections.get('faq', {}))
     if faq:
-        markdown_content.append(faq)
+        fragments.append(('faq', faq))
     
     # 14. Agradecimentos
-    acknowledgements = _generate_acknowledgements_section(sections.get('acknowledgements', {}))
+    acknowledgements = _render_fragment(_generate_acknowledgements_section, sections.get('acknowledgements', {}))
     if acknowledgements:
-        markdown_content.append(acknowledgements)
+        fragments.append(('acknowledgements', acknowledgements))
     
     # 15. Equipe
-    team = _generate_team_section(sections.get('team', {}))
+    team = _render_fragment(_generate_team_section, sections.get('team', {}))
     if team:
-        markdown_content.append(team)
+        fragments.append(('team', team))
     
     # Adicionar botão "Voltar ao topo"
-    markdown_content.append("\n\n<p align=\"right\">(<a href=\"#top\">Voltar ao topo ⬆️</a>)</p>")
+    fragments.append(('back_to_top', "\n\n<p align=\"right\">(<a href=\"#top\">Voltar ao topo ⬆️</a>)</p>"))
     
-    # Junta todas as seções em um único documento markdown
-    return "\n\n".join(markdown_content)
+    return fragments
 
 def _generate_header(project_info):
     """Gera o cabeçalho com logo e badges"""
@@ -210,48 +302,10 @@ def _generate_technologies_section(tech_data):
         tech_list = technologies.strip().split(',')
         tech_badges = []
         
-        # Aqui podemos mapear tecnologias para badges/ícones
-        badge_mapping = {
-            "python": "https://img.shields.io/badge/Python-3776AB?style=for-the-badge&logo=python&logoColor=white",
-            "flask": "https://img.shields.io/badge/Flask-000000?style=for-the-badge&logo=flask&logoColor=white",
-            "react": "https://img.shields.io/badge/React-20232A?style=for-the-badge&logo=react&logoColor=61DAFB",
-            "javascript": "https://img.shields.io/badge/JavaScript-F7DF1E?style=for-the-badge&logo=javascript&logoColor=black",
-            "typescript": "https://img.shields.io/badge/TypeScript-007ACC?style=for-the-badge&logo=typescript&logoColor=white",
-            "node.js": "https://img.shields.io/badge/Node.js-43853D?style=for-the-badge&logo=node.js&logoColor=white",
-            "django": "https://img.shields.io/badge/Django-092E20?style=for-the-badge&logo=django&logoColor=white",
-            "mongodb": "https://img.shields.io/badge/MongoDB-4EA94B?style=for-the-badge&logo=mongodb&logoColor=white",
-            "mysql": "https://img.shields.io/badge/MySQL-00000F?style=for-the-badge&logo=mysql&logoColor=white",
-            "postgresql": "https://img.shields.io/badge/PostgreSQL-316192?style=for-the-badge&logo=postgresql&logoColor=white",
-            "docker": "https://img.shields.io/badge/Docker-2496ED?style=for-the-badge&logo=docker&logoColor=white",
-            "kubernetes": "https://img.shields.io/badge/Kubernetes-326DE6?style=for-the-badge&logo=kubernetes&logoColor=white",
-            "aws": "https://img.shields.io/badge/AWS-232F3E?style=for-the-badge&logo=amazon-aws&logoColor=white",
-            "gcp": "https://img.shields.io/badge/Google_Cloud-4285F4?style=for-the-badge&logo=google-cloud&logoColor=white",
-            "azure": "https://img.shields.io/badge/Microsoft_Azure-0089D6?style=for-the-badge&logo=microsoft-azure&logoColor=white",
-            "html": "https://img.shields.io/badge/HTML5-E34F26?style=for-the-badge&logo=html5&logoColor=white",
-            "css": "https://img.shields.io/badge/CSS3-1572B6?style=for-the-badge&logo=css3&logoColor=white",
-            "sass": "https://img.shields.io/badge/Sass-CC6699?style=for-the-badge&logo=sass&logoColor=white",
-            "redux": "https://img.shields.io/badge/Redux-593D88?style=for-the-badge&logo=redux&logoColor=white",
-            "vue": "https://img.shields.io/badge/Vue.js-35495E?style=for-the-badge&logo=vue.js&logoColor=4FC08D",
-            "angular": "https://img.shields.io/badge/Angular-DD0031?style=for-the-badge&logo=angular&logoColor=white",
-            "tailwind": "https://img.shields.io/badge/Tailwind_CSS-38B2AC?style=for-the-badge&logo=tailwind-css&logoColor=white",
-            "bootstrap": "https://img.shields.io/badge/Bootstrap-563D7C?style=for-the-badge&logo=bootstrap&logoColor=white",
-            "graphql": "https://img.shields.io/badge/GraphQL-E10098?style=for-the-badge&logo=graphql&logoColor=white",
-            "rust": "https://img.shields.io/badge/Rust-000000?style=for-the-badge&logo=rust&logoColor=white",
-            "go": "https://img.shields.io/badge/Go-00ADD8?style=for-the-badge&logo=go&logoColor=white",
-            "c++": "https://img.shields.io/badge/C%2B%2B-00599C?style=for-the-badge&logo=c%2B%2B&logoColor=white",
-            "java": "https://img.shields.io/badge/Java-ED8B00?style=for-the-badge&logo=java&logoColor=white",
-            "c#": "https://img.shields.io/badge/C%23-239120?style=for-the-badge&logo=c-sharp&logoColor=white",
-            "php": "https://img.shields.io/badge/PHP-777BB4?style=for-the-badge&logo=php&logoColor=white",
-            "swift": "https://img.shields.io/badge/Swift-FA7343?style=for-the-badge&logo=swift&logoColor=white",
-            "kotlin": "https://img.shields.io/badge/Kotlin-0095D5?style=for-the-badge&logo=kotlin&logoColor=white",
-            "flutter": "https://img.shields.io/badge/Flutter-02569B?style=for-the-badge&logo=flutter&logoColor=white",
-            "react native": "https://img.shields.io/badge/React_Native-20232A?style=for-the-badge&logo=react&logoColor=61DAFB",
-        }
-        
         for tech in tech_list:
-            tech_name = tech.strip().lower()
-            if tech_name in badge_mapping:
-                tech_badges.append(f"<img src=\"{badge_mapping[tech_name]}\" alt=\"{tech.strip()}\">")
+            badge_url = get_badge_url(tech)
+            if badge_url:
+                tech_badges.append(f"<img src=\"{badge_url}\" alt=\"{tech.strip()}\">")
             else:
                 tech_badges.append(f"**{tech.strip()}**")
         
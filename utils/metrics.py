@@ -0,0 +1,332 @@
+"""
+Métricas de desempenho expostas no formato texto do Prometheus.
+
+Cada medição só incrementa contadores em memória (uma busca binária no
+vetor de limites e três somas sob um lock); o texto do Prometheus é montado
+apenas quando /metrics é consultado.
+
+Com vários workers (gunicorn), cada processo mede apenas as próprias
+requisições. Com um diretório configurado (METRICS_DIR), cada processo grava
+periodicamente as suas séries em metrics-<pid>-<id>.json, e /metrics soma os
+arquivos de todos os processos, como no modo multiprocess do
+prometheus_client. Arquivos de workers encerrados continuam sendo somados,
+para que os contadores nunca diminuam; o diretório deve ser esvaziado ao
+reiniciar o servidor.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+import weakref
+from bisect import bisect_left
+from contextlib import contextmanager
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Limites (segundos) para requisições e operações de duração semelhante
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Limites (segundos) para operações curtas, como a geração de uma seção
+FAST_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+# Limites para tamanhos de arquivos compactados (bytes) e quantidade de membros
+BYTES_BUCKETS = tuple(1024 * 4 ** power for power in range(11))  # 1 KiB a 1 GiB
+ENTRIES_BUCKETS = (10, 100, 1000, 5000, 10000, 50000, 100000, 500000, 1000000)
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + '}'
+
+class Histogram:
+    """
+    Histograma com rótulos, no modelo de histogramas do Prometheus.
+    """
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Rótulos -> [contagem por faixa (a última é +Inf), soma, total]
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        """
+        Registra uma medição.
+
+        Args:
+            value (float): Valor medido
+            *labels: Valores dos rótulos, na ordem de labelnames
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def snapshot(self):
+        """
+        Copia as séries do processo atual.
+
+        Returns:
+            list: [rótulos, contagem por faixa, soma, total] de cada série
+        """
+        with self._lock:
+            return [[list(labels), list(counts), total, count]
+                    for labels, (counts, total, count) in self._series.items()]
+
+    def reset(self):
+        """Descarta as medições do processo atual"""
+        with self._lock:
+            self._series = {}
+
+    @contextmanager
+    def time(self, *labels):
+        """Mede a duração, em segundos, do bloco executado dentro do with"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def collect(self, series=None):
+        """
+        Gera as linhas do histograma no formato texto do Prometheus.
+
+        Args:
+            series (list): Séries a exportar, no formato de snapshot (padrão: as do processo atual)
+
+        Yields:
+            str: Linhas de HELP, TYPE, faixas acumuladas, soma e total
+        """
+        yield f'# HELP {self.name} {self.documentation}'
+        yield f'# TYPE {self.name} histogram'
+        if series is None:
+            series = self.snapshot()
+
+        for labels, counts, total, count in sorted(series, key=lambda item: item[0]):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = _format_labels(self.labelnames, labels, [('le', _format_value(float(bound)))])
+                yield f'{self.name}_bucket{le} {cumulative}'
+            label_text = _format_labels(self.labelnames, labels)
+            yield f'{self.name}_sum{label_text} {_format_value(total)}'
+            yield f'{self.name}_count{label_text} {count}'
+
+# Registros existentes, reiniciados no processo filho após um fork
+_REGISTRIES = weakref.WeakSet()
+
+def _after_fork():
+    for registry in list(_REGISTRIES):
+        registry.after_fork()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork)
+
+def _merge_series(merged, series, size):
+    """Soma as séries de um processo às já acumuladas (rótulos -> [faixas, soma, total])"""
+    for labels, counts, total, count in series:
+        if len(counts) != size:
+            # Gravado por uma versão com outros limites: não pode ser somado
+            continue
+        entry = merged.setdefault(tuple(labels), [[0] * size, 0.0, 0])
+        entry[0] = [current + added for current, added in zip(entry[0], counts)]
+        entry[1] += total
+        entry[2] += count
+
+class MetricsRegistry:
+    """
+    Conjunto de métricas exportadas juntas em /metrics.
+    """
+
+    def __init__(self, directory=None):
+        self._metrics = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flushed = None
+        self._filename = None
+        self.set_directory(directory)
+        _REGISTRIES.add(self)
+
+    def set_directory(self, directory):
+        """
+        Define o diretório compartilhado entre os processos (None: métricas apenas deste processo).
+
+        Args:
+            directory (str): Diretório dos arquivos de métricas
+        """
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self._start_process()
+
+    def _start_process(self):
+        # Cada processo (inclusive após um fork) grava num arquivo próprio; o id
+        # aleatório evita que um PID reaproveitado sobrescreva o de um worker encerrado
+        self._filename = f'metrics-{os.getpid()}-{uuid.uuid4().hex[:8]}.json'
+        self._flushed = None
+
+    def after_fork(self):
+        """
+        Descarta, no processo filho, as medições herdadas do pai.
+
+        O pai continua exportando as próprias medições; mantê-las no filho
+        faria com que fossem somadas duas vezes.
+        """
+        for metric in list(self._metrics):
+            metric.reset()
+        self._flush_lock = threading.Lock()
+        self._start_process()
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """Cria e registra um histograma"""
+        metric = Histogram(name, documentation, labelnames, buckets)
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def flush(self):
+        """
+        Grava as medições deste processo no diretório compartilhado.
+
+        O arquivo é substituído atomicamente, então quem lê nunca encontra
+        uma gravação pela metade; sem medições novas, nada é gravado.
+        """
+        directory = self.directory
+        if not directory:
+            return
+        with self._lock:
+            metrics = list(self._metrics)
+        snapshots = {metric.name: metric.snapshot() for metric in metrics}
+        payload = json.dumps(snapshots, separators=(',', ':'))
+
+        with self._flush_lock:
+            # Sem medições (como no processo mestre do gunicorn), nenhum arquivo é criado
+            if payload == self._flushed or (self._flushed is None and not any(snapshots.values())):
+                return
+            path = os.path.join(directory, self._filename)
+            temp_path = f'{path}.{threading.get_ident()}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as metrics_file:
+                metrics_file.write(payload)
+            os.replace(temp_path, path)
+            self._flushed = payload
+
+    def _read_processes(self):
+        """Lê as medições gravadas por todos os processos"""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if not (name.startswith('metrics-') and name.endswith('.json')):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), encoding='utf-8') as metrics_file:
+                    yield json.load(metrics_file)
+            except (OSError, ValueError):
+                continue
+
+    def render(self):
+        """
+        Monta o texto de todas as métricas registradas.
+
+        Com um diretório configurado, soma as medições de todos os processos.
+
+        Returns:
+            str: Métricas no formato texto do Prometheus (versão 0.0.4)
+        """
+        with self._lock:
+            metrics = list(self._metrics)
+
+        merged = None
+        if self.directory:
+            # As medições deste processo são gravadas antes, para entrarem na soma atualizadas
+            self.flush()
+            merged = {metric.name: {} for metric in metrics}
+            for process in self._read_processes():
+                for metric in metrics:
+                    _merge_series(merged[metric.name], process.get(metric.name, ()), len(metric.buckets) + 1)
+
+        lines = []
+        for metric in metrics:
+            if merged is None:
+                lines.extend(metric.collect())
+            else:
+                series = [[labels, counts, total, count]
+                          for labels, (counts, total, count) in merged[metric.name].items()]
+                lines.extend(metric.collect(series))
+        return '\n'.join(lines) + '\n'
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_DURATION = REGISTRY.histogram(
+    'docgen_http_request_duration_seconds',
+    'Tempo de resposta das requisições HTTP, por rota, método e status.',
+    labelnames=('endpoint', 'method', 'status')
+)
+
+SECTION_RENDER_DURATION = REGISTRY.histogram(
+    'docgen_section_render_duration_seconds',
+    'Tempo de geração do markdown de cada seção (apenas quando não está em cache).',
+    labelnames=('section',),
+    buckets=FAST_BUCKETS
+)
+
+MARKDOWN_CONVERSION_DURATION = REGISTRY.histogram(
+    'docgen_markdown_conversion_duration_seconds',
+    'Tempo de conversão de um fragmento markdown em HTML.',
+    buckets=FAST_BUCKETS
+)
+
+ARCHIVE_ANALYSIS_DURATION = REGISTRY.histogram(
+    'docgen_archive_analysis_duration_seconds',
+    'Tempo de análise da estrutura de arquivos compactados.',
+    labelnames=('format',)
+)
+
+ARCHIVE_ANALYSIS_BYTES = REGISTRY.histogram(
+    'docgen_archive_analysis_bytes_read',
+    'Bytes lidos do arquivo compactado durante a análise.',
+    labelnames=('format',),
+    buckets=BYTES_BUCKETS
+)
+
+ARCHIVE_ANALYSIS_ENTRIES = REGISTRY.histogram(
+    'docgen_archive_analysis_entries',
+    'Quantidade de membros lidos do arquivo compactado.',
+    labelnames=('format',),
+    buckets=ENTRIES_BUCKETS
+)
+
+def observe_archive_analysis(stats):
+    """
+    Registra as estatísticas preenchidas por analyze_structure.
+
+    Args:
+        stats (dict): Formato, bytes lidos, membros e duração da análise
+    """
+    archive_format = stats.get('format')
+    if archive_format is None:
+        return
+    ARCHIVE_ANALYSIS_DURATION.observe(stats.get('seconds', 0.0), archive_format)
+    ARCHIVE_ANALYSIS_BYTES.observe(stats.get('bytes_read', 0), archive_format)
+    ARCHIVE_ANALYSIS_ENTRIES.observe(stats.get('entries', 0), archive_format)
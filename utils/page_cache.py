@@ -0,0 +1,117 @@
+"""
+Cache de páginas públicas que não dependem da sessão do visitante.
+
+A página é renderizada uma única vez por processo, no primeiro acesso, e
+guardada já comprimida em gzip (e em Brotli, quando o pacote brotli está
+instalado). As requisições seguintes apenas escolhem o corpo adequado ao
+Accept-Encoding do navegador, sem executar o template nem o gerador.
+"""
+
+import gzip
+import hashlib
+import threading
+
+from flask import Response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Codificações na ordem de preferência quando o navegador aceita mais de uma
+ENCODINGS = ('br', 'gzip')
+
+def choose_encoding(accept_encodings, available):
+    """
+    Escolhe, entre as codificações disponíveis, a preferida que o navegador aceita.
+
+    Args:
+        accept_encodings: Cabeçalho Accept-Encoding já interpretado (request.accept_encodings)
+        available: Codificações em que o conteúdo já está comprimido
+
+    Returns:
+        str: 'br', 'gzip' ou 'identity'
+    """
+    for encoding in ENCODINGS:
+        if encoding in available and accept_encodings[encoding]:
+            return encoding
+    return 'identity'
+
+class CachedPage:
+    """
+    Corpo renderizado de uma página, com as versões comprimidas e o ETag.
+    """
+
+    __slots__ = ('bodies', 'etag', 'mimetype')
+
+    def __init__(self, body, mimetype='text/html'):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.mimetype = mimetype
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.bodies = {'identity': body}
+        # mtime fixo para que o mesmo conteúdo gere sempre os mesmos bytes em todos os workers
+        self.bodies['gzip'] = gzip.compress(body, compresslevel=9, mtime=0)
+        if brotli is not None:
+            self.bodies['br'] = brotli.compress(body, mode=brotli.MODE_TEXT)
+
+    def response(self, request, max_age):
+        """
+        Monta a resposta para a requisição atual, respondendo 304 se o navegador já tiver a página.
+
+        Args:
+            request: Requisição atual
+            max_age (int): Tempo, em segundos, que navegadores e CDNs podem reutilizar a página
+
+        Returns:
+            Response: Página comprimida conforme o Accept-Encoding, ou 304
+        """
+        encoding = choose_encoding(request.accept_encodings, self.bodies)
+        # Cada codificação é uma representação diferente e precisa de um ETag próprio
+        etag = self.etag if encoding == 'identity' else f'{self.etag}-{encoding}'
+
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(self.bodies[encoding], mimetype=self.mimetype)
+            if encoding != 'identity':
+                response.headers['Content-Encoding'] = encoding
+
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = f'public, max-age={max_age}, stale-while-revalidate={max_age}'
+        response.vary.add('Accept-Encoding')
+        return response
+
+class PageCache:
+    """
+    Páginas renderizadas sob demanda e mantidas até o fim do processo.
+    """
+
+    def __init__(self):
+        self._pages = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, render):
+        """
+        Retorna a página associada à chave, renderizando-a no primeiro acesso.
+
+        Args:
+            key: Identificador da página (deve incluir tudo que altera o conteúdo)
+            render (callable): Função sem argumentos que retorna o HTML da página
+
+        Returns:
+            CachedPage: Página renderizada e comprimida
+        """
+        page = self._pages.get(key)
+        if page is None:
+            with self._lock:
+                # Outra thread pode ter renderizado a página enquanto esta aguardava o lock
+                page = self._pages.get(key)
+                if page is None:
+                    page = self._pages[key] = CachedPage(render())
+        return page
+
+    def clear(self):
+        """Descarta as páginas renderizadas, por exemplo após recarregar os templates"""
+        with self._lock:
+            self._pages.clear()
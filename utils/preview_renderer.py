@@ -0,0 +1,114 @@
+"""
+Renderização do markdown gerado em HTML para o preview e as páginas de demonstração.
+"""
+
+import hashlib
+import threading
+
+import markdown
+
+from utils.cache import LRUCache
+from utils.metrics import MARKDOWN_CONVERSION_DURATION
+
+# Extensões do Python-Markdown usadas em todas as conversões
+MARKDOWN_EXTENSIONS = ['extra', 'codehilite']
+
+# Quantidade máxima de blocos HTML de seção mantidos em cache
+HTML_CACHE_SIZE = 1024
+
+_local = threading.local()
+_html_cache = LRUCache(HTML_CACHE_SIZE)
+
+def _get_engine():
+    """
+    Retorna a instância de Markdown da thread atual, criando-a na primeira chamada.
+    Reaproveitar a instância evita recarregar as extensões e o Pygments a cada conversão.
+    """
+    engine = getattr(_local, 'engine', None)
+    if engine is None:
+        engine = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+        _local.engine = engine
+    return engine
+
+def markdown_to_html(text):
+    """
+    Converte um texto markdown em HTML usando o conversor da thread atual.
+
+    Args:
+        text (str): Conteúdo markdown
+
+    Returns:
+        str: HTML gerado
+    """
+    engine = _get_engine()
+    try:
+        with MARKDOWN_CONVERSION_DURATION.time():
+            return engine.convert(text)
+    finally:
+        # Limpa o estado acumulado (referências, notas de rodapé) para o próximo uso
+        engine.reset()
+
+def render_fragments_html(fragments):
+    """
+    Converte cada fragmento markdown em HTML, reaproveitando os blocos em cache.
+
+    Args:
+        fragments (list): Pares (id_do_fragmento, markdown) gerados por
+            generate_markdown_fragments
+
+    Returns:
+        list: Pares (id_do_fragmento, html) na mesma ordem
+    """
+    rendered = []
+    for fragment_id, content in fragments:
+        key = hashlib.sha1(content.encode('utf-8')).hexdigest()
+        html = _html_cache.get(key)
+        if html is None:
+            html = markdown_to_html(content)
+            _html_cache.set(key, html)
+        rendered.append((fragment_id, html))
+    return rendered
+
+def wrap_fragment_html(fragment_id, html):
+    """
+    Envolve o HTML de um fragmento no bloco identificado usado pelo preview,
+    para que o editor consiga substituir apenas os fragmentos alterados.
+    """
+    return f'<div class="preview-fragment" data-fragment-id="{fragment_id}">\n{html}\n</div>'
+
+def render_preview_html(fragments):
+    """
+    Monta o HTML completo do preview a partir dos fragmentos do documento.
+
+    Args:
+        fragments (list): Pares (id_do_fragmento, markdown)
+
+    Returns:
+        str: HTML do documento completo, com um bloco por fragmento
+    """
+    return "\n".join(wrap_fragment_html(fragment_id, html)
+                     for fragment_id, html in render_fragments_html(fragments))
+
+def preview_delta(current, changed=None):
+    """
+    Monta a atualização incremental do preview enviada ao editor.
+
+    Args:
+        current (list): Fragmentos da versão atual do documento
+        changed (list): Fragmentos que mudaram desde a versão exibida pelo
+            cliente (None para enviar todos)
+
+    Returns:
+        dict: Ordem dos fragmentos ('order') e markdown e HTML dos
+            fragmentos alterados, indexados pelo ID ('fragments')
+    """
+    if changed is None:
+        changed = current
+    markdown_by_id = dict(changed)
+    return {
+        'order': [fragment_id for fragment_id, _ in current],
+        'fragments': {
+            fragment_id: {'markdown': markdown_by_id[fragment_id], 'html': html}
+            for fragment_id, html in render_fragments_html(changed)
+        }
+    }
@@ -0,0 +1,158 @@
+"""
+Canal de preview em tempo real do editor.
+
+As edições chegam por um endpoint que apenas grava a seção e incrementa a
+versão do projeto no SQLite, sem renderizar nada. Cada aba do editor mantém
+uma conexão aberta (Server-Sent Events, ou long-poll quando SSE não está
+disponível) que acompanha essa versão e envia ao navegador somente os
+fragmentos do preview que mudaram.
+
+Como a versão fica no banco compartilhado, a edição e o canal podem ser
+atendidos por workers diferentes. Quando várias gravações acontecem entre
+duas consultas, apenas a versão mais recente é renderizada: as intermediárias
+já foram superadas e nunca chegam a ser processadas.
+
+Cada conexão mantida aberta ocupa uma thread (ou greenlet) do servidor, então
+o número delas por processo é limitado (max_connections). Acima do limite,
+ou em servidores de workers síncronos, o navegador passa a consultar em
+intervalos curtos, com respostas imediatas.
+"""
+
+import json
+import threading
+import time
+
+from models.project import Project
+from utils.markdown_generator import fragments_for_sections, generate_markdown_fragments
+from utils.preview_renderer import preview_delta
+
+def format_event(event, data, event_id=None):
+    """
+    Formata uma mensagem no protocolo Server-Sent Events.
+
+    Args:
+        event (str): Nome do evento
+        data (dict): Conteúdo, enviado como JSON
+        event_id: Identificador devolvido pelo navegador ao reconectar (Last-Event-ID)
+
+    Returns:
+        str: Mensagem pronta para ser escrita na resposta
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    lines.append(f'event: {event}')
+    lines.append('data: ' + json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+    return '\n'.join(lines) + '\n\n'
+
+class PreviewChannel:
+    """
+    Acompanha a versão dos projetos no armazenamento e produz os deltas do preview.
+    """
+
+    def __init__(self, store, poll_interval=0.15, heartbeat=15, max_connections=None):
+        self.store = store
+        self.poll_interval = poll_interval
+        self.heartbeat = heartbeat
+        # Conexões SSE e long-poll abertas ao mesmo tempo neste processo (None = sem limite)
+        self._slots = threading.BoundedSemaphore(max_connections) if max_connections is not None else None
+
+    def acquire_connection(self):
+        """
+        Reserva uma das conexões que este processo pode manter abertas.
+
+        Returns:
+            bool: True se a conexão pode ser mantida; deve ser liberada com release_connection
+        """
+        return self._slots is None or self._slots.acquire(blocking=False)
+
+    def release_connection(self):
+        """Libera uma conexão reservada por acquire_connection"""
+        if self._slots is not None:
+            self._slots.release()
+
+    def render(self, sid, since=None):
+        """
+        Renderiza a versão atual do projeto como delta em relação a outra versão.
+
+        Args:
+            sid (str): Identificador da sessão
+            since (int): Versão exibida pelo navegador (None para enviar tudo)
+
+        Returns:
+            dict: Delta no formato de preview_delta, com a versão renderizada
+                ('version'), ou None se a sessão não tiver projeto
+        """
+        project_data = self.store.load_project(sid)
+        if project_data is None:
+            return None
+
+        project = Project.from_dict(project_data)
+        fragments = generate_markdown_fragments(project_data)
+        changed = None
+        if since is not None and since <= project.version:
+            # Só os fragmentos das seções gravadas depois da versão do navegador
+            changed = fragments_for_sections(fragments, project.project_type, project.changed_since(since))
+
+        delta = preview_delta(fragments, changed)
+        delta['version'] = project.version
+        return delta
+
+    def wait_for_change(self, sid, since, timeout):
+        """
+        Aguarda até que a versão do projeto seja diferente da informada.
+
+        Args:
+            sid (str): Identificador da sessão
+            since (int): Versão exibida pelo navegador
+            timeout (float): Tempo máximo de espera, em segundos
+
+        Returns:
+            int: Nova versão, since se o tempo esgotar, ou None se a sessão não tiver projeto
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            version = self.store.load_project_version(sid)
+            if version is None or version != since or time.monotonic() >= deadline:
+                return version
+            time.sleep(self.poll_interval)
+
+    def stream(self, sid, since, timeout):
+        """
+        Gera as mensagens SSE de uma aba do editor.
+
+        A conexão é encerrada após timeout segundos; o navegador reconecta
+        sozinho e informa a última versão recebida em Last-Event-ID.
+
+        Args:
+            sid (str): Identificador da sessão
+            since (int): Versão exibida pelo navegador
+            timeout (float): Duração máxima da conexão, em segundos
+
+        Yields:
+            str: Mensagens no protocolo Server-Sent Events
+        """
+        deadline = time.monotonic() + timeout
+        # Intervalo de reconexão sugerido ao navegador, em milissegundos
+        yield 'retry: 1000\n\n'
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+
+            version = self.wait_for_change(sid, since, min(self.heartbeat, remaining))
+            if version is None:
+                yield format_event('expired', {'error': 'Sessão expirada'})
+                return
+            if version == since:
+                # Comentário que mantém a conexão viva em proxies
+                yield ': ping\n\n'
+                continue
+
+            delta = self.render(sid, since)
+            if delta is None:
+                yield format_event('expired', {'error': 'Sessão expirada'})
+                return
+            since = delta['version']
+            yield format_event('preview', delta, event_id=since)
@@ -0,0 +1,244 @@
+"""
+Profiler por amostragem para investigar requisições lentas em produção.
+
+Quando habilitado, uma requisição é perfilada se trouxer um cabeçalho
+assinado (HMAC com PROFILER_SECRET) ou se for sorteada pela taxa de
+amostragem. Durante a requisição, uma thread auxiliar registra a pilha da
+thread que a atende em intervalos fixos; ao final, as pilhas são gravadas
+no formato "collapsed" (uma pilha por linha, frames separados por ";",
+seguida da quantidade de amostras), aceito por flamegraph.pl e speedscope.
+
+Com o profiler desabilitado nenhum hook é registrado na aplicação.
+
+Uso para gerar o cabeçalho de uma requisição:
+    PROFILER_SECRET=... python -m utils.profiler /editor
+"""
+
+import argparse
+import hashlib
+import hmac
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+from flask import g, request
+
+# Cabeçalho com a assinatura: "<expira_em>.<hmac-sha256 de 'expira_em:caminho'>"
+PROFILE_HEADER = 'X-DocGen-Profile'
+
+# Validade máxima de uma assinatura, em segundos
+MAX_SIGNATURE_TTL = 60 * 60
+
+# Frames mais profundos que isso são descartados da pilha
+MAX_STACK_DEPTH = 128
+
+_UNSAFE_TAG = re.compile(r'[^A-Za-z0-9_.-]+')
+
+def sign_profile_request(secret, path, ttl=300, now=None):
+    """
+    Gera o valor do cabeçalho que pede o profiling de uma requisição.
+
+    Args:
+        secret (str): Segredo compartilhado (PROFILER_SECRET)
+        path (str): Caminho da requisição, sem a query string
+        ttl (int): Validade da assinatura, em segundos
+
+    Returns:
+        str: Valor do cabeçalho X-DocGen-Profile
+    """
+    expires = int((now or time.time()) + ttl)
+    digest = hmac.new(secret.encode('utf-8'), f'{expires}:{path}'.encode('utf-8'), hashlib.sha256)
+    return f'{expires}.{digest.hexdigest()}'
+
+def verify_profile_signature(secret, path, value, now=None):
+    """
+    Verifica o cabeçalho de profiling de uma requisição.
+
+    Returns:
+        bool: True se a assinatura for válida, do mesmo caminho e não tiver expirado
+    """
+    expires, _, signature = (value or '').partition('.')
+    if not expires.isdigit() or not signature:
+        return False
+    now = now or time.time()
+    if not now <= int(expires) <= now + MAX_SIGNATURE_TTL:
+        return False
+    expected = sign_profile_request(secret, path, ttl=0, now=int(expires)).partition('.')[2]
+    return hmac.compare_digest(expected, signature)
+
+def _frame_label(code):
+    return f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})'
+
+def collapse_stack(frame):
+    """
+    Converte a pilha de um frame em uma linha do formato collapsed.
+
+    Returns:
+        str: Frames da raiz até o frame informado, separados por ";"
+    """
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return ';'.join(labels)
+
+class StackSampler:
+    """
+    Amostra periodicamente a pilha de uma thread a partir de uma thread auxiliar.
+    """
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='docgen-profiler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Interrompe a amostragem e retorna as pilhas coletadas"""
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse_stack(frame)] += 1
+
+class RequestProfiler:
+    """
+    Perfila requisições selecionadas e grava as pilhas em um diretório de tamanho limitado.
+    """
+
+    def __init__(self, output_dir, secret=None, sample_rate=0.0, interval=0.001, max_bytes=32 * 1024 * 1024):
+        self.output_dir = output_dir
+        self.secret = secret
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.max_bytes = max_bytes
+        self._write_lock = threading.Lock()
+
+    def init_app(self, app):
+        """Registra os hooks de início e fim de requisição na aplicação"""
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        # Garante que a thread auxiliar pare mesmo se a requisição terminar com exceção
+        app.teardown_request(self._teardown)
+
+    def should_profile(self):
+        """Decide se a requisição atual será perfilada"""
+        header = request.headers.get(PROFILE_HEADER)
+        if header and self.secret:
+            return verify_profile_signature(self.secret, request.path, header)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def _start(self):
+        if self.should_profile():
+            g.profiler_started = time.perf_counter()
+            g.profiler_sampler = StackSampler(threading.get_ident(), self.interval).start()
+
+    def _finish(self, response):
+        sampler = g.pop('profiler_sampler', None)
+        if sampler is not None:
+            elapsed = time.perf_counter() - g.pop('profiler_started')
+            tags = {
+                'route': request.endpoint or 'unmatched',
+                'project': g.get('project_type') or 'none',
+                'status': response.status_code
+            }
+            try:
+                self.write(sampler.stop(), tags, elapsed)
+            except OSError:
+                pass
+        return response
+
+    def _teardown(self, exc):
+        sampler = g.pop('profiler_sampler', None)
+        if sampler is not None:
+            sampler.stop()
+
+    def write(self, stacks, tags, elapsed):
+        """
+        Grava as pilhas de uma requisição e remove os arquivos mais antigos
+        se o diretório passar de max_bytes.
+
+        As tags entram no nome do arquivo e como frames da raiz de cada pilha,
+        para que arquivos de rotas e tipos de projeto diferentes possam ser
+        combinados em um único flame graph.
+
+        Args:
+            stacks (Counter): Pilha collapsed -> quantidade de amostras
+            tags (dict): Rota, tipo de projeto e status da requisição
+            elapsed (float): Duração da requisição, em segundos
+
+        Returns:
+            str: Caminho do arquivo gravado, ou None se não houver amostras
+        """
+        if not stacks:
+            return None
+
+        root = ';'.join(f'{key}:{value}' for key, value in tags.items())
+        name = '_'.join(
+            [time.strftime('%Y%m%dT%H%M%S'), f'{elapsed * 1000:.0f}ms']
+            + [_UNSAFE_TAG.sub('-', str(value)) for value in tags.values()]
+            + [str(os.getpid()), uuid.uuid4().hex[:8]]
+        ) + '.folded'
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, name)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as output_file:
+            for stack, count in stacks.most_common():
+                output_file.write(f'{root};{stack} {count}\n')
+        os.replace(temp_path, path)
+
+        with self._write_lock:
+            self._enforce_size_limit()
+        return path
+
+    def _enforce_size_limit(self):
+        """Remove os perfis mais antigos até o diretório caber em max_bytes"""
+        try:
+            entries = [entry for entry in os.scandir(self.output_dir) if entry.name.endswith('.folded')]
+            files = sorted(((entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in entries))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m utils.profiler',
+        description='Gera o cabeçalho que pede o profiling de uma requisição.'
+    )
+    parser.add_argument('path', help='Caminho da requisição, por exemplo /editor')
+    parser.add_argument('--ttl', type=int, default=300, help='Validade da assinatura em segundos (padrão: 300)')
+    args = parser.parse_args(argv)
+
+    secret = os.environ.get('PROFILER_SECRET')
+    if not secret:
+        print('Defina PROFILER_SECRET com o mesmo segredo da aplicação.', file=sys.stderr)
+        return 1
+    print(f'{PROFILE_HEADER}: {sign_profile_request(secret, args.path, min(args.ttl, MAX_SIGNATURE_TTL))}')
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
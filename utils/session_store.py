@@ -0,0 +1,413 @@
+"""
+Armazenamento de sessões e projetos em um banco SQLite compartilhado.
+
+Todos os workers da aplicação usam o mesmo arquivo de banco (em modo WAL),
+então o usuário mantém o seu projeto independentemente do worker que atende
+a requisição. Cada seção do projeto é gravada em uma linha própria, de modo
+que a edição de uma seção escreve apenas aquela seção.
+"""
+
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+from utils.template_manager import is_section_data_complete
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    sid TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_expires_at ON sessions (expires_at);
+
+CREATE TABLE IF NOT EXISTS projects (
+    sid TEXT PRIMARY KEY,
+    type TEXT,
+    name TEXT,
+    structure TEXT,
+    theme TEXT NOT NULL DEFAULT 'default',
+    version INTEGER NOT NULL DEFAULT 0,
+    structure_version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS project_sections (
+    sid TEXT NOT NULL,
+    section_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    complete INTEGER,
+    PRIMARY KEY (sid, section_id)
+);
+
+-- Última versão usada em cada sessão, mantida quando o projeto é removido (/reset)
+CREATE TABLE IF NOT EXISTS project_versions (
+    sid TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+
+class SQLiteStore:
+    """
+    Acesso ao banco de sessões e projetos, com uma conexão por thread.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._schema_ready = False
+
+    def _connect(self):
+        """Retorna a conexão da thread atual, abrindo-a na primeira chamada"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        if not self._schema_ready:
+            conn.executescript(SCHEMA)
+            self._migrate(conn)
+            self._schema_ready = True
+
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def _migrate(self, conn):
+        """Adiciona colunas novas a bancos criados por versões anteriores"""
+        added_columns = (
+            ('projects', 'version', 'INTEGER NOT NULL DEFAULT 0'),
+            ('projects', 'structure_version', 'INTEGER NOT NULL DEFAULT 0'),
+            ('project_sections', 'version', 'INTEGER NOT NULL DEFAULT 0'),
+            # Seções gravadas antes desta coluna ficam com NULL e são validadas na leitura
+            ('project_sections', 'complete', 'INTEGER')
+        )
+        for table, column, definition in added_columns:
+            columns = {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+            if column not in columns:
+                with conn:
+                    conn.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+
+    # Sessões
+
+    def load_session(self, sid):
+        """
+        Carrega os dados serializados de uma sessão ainda válida.
+
+        Returns:
+            tuple: (dados, expira_em), ou None se a sessão não existir ou tiver expirado
+        """
+        row = self._connect().execute(
+            'SELECT data, expires_at FROM sessions WHERE sid = ? AND expires_at > ?',
+            (sid, time.time())
+        ).fetchone()
+        return row
+
+    def save_session(self, sid, data, expires_at):
+        """Grava os dados serializados de uma sessão"""
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO sessions (sid, data, expires_at) VALUES (?, ?, ?) '
+                'ON CONFLICT (sid) DO UPDATE SET data = excluded.data, expires_at = excluded.expires_at',
+                (sid, data, expires_at)
+            )
+
+    def touch_session(self, sid, expires_at):
+        """Renova o prazo de expiração de uma sessão"""
+        with self._connect() as conn:
+            conn.execute('UPDATE sessions SET expires_at = ? WHERE sid = ?', (expires_at, sid))
+
+    def delete_session(self, sid):
+        """Remove uma sessão e o projeto associado"""
+        with self._connect() as conn:
+            conn.execute('DELETE FROM sessions WHERE sid = ?', (sid,))
+            self._delete_project(conn, sid, keep_version=False)
+
+    def delete_expired(self, now=None, batch_size=500):
+        """
+        Remove as sessões expiradas e os projetos associados, em lotes.
+        A busca usa o índice de expiração, então sessões válidas nunca são lidas.
+
+        Returns:
+            int: Quantidade de sessões removidas
+        """
+        now = time.time() if now is None else now
+        conn = self._connect()
+        removed = 0
+        while True:
+            with conn:
+                expired = [(row[0],) for row in conn.execute(
+                    'SELECT sid FROM sessions WHERE expires_at <= ? ORDER BY expires_at LIMIT ?',
+                    (now, batch_size)
+                )]
+                if not expired:
+                    return removed
+                conn.executemany('DELETE FROM project_sections WHERE sid = ?', expired)
+                conn.executemany('DELETE FROM projects WHERE sid = ?', expired)
+                conn.executemany('DELETE FROM project_versions WHERE sid = ?', expired)
+                conn.executemany('DELETE FROM sessions WHERE sid = ?', expired)
+            removed += len(expired)
+
+    # Projetos
+
+    def load_project(self, sid):
+        """
+        Carrega o projeto de uma sessão no formato de Project.to_dict.
+
+        Returns:
+            dict: Dados do projeto, ou None se a sessão não tiver projeto
+        """
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT type, name, structure, theme, version, structure_version FROM projects WHERE sid = ?', (sid,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        sections = {}
+        section_versions = {}
+        section_complete = {}
+        for section_id, data, version, complete in conn.execute(
+            'SELECT section_id, data, version, complete FROM project_sections WHERE sid = ? ORDER BY rowid', (sid,)
+        ):
+            sections[section_id] = json.loads(data)
+            section_versions[section_id] = version
+            if complete is not None:
+                section_complete[section_id] = bool(complete)
+        return {
+            'type': row[0],
+            'name': row[1],
+            'sections': sections,
+            'structure': row[2],
+            'theme': row[3],
+            'version': row[4],
+            'section_versions': section_versions,
+            'section_complete': section_complete,
+            'structure_version': row[5]
+        }
+
+    def load_project_version(self, sid):
+        """
+        Consulta apenas a versão do projeto de uma sessão.
+
+        Returns:
+            int: Versão atual do projeto, ou None se a sessão não tiver projeto
+        """
+        row = self._connect().execute('SELECT version FROM projects WHERE sid = ?', (sid,)).fetchone()
+        return row[0] if row else None
+
+    def save_project(self, sid, project):
+        """
+        Substitui todo o projeto de uma sessão.
+
+        Returns:
+            int: Nova versão do projeto
+        """
+        with self._connect() as conn:
+            # A versão continua a partir da anterior, inclusive de projetos removidos
+            # pelo /reset, para que uma aba antiga nunca confunda versões de projetos diferentes
+            row = conn.execute(
+                'SELECT MAX(version) FROM (SELECT version FROM projects WHERE sid = ? '
+                'UNION ALL SELECT version FROM project_versions WHERE sid = ?)', (sid, sid)
+            ).fetchone()
+            version = (row[0] or 0) + 1
+            self._delete_project(conn, sid)
+            # Tudo é substituído, então todas as seções passam a ter a nova versão
+            conn.execute(
+                'INSERT INTO projects (sid, type, name, structure, theme, version, structure_version) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (sid, project.get('type'), project.get('name'), project.get('structure'),
+                 project.get('theme', 'default'), version, version)
+            )
+            self._write_sections(conn, sid, project.get('sections', {}), version, project.get('type'))
+        return version
+
+    def save_section(self, sid, section_id, data):
+        """
+        Grava apenas uma seção do projeto.
+
+        Returns:
+            int: Nova versão do projeto
+        """
+        return self.save_sections(sid, {section_id: data})
+
+    def save_sections(self, sid, sections):
+        """
+        Grava várias seções do projeto em uma única transação.
+
+        Args:
+            sid (str): Identificador da sessão
+            sections (dict): Dados de cada seção, indexados pelo ID da seção
+
+        Returns:
+            int: Nova versão do projeto
+        """
+        with self._connect() as conn:
+            version = self._bump_version(conn, sid)
+            self._write_sections(conn, sid, sections, version, self._project_type(conn, sid))
+            return version
+
+    def save_structure(self, sid, structure):
+        """
+        Grava a estrutura de arquivos analisada do projeto.
+
+        Returns:
+            int: Nova versão do projeto
+        """
+        with self._connect() as conn:
+            version = self._bump_version(conn, sid)
+            conn.execute('UPDATE projects SET structure = ?, structure_version = ? WHERE sid = ?',
+                         (structure, version, sid))
+            return version
+
+    def save_changes(self, sid, project):
+        """
+        Grava, em uma única transação, apenas as alterações pendentes de um
+        Project (seções e estrutura marcadas como modificadas).
+
+        Args:
+            sid (str): Identificador da sessão
+            project (Project): Projeto com alterações pendentes
+
+        Returns:
+            int: Versão do projeto após a gravação
+        """
+        if not project.is_dirty:
+            return project.version
+
+        with self._connect() as conn:
+            version = self._bump_version(conn, sid)
+            complete = self._write_sections(conn, sid, project.dirty_sections(), version, project.project_type)
+            if project.structure_dirty:
+                conn.execute('UPDATE projects SET structure = ?, structure_version = ? WHERE sid = ?',
+                             (project.structure, version, sid))
+        project.mark_saved(version, complete)
+        return version
+
+    def delete_project(self, sid):
+        """Remove o projeto de uma sessão, guardando a última versão usada"""
+        with self._connect() as conn:
+            self._delete_project(conn, sid)
+
+    def _bump_version(self, conn, sid):
+        """Incrementa a versão do projeto dentro da transação atual"""
+        conn.execute('UPDATE projects SET version = version + 1 WHERE sid = ?', (sid,))
+        row = conn.execute('SELECT version FROM projects WHERE sid = ?', (sid,)).fetchone()
+        return row[0] if row else 0
+
+    def _project_type(self, conn, sid):
+        row = conn.execute('SELECT type FROM projects WHERE sid = ?', (sid,)).fetchone()
+        return row[0] if row else None
+
+    def _write_sections(self, conn, sid, sections, version, project_type):
+        """
+        Grava as seções informadas, marcando-as com a versão em que mudaram.
+
+        A completude de cada seção é validada aqui, uma vez por versão gravada,
+        para que a leitura do status não precise percorrer os campos.
+
+        Returns:
+            dict: Completude de cada seção gravada, indexada pelo ID da seção
+        """
+        complete = {section_id: is_section_data_complete(project_type, section_id, data)
+                    for section_id, data in sections.items()}
+        conn.executemany(
+            'INSERT INTO project_sections (sid, section_id, data, version, complete) VALUES (?, ?, ?, ?, ?) '
+            'ON CONFLICT (sid, section_id) DO UPDATE SET '
+            'data = excluded.data, version = excluded.version, complete = excluded.complete',
+            [(sid, section_id, json.dumps(data, ensure_ascii=False), version, int(complete[section_id]))
+             for section_id, data in sections.items()]
+        )
+        return complete
+
+    def _delete_project(self, conn, sid, keep_version=True):
+        if keep_version:
+            conn.execute(
+                'INSERT INTO project_versions (sid, version) SELECT sid, version FROM projects WHERE sid = ? '
+                'ON CONFLICT (sid) DO UPDATE SET version = MAX(version, excluded.version)', (sid,)
+            )
+        else:
+            conn.execute('DELETE FROM project_versions WHERE sid = ?', (sid,))
+        conn.execute('DELETE FROM project_sections WHERE sid = ?', (sid,))
+        conn.execute('DELETE FROM projects WHERE sid = ?', (sid,))
+
+class SQLiteSession(CallbackDict, SessionMixin):
+    """
+    Sessão do lado do servidor identificada por um token aleatório no cookie.
+    """
+
+    def __init__(self, initial=None, sid=None, new=False, expires_at=None):
+        def on_update(self):
+            self.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.expires_at = expires_at
+        self.modified = False
+
+class SQLiteSessionInterface(SessionInterface):
+    """
+    Interface de sessão do Flask que persiste os dados em SQLiteStore.
+    A sessão só é regravada quando é modificada.
+    """
+
+    serializer = TaggedJSONSerializer()
+
+    def __init__(self, store, lifetime):
+        self.store = store
+        self.lifetime = lifetime
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            row = self.store.load_session(sid)
+            if row is not None:
+                return SQLiteSession(self.serializer.loads(row[0]), sid=sid, expires_at=row[1])
+        return SQLiteSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if not session:
+            if session.modified and not session.new:
+                self.store.delete_session(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        now = time.time()
+        expires_at = now + self.lifetime
+
+        if session.modified or session.new:
+            self.store.save_session(session.sid, self.serializer.dumps(dict(session)), expires_at)
+        elif session.expires_at - now < self.lifetime / 2:
+            # Renova o prazo sem regravar os dados quando mais da metade já passou
+            self.store.touch_session(session.sid, expires_at)
+        else:
+            return
+
+        if session.new:
+            response.set_cookie(
+                name,
+                session.sid,
+                httponly=self.get_cookie_httponly(app),
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app),
+                domain=domain,
+                path=path
+            )
@@ -0,0 +1,116 @@
+"""
+Registro de badges de tecnologias usado na seção de tecnologias.
+
+As tecnologias ficam em um arquivo de dados (data/technologies.json), com
+cor, logo e nomes alternativos de cada uma. O arquivo é carregado uma única
+vez, no primeiro uso, e transformado em um índice de aliases normalizados,
+de modo que cada tecnologia é resolvida com uma única consulta ao dicionário,
+qualquer que seja o tamanho do registro.
+
+O registro cobre algumas centenas de tecnologias; as que ficam fora dele
+aparecem como texto em negrito. Novas entradas só precisam ser acrescentadas ao arquivo, sem que
+nenhum alias já existente aponte para outra tecnologia.
+"""
+
+import json
+import os
+import re
+import threading
+from urllib.parse import quote
+
+from utils.cache import content_hash
+
+REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'technologies.json')
+
+BADGE_URL_TEMPLATE = 'https://img.shields.io/badge/{label}-{color}?style=for-the-badge&logo={logo}&logoColor={logo_color}'
+
+# Caracteres ignorados na comparação de nomes ("Node.js", "node js", "nodejs")
+_SEPARATORS = re.compile(r'[\s._-]+')
+
+_badge_index = None
+_badge_index_version = None
+_load_lock = threading.Lock()
+
+def normalize_tech_name(name):
+    """
+    Normaliza o nome de uma tecnologia para consulta no índice.
+
+    Args:
+        name (str): Nome da tecnologia como digitado pelo usuário
+
+    Returns:
+        str: Nome em minúsculas, sem espaços, pontos, hifens e sublinhados
+    """
+    return _SEPARATORS.sub('', name.strip().lower())
+
+def build_badge_url(entry):
+    """
+    Monta a URL do badge no shields.io para uma entrada do registro.
+
+    Args:
+        entry (dict): Entrada com label, color, logo e logo_color
+
+    Returns:
+        str: URL do badge
+    """
+    # No shields.io, "-" e "_" do texto precisam ser duplicados e espaços viram "_"
+    label = entry['label'].replace('-', '--').replace('_', '__').replace(' ', '_')
+    return BADGE_URL_TEMPLATE.format(
+        label=quote(label, safe='_.'),
+        color=entry['color'],
+        logo=quote(entry['logo'], safe='-.'),
+        logo_color=entry.get('logo_color', 'white')
+    )
+
+def _load_badge_index(path=REGISTRY_PATH):
+    """
+    Lê o arquivo de registro e monta o índice de aliases normalizados.
+
+    Returns:
+        dict: Alias normalizado -> URL do badge
+    """
+    with open(path, encoding='utf-8') as registry_file:
+        registry = json.load(registry_file)
+
+    index = {}
+    for entry in registry['technologies']:
+        url = build_badge_url(entry)
+        for alias in [entry['label']] + entry.get('aliases', []):
+            # O primeiro registro de um alias prevalece sobre os seguintes
+            index.setdefault(normalize_tech_name(alias), url)
+    return index
+
+def get_badge_index():
+    """
+    Retorna o índice de badges, carregando o registro no primeiro uso.
+
+    Returns:
+        dict: Alias normalizado -> URL do badge (não deve ser alterado)
+    """
+    global _badge_index, _badge_index_version
+    if _badge_index is None:
+        with _load_lock:
+            if _badge_index is None:
+                index = _load_badge_index()
+                _badge_index_version = content_hash(index)
+                _badge_index = index
+    return _badge_index
+
+def get_badge_index_version():
+    """
+    Retorna um hash do conteúdo do índice, usado como ETag ao enviá-lo ao navegador.
+    """
+    get_badge_index()
+    return _badge_index_version
+
+def get_badge_url(tech_name):
+    """
+    Retorna a URL do badge de uma tecnologia.
+
+    Args:
+        tech_name (str): Nome da tecnologia, em qualquer grafia conhecida
+
+    Returns:
+        str: URL do badge, ou None se a tecnologia não estiver no registro
+    """
+    return get_badge_index().get(normalize_tech_name(tech_name))
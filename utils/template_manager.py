@@ -1,564 +1,673 @@
 """
 Gerenciador de templates para diferentes tipos de projetos.
 Cada template define as seções e campos a serem preenchidos.
+
+Os templates são mesclados uma única vez, na importação do módulo, e
+guardados em estruturas somente leitura compartilhadas por todas as
+requisições.
 """
 
-def get_project_template(project_type):
-    """
-    Retorna o template apropriado para o tipo de projeto.
-    """
-    # Template base que todos os projetos terão
-    base_template = {
-        "project_info": {
-            "title": "Informações do Projeto",
+from types import MappingProxyType
+
+# Template base que todos os projetos terão
+_BASE_TEMPLATE = {
+    "project_info": {
+        "title": "Informações do Projeto",
+        "fields": [
+            {
+                "id": "name",
+                "label": "Nome do Projeto",
+                "type": "text",
+                "required": True,
+                "placeholder": "Ex: Sistema de Gestão de Inventário"
+            },
+            {
+                "id": "short_description",
+                "label": "Descrição Curta",
+                "type": "textarea",
+                "required": True,
+                "placeholder": "Descrição breve do projeto em 1-2 frases"
+            },
+            {
+                "id": "logo_url",
+                "label": "URL do Logo (opcional)",
+                "type": "text",
+                "required": False,
+                "placeholder": "https://exemplo.com/logo.png"
+            }
+        ]
+    },
+    "about": {
+        "title": "Sobre o Projeto",
+        "fields": [
+            {
+                "id": "description",
+                "label": "Descrição Detalhada",
+                "type": "textarea",
+                "required": True,
+                "placeholder": "Descreva detalhadamente o propósito e funcionalidade do projeto"
+            },
+            {
+                "id": "motivation",
+                "label": "Motivação",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "O que inspirou a criação deste projeto?"
+            },
+            {
+                "id": "key_features",
+                "label": "Características Principais",
+                "type": "textarea",
+                "required": True,
+                "placeholder": "Liste as principais características separadas por linhas"
+            }
+        ]
+    },
+    "technology": {
+        "title": "Tecnologias Utilizadas",
+        "fields": [
+            {
+                "id": "technologies",
+                "label": "Tecnologias",
+                "type": "tags",
+                "required": True,
+                "placeholder": "Ex: Python, Flask, React, etc."
+            },
+            {
+                "id": "architecture",
+                "label": "Arquitetura",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Descreva a arquitetura do sistema"
+            }
+        ]
+    },
+    "installation": {
+        "title": "Instalação e Configuração",
+        "fields": [
+            {
+                "id": "prerequisites",
+                "label": "Pré-requisitos",
+                "type": "textarea",
+                "required": True,
+                "placeholder": "Liste os pré-requisitos necessários"
+            },
+            {
+                "id": "installation_steps",
+                "label": "Passos de Instalação",
+                "type": "textarea",
+                "required": True,
+                "placeholder": "Descreva os passos de instalação (em formato de lista)"
+            },
+            {
+                "id": "env_variables",
+                "label": "Variáveis de Ambiente",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Liste as variáveis de ambiente necessárias"
+            }
+        ]
+    },
+    "usage": {
+        "title": "Como Utilizar",
+        "fields": [
+            {
+                "id": "usage_instructions",
+                "label": "Instruções de Uso",
+                "type": "textarea",
+                "required": True,
+                "placeholder": "Explique como utilizar o projeto"
+            },
+            {
+                "id": "examples",
+                "label": "Exemplos",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Forneça exemplos de uso"
+            },
+            {
+                "id": "commands",
+                "label": "Comandos Principais",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Liste os comandos principais"
+            }
+        ]
+    },
+    "structure": {
+        "title": "Estrutura do Projeto",
+        "fields": [
+            {
+                "id": "upload_structure",
+                "label": "Fazer upload da estrutura (opcional)",
+                "type": "file",
+                "required": False,
+                "accept": ".zip,.tar.gz"
+            },
+            {
+                "id": "manual_structure",
+                "label": "Estrutura Manual",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Estrutura de diretórios do projeto"
+            }
+        ]
+    },
+    "api": {
+        "title": "API e Endpoints",
+        "fields": [
+            {
+                "id": "has_api",
+                "label": "O projeto tem API?",
+                "type": "radio",
+                "options": ["Sim", "Não"],
+                "required": True
+            },
+            {
+                "id": "api_documentation",
+                "label": "Documentação da API",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Descreva os endpoints da API",
+                "conditional": {"field": "has_api", "value": "Sim"}
+            }
+        ]
+    },
+    "contributing": {
+        "title": "Contribuição",
+        "fields": [
+            {
+                "id": "contribution_guidelines",
+                "label": "Diretrizes de Contribuição",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Explique como outros desenvolvedores podem contribuir"
+            },
+            {
+                "id": "code_of_conduct",
+                "label": "Código de Conduta",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Código de conduta para contribuidores"
+            }
+        ]
+    },
+    "roadmap": {
+        "title": "Roadmap",
+        "fields": [
+            {
+                "id": "future_features",
+                "label": "Funcionalidades Futuras",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Liste funcionalidades planejadas para o futuro"
+            },
+            {
+                "id": "known_issues",
+                "label": "Problemas Conhecidos",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Liste problemas conhecidos"
+            }
+        ]
+    },
+    "license": {
+        "title": "Licença",
+        "fields": [
+            {
+                "id": "license_type",
+                "label": "Tipo de Licença",
+                "type": "select",
+                "options": [
+                    "MIT", "GPL-3.0", "Apache-2.0", "BSD-3-Clause", 
+                    "BSD-2-Clause", "CC0-1.0", "Outra", "Nenhuma"
+                ],
+                "required": True
+            },
+            {
+                "id": "custom_license",
+                "label": "Licença Personalizada",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Detalhes da licença personalizada",
+                "conditional": {"field": "license_type", "value": "Outra"}
+            }
+        ]
+    },
+    "contact": {
+        "title": "Contato e Suporte",
+        "fields": [
+            {
+                "id": "contact_info",
+                "label": "Informações de Contato",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Como entrar em contato com a equipe"
+            },
+            {
+                "id": "support_channels",
+                "label": "Canais de Suporte",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Canais disponíveis para suporte"
+            }
+        ]
+    },
+    "faq": {
+        "title": "FAQ",
+        "fields": [
+            {
+                "id": "faq_items",
+                "label": "Perguntas Frequentes",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Liste perguntas e respostas frequentes (formato P: Pergunta / R: Resposta)"
+            }
+        ]
+    },
+    "acknowledgements": {
+        "title": "Agradecimentos",
+        "fields": [
+            {
+                "id": "acknowledgements",
+                "label": "Agradecimentos",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Agradecimentos a colaboradores, ferramentas, etc."
+            }
+        ]
+    },
+    "team": {
+        "title": "Equipe",
+        "fields": [
+            {
+                "id": "team_members",
+                "label": "Membros da Equipe",
+                "type": "textarea",
+                "required": False,
+                "placeholder": "Liste os membros da equipe e seus papéis"
+            }
+        ]
+    },
+    # Adicione mais seções conforme necessário
+}
+
+# Templates específicos por tipo de projeto
+_SPECIFIC_TEMPLATES = {
+    "backend": {
+        # Campos específicos para backend
+        "api": {
+            "title": "API e Endpoints",
             "fields": [
                 {
-                    "id": "name",
-                    "label": "Nome do Projeto",
-                    "type": "text",
-                    "required": True,
-                    "placeholder": "Ex: Sistema de Gestão de Inventário"
-                },
-                {
-                    "id": "short_description",
-                    "label": "Descrição Curta",
+                    "id": "api_documentation",
+                    "label": "Documentação da API",
                     "type": "textarea",
                     "required": True,
-                    "placeholder": "Descrição breve do projeto em 1-2 frases"
+                    "placeholder": "Descreva os endpoints da API"
                 },
                 {
-                    "id": "logo_url",
-                    "label": "URL do Logo (opcional)",
-                    "type": "text",
+                    "id": "authentication",
+                    "label": "Autenticação",
+                    "type": "textarea",
                     "required": False,
-                    "placeholder": "https://exemplo.com/logo.png"
+                    "placeholder": "Descreva os métodos de autenticação"
                 }
             ]
         },
-        "about": {
-            "title": "Sobre o Projeto",
+        "database": {
+            "title": "Banco de Dados",
             "fields": [
                 {
-                    "id": "description",
-                    "label": "Descrição Detalhada",
-                    "type": "textarea",
-                    "required": True,
-                    "placeholder": "Descreva detalhadamente o propósito e funcionalidade do projeto"
-                },
-                {
-                    "id": "motivation",
-                    "label": "Motivação",
+                    "id": "database_schema",
+                    "label": "Esquema do Banco de Dados",
                     "type": "textarea",
                     "required": False,
-                    "placeholder": "O que inspirou a criação deste projeto?"
+                    "placeholder": "Descreva o esquema do banco de dados"
                 },
                 {
-                    "id": "key_features",
-                    "label": "Características Principais",
+                    "id": "migrations",
+                    "label": "Migrações",
                     "type": "textarea",
-                    "required": True,
-                    "placeholder": "Liste as principais características separadas por linhas"
+                    "required": False,
+                    "placeholder": "Informações sobre migrações de banco de dados"
                 }
             ]
-        },
-        "technology": {
-            "title": "Tecnologias Utilizadas",
+        }
+    },
+    "frontend": {
+        # Campos específicos para frontend
+        "ui_components": {
+            "title": "Componentes de UI",
             "fields": [
                 {
-                    "id": "technologies",
-                    "label": "Tecnologias",
-                    "type": "tags",
-                    "required": True,
-                    "placeholder": "Ex: Python, Flask, React, etc."
+                    "id": "ui_library",
+                    "label": "Biblioteca de UI",
+                    "type": "text",
+                    "required": False,
+                    "placeholder": "Ex: React Bootstrap, Material UI"
                 },
                 {
-                    "id": "architecture",
-                    "label": "Arquitetura",
+                    "id": "component_structure",
+                    "label": "Estrutura de Componentes",
                     "type": "textarea",
                     "required": False,
-                    "placeholder": "Descreva a arquitetura do sistema"
+                    "placeholder": "Descreva a estrutura de componentes"
                 }
             ]
         },
-        "installation": {
-            "title": "Instalação e Configuração",
+        "state_management": {
+            "title": "Gerenciamento de Estado",
             "fields": [
                 {
-                    "id": "prerequisites",
-                    "label": "Pré-requisitos",
-                    "type": "textarea",
-                    "required": True,
-                    "placeholder": "Liste os pré-requisitos necessários"
-                },
-                {
-                    "id": "installation_steps",
-                    "label": "Passos de Instalação",
-                    "type": "textarea",
-                    "required": True,
-                    "placeholder": "Descreva os passos de instalação (em formato de lista)"
+                    "id": "state_solution",
+                    "label": "Solução de Gerenciamento de Estado",
+                    "type": "text",
+                    "required": False,
+                    "placeholder": "Ex: Redux, Context API, MobX"
                 },
                 {
-                    "id": "env_variables",
-                    "label": "Variáveis de Ambiente",
+                    "id": "state_description",
+                    "label": "Descrição da Arquitetura de Estado",
                     "type": "textarea",
                     "required": False,
-                    "placeholder": "Liste as variáveis de ambiente necessárias"
+                    "placeholder": "Detalhes sobre a implementação do estado"
                 }
             ]
         },
-        "usage": {
-            "title": "Como Utilizar",
+        "design": {
+            "title": "Design e Estilo",
             "fields": [
                 {
-                    "id": "usage_instructions",
-                    "label": "Instruções de Uso",
-                    "type": "textarea",
-                    "required": True,
-                    "placeholder": "Explique como utilizar o projeto"
-                },
-                {
-                    "id": "examples",
-                    "label": "Exemplos",
-                    "type": "textarea",
+                    "id": "design_system",
+                    "label": "Sistema de Design",
+                    "type": "text",
                     "required": False,
-                    "placeholder": "Forneça exemplos de uso"
+                    "placeholder": "Ex: Design System personalizado, Tailwind"
                 },
                 {
-                    "id": "commands",
-                    "label": "Comandos Principais",
+                    "id": "responsive_approach",
+                    "label": "Abordagem Responsiva",
                     "type": "textarea",
                     "required": False,
-                    "placeholder": "Liste os comandos principais"
+                    "placeholder": "Descreva a abordagem para responsividade"
                 }
             ]
-        },
-        "structure": {
-            "title": "Estrutura do Projeto",
+        }
+    },
+    "fullstack": {
+        # Mescla campos de backend e frontend com adições específicas
+        "architecture": {
+            "title": "Arquitetura da Aplicação",
             "fields": [
                 {
-                    "id": "upload_structure",
-                    "label": "Fazer upload da estrutura (opcional)",
-                    "type": "file",
-                    "required": False,
-                    "accept": ".zip,.tar.gz"
+                    "id": "frontend_backend_communication",
+                    "label": "Comunicação Frontend-Backend",
+                    "type": "textarea",
+                    "required": True,
+                    "placeholder": "Descreva como o frontend se comunica com o backend"
                 },
                 {
-                    "id": "manual_structure",
-                    "label": "Estrutura Manual",
+                    "id": "deployment_architecture",
+                    "label": "Arquitetura de Implantação",
                     "type": "textarea",
                     "required": False,
-                    "placeholder": "Estrutura de diretórios do projeto"
+                    "placeholder": "Descreva a arquitetura de implantação"
                 }
             ]
-        },
-        "api": {
-            "title": "API e Endpoints",
+        }
+    },
+    "mobile": {
+        # Campos específicos para desenvolvimento mobile
+        "platforms": {
+            "title": "Plataformas Suportadas",
             "fields": [
                 {
-                    "id": "has_api",
-                    "label": "O projeto tem API?",
-                    "type": "radio",
-                    "options": ["Sim", "Não"],
+                    "id": "platform_list",
+                    "label": "Plataformas",
+                    "type": "checkbox",
+                    "options": ["Android", "iOS", "Web", "Outros"],
                     "required": True
                 },
                 {
-                    "id": "api_documentation",
-                    "label": "Documentação da API",
+                    "id": "min_versions",
+                    "label": "Versões Mínimas",
                     "type": "textarea",
                     "required": False,
-                    "placeholder": "Descreva os endpoints da API",
-                    "conditional": {"field": "has_api", "value": "Sim"}
+                    "placeholder": "Ex: Android 8.0+, iOS 13+"
                 }
             ]
         },
-        "contributing": {
-            "title": "Contribuição",
+        "app_stores": {
+            "title": "Informações de App Store",
             "fields": [
                 {
-                    "id": "contribution_guidelines",
-                    "label": "Diretrizes de Contribuição",
+                    "id": "app_store_links",
+                    "label": "Links de App Store",
                     "type": "textarea",
                     "required": False,
-                    "placeholder": "Explique como outros desenvolvedores podem contribuir"
+                    "placeholder": "Links para Google Play, App Store, etc."
                 },
                 {
-                    "id": "code_of_conduct",
-                    "label": "Código de Conduta",
+                    "id": "release_process",
+                    "label": "Processo de Release",
                     "type": "textarea",
                     "required": False,
-                    "placeholder": "Código de conduta para contribuidores"
+                    "placeholder": "Descreva o processo de lançamento nas lojas"
                 }
             ]
-        },
-        "roadmap": {
-            "title": "Roadmap",
+        }
+    },
+    "cybersec": {
+        # Campos específicos para cybersegurança
+        "security_features": {
+            "title": "Recursos de Segurança",
             "fields": [
                 {
-                    "id": "future_features",
-                    "label": "Funcionalidades Futuras",
+                    "id": "security_measures",
+                    "label": "Medidas de Segurança",
                     "type": "textarea",
-                    "required": False,
-                    "placeholder": "Liste funcionalidades planejadas para o futuro"
+                    "required": True,
+                    "placeholder": "Descreva as medidas de segurança implementadas"
                 },
                 {
-                    "id": "known_issues",
-                    "label": "Problemas Conhecidos",
+                    "id": "threat_model",
+                    "label": "Modelo de Ameaças",
                     "type": "textarea",
                     "required": False,
-                    "placeholder": "Liste problemas conhecidos"
+                    "placeholder": "Descreva o modelo de ameaças considerado"
                 }
             ]
         },
-        "license": {
-            "title": "Licença",
+        "compliance": {
+            "title": "Conformidade",
             "fields": [
                 {
-                    "id": "license_type",
-                    "label": "Tipo de Licença",
-                    "type": "select",
-                    "options": [
-                        "MIT", "GPL-3.0", "Apache-2.0", "BSD-3-Clause", 
-                        "BSD-2-Clause", "CC0-1.0", "Outra", "Nenhuma"
-                    ],
-                    "required": True
-                },
-                {
-                    "id": "custom_license",
-                    "label": "Licença Personalizada",
+                    "id": "compliance_standards",
+                    "label": "Padrões de Conformidade",
                     "type": "textarea",
                     "required": False,
-                    "placeholder": "Detalhes da licença personalizada",
-                    "conditional": {"field": "license_type", "value": "Outra"}
+                    "placeholder": "Ex: GDPR, HIPAA, PCI DSS"
                 }
             ]
-        },
-        "contact": {
-            "title": "Contato e Suporte",
+        }
+    },
+    "network": {
+        # Campos específicos para redes
+        "network_topology": {
+            "title": "Topologia de Rede",
             "fields": [
                 {
-                    "id": "contact_info",
-                    "label": "Informações de Contato",
+                    "id": "topology_description",
+                    "label": "Descrição da Topologia",
                     "type": "textarea",
-                    "required": False,
-                    "placeholder": "Como entrar em contato com a equipe"
+                    "required": True,
+                    "placeholder": "Descreva a topologia da rede"
                 },
                 {
-                    "id": "support_channels",
-                    "label": "Canais de Suporte",
-                    "type": "textarea",
+                    "id": "network_diagram",
+                    "label": "URL do Diagrama de Rede (opcional)",
+                    "type": "text",
                     "required": False,
-                    "placeholder": "Canais disponíveis para suporte"
+                    "placeholder": "Link para diagrama da rede"
                 }
             ]
         },
-        "faq": {
-            "title": "FAQ",
+        "protocols": {
+            "title": "Protocolos Utilizados",
             "fields": [
                 {
-                    "id": "faq_items",
-                    "label": "Perguntas Frequentes",
+                    "id": "protocol_list",
+                    "label": "Lista de Protocolos",
                     "type": "textarea",
                     "required": False,
-                    "placeholder": "Liste perguntas e respostas frequentes (formato P: Pergunta / R: Resposta)"
+                    "placeholder": "Liste os protocolos utilizados"
                 }
             ]
-        },
-        "acknowledgements": {
-            "title": "Agradecimentos",
+        }
+    },
+    "frameworks": {
+        # Campos específicos para frameworks
+        "framework_details": {
+            "title": "Detalhes do Framework",
             "fields": [
                 {
-                    "id": "acknowledgements",
-                    "label": "Agradecimentos",
-                    "type": "textarea",
-                    "required": False,
-                    "placeholder": "Agradecimentos a colaboradores, ferramentas, etc."
-                }
-            ]
-        },
-        "team": {
-            "title": "Equipe",
-            "fields": [
+                    "id": "framework_name",
+                    "label": "Nome do Framework",
+                    "type": "text",
+                    "required": True,
+                    "placeholder": "Ex: Django, Angular, Laravel"
+                },
+                {
+                    "id": "framework_version",
+                    "label": "Versão do Framework",
+                    "type": "text",
+                    "required": True,
+                    "placeholder": "Ex: 4.2.1"
+                },
                 {
-                    "id": "team_members",
-                    "label": "Membros da Equipe",
+                    "id": "custom_extensions",
+                    "label": "Extensões Personalizadas",
                     "type": "textarea",
                     "required": False,
-                    "placeholder": "Liste os membros da equipe e seus papéis"
+                    "placeholder": "Descreva extensões ou personalizações do framework"
                 }
             ]
-        },
-        # Adicione mais seções conforme necessário
-    }
-
-    # Templates específicos por tipo de projeto
-    specific_templates = {
-        "backend": {
-            # Campos específicos para backend
-            "api": {
-                "title": "API e Endpoints",
-                "fields": [
-                    {
-                        "id": "api_documentation",
-                        "label": "Documentação da API",
-                        "type": "textarea",
-                        "required": True,
-                        "placeholder": "Descreva os endpoints da API"
-                    },
-                    {
-                        "id": "authentication",
-                        "label": "Autenticação",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Descreva os métodos de autenticação"
-                    }
-                ]
-            },
-            "database": {
-                "title": "Banco de Dados",
-                "fields": [
-                    {
-                        "id": "database_schema",
-                        "label": "Esquema do Banco de Dados",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Descreva o esquema do banco de dados"
-                    },
-                    {
-                        "id": "migrations",
-                        "label": "Migrações",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Informações sobre migrações de banco de dados"
-                    }
-                ]
-            }
-        },
-        "frontend": {
-            # Campos específicos para frontend
-            "ui_components": {
-                "title": "Componentes de UI",
-                "fields": [
-                    {
-                        "id": "ui_library",
-                        "label": "Biblioteca de UI",
-                        "type": "text",
-                        "required": False,
-                        "placeholder": "Ex: React Bootstrap, Material UI"
-                    },
-                    {
-                        "id": "component_structure",
-                        "label": "Estrutura de Componentes",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Descreva a estrutura de componentes"
-                    }
-                ]
-            },
-            "state_management": {
-                "title": "Gerenciamento de Estado",
-                "fields": [
-                    {
-                        "id": "state_solution",
-                        "label": "Solução de Gerenciamento de Estado",
-                        "type": "text",
-                        "required": False,
-                        "placeholder": "Ex: Redux, Context API, MobX"
-                    },
-                    {
-                        "id": "state_description",
-                        "label": "Descrição da Arquitetura de Estado",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Detalhes sobre a implementação do estado"
-                    }
-                ]
-            },
-            "design": {
-                "title": "Design e Estilo",
-                "fields": [
-                    {
-                        "id": "design_system",
-                        "label": "Sistema de Design",
-                        "type": "text",
-                        "required": False,
-                        "placeholder": "Ex: Design System personalizado, Tailwind"
-                    },
-                    {
-                        "id": "responsive_approach",
-                        "label": "Abordagem Responsiva",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Descreva a abordagem para responsividade"
-                    }
-                ]
-            }
-        },
-        "fullstack": {
-            # Mescla campos de backend e frontend com adições específicas
-            "architecture": {
-                "title": "Arquitetura da Aplicação",
-                "fields": [
-                    {
-                        "id": "frontend_backend_communication",
-                        "label": "Comunicação Frontend-Backend",
-                        "type": "textarea",
-                        "required": True,
-                        "placeholder": "Descreva como o frontend se comunica com o backend"
-                    },
-                    {
-                        "id": "deployment_architecture",
-                        "label": "Arquitetura de Implantação",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Descreva a arquitetura de implantação"
-                    }
-                ]
-            }
-        },
-        "mobile": {
-            # Campos específicos para desenvolvimento mobile
-            "platforms": {
-                "title": "Plataformas Suportadas",
-                "fields": [
-                    {
-                        "id": "platform_list",
-                        "label": "Plataformas",
-                        "type": "checkbox",
-                        "options": ["Android", "iOS", "Web", "Outros"],
-                        "required": True
-                    },
-                    {
-                        "id": "min_versions",
-                        "label": "Versões Mínimas",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Ex: Android 8.0+, iOS 13+"
-                    }
-                ]
-            },
-            "app_stores": {
-                "title": "Informações de App Store",
-                "fields": [
-                    {
-                        "id": "app_store_links",
-                        "label": "Links de App Store",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Links para Google Play, App Store, etc."
-                    },
-                    {
-                        "id": "release_process",
-                        "label": "Processo de Release",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Descreva o processo de lançamento nas lojas"
-                    }
-                ]
-            }
-        },
-        "cybersec": {
-            # Campos específicos para cybersegurança
-            "security_features": {
-                "title": "Recursos de Segurança",
-                "fields": [
-                    {
-                        "id": "security_measures",
-                        "label": "Medidas de Segurança",
-                        "type": "textarea",
-                        "required": True,
-                        "placeholder": "Descreva as medidas de segurança implementadas"
-                    },
-                    {
-                        "id": "threat_model",
-                        "label": "Modelo de Ameaças",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Descreva o modelo de ameaças considerado"
-                    }
-                ]
-            },
-            "compliance": {
-                "title": "Conformidade",
-                "fields": [
-                    {
-                        "id": "compliance_standards",
-                        "label": "Padrões de Conformidade",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Ex: GDPR, HIPAA, PCI DSS"
-                    }
-                ]
-            }
-        },
-        "network": {
-            # Campos específicos para redes
-            "network_topology": {
-                "title": "Topologia de Rede",
-                "fields": [
-                    {
-                        "id": "topology_description",
-                        "label": "Descrição da Topologia",
-                        "type": "textarea",
-                        "required": True,
-                        "placeholder": "Descreva a topologia da rede"
-                    },
-                    {
-                        "id": "network_diagram",
-                        "label": "URL do Diagrama de Rede (opcional)",
-                        "type": "text",
-                        "required": False,
-                        "placeholder": "Link para diagrama da rede"
-                    }
-                ]
-            },
-            "protocols": {
-                "title": "Protocolos Utilizados",
-                "fields": [
-                    {
-                        "id": "protocol_list",
-                        "label": "Lista de Protocolos",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Liste os protocolos utilizados"
-                    }
-                ]
-            }
-        },
-        "frameworks": {
-            # Campos específicos para frameworks
-            "framework_details": {
-                "title": "Detalhes do Framework",
-                "fields": [
-                    {
-                        "id": "framework_name",
-                        "label": "Nome do Framework",
-                        "type": "text",
-                        "required": True,
-                        "placeholder": "Ex: Django, Angular, Laravel"
-                    },
-                    {
-                        "id": "framework_version",
-                        "label": "Versão do Framework",
-                        "type": "text",
-                        "required": True,
-                        "placeholder": "Ex: 4.2.1"
-                    },
-                    {
-                        "id": "custom_extensions",
-                        "label": "Extensões Personalizadas",
-                        "type": "textarea",
-                        "required": False,
-                        "placeholder": "Descreva extensões ou personalizações do framework"
-                    }
-                ]
-            }
         }
     }
-    
-    # Mescla o template base com o específico
-    if project_type in specific_templates:
-        # Atualiza seções existentes ou adiciona novas
-        for section_id, section_data in specific_templates[project_type].items():
-            base_template[section_id] = section_data
-    
-    return base_template
\ No newline at end of file
+}
+
+def _freeze(value):
+    """
+    Converte recursivamente dicts e listas em estruturas somente leitura.
+
+    Args:
+        value: Valor a ser congelado
+
+    Returns:
+        MappingProxyType, tuple ou o próprio valor, se já for imutável
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _build_template(project_type):
+    """
+    Mescla o template base com o específico do tipo de projeto.
+    Seções específicas substituem as do template base na mesma posição
+    ou são adicionadas ao final.
+    """
+    template = dict(_BASE_TEMPLATE)
+    for section_id, section_data in _SPECIFIC_TEMPLATES.get(project_type, {}).items():
+        template[section_id] = section_data
+    return _freeze(template)
+
+_DEFAULT_TEMPLATE = _build_template(None)
+
+# Templates já mesclados e congelados, indexados pelo tipo de projeto
+PROJECT_TEMPLATES = MappingProxyType({
+    project_type: _build_template(project_type) for project_type in _SPECIFIC_TEMPLATES
+})
+
+def get_project_template(project_type):
+    """
+    Retorna o template apropriado para o tipo de projeto.
+
+    O template retornado é compartilhado e somente leitura; quem precisar
+    alterá-lo deve fazer uma cópia.
+
+    Args:
+        project_type (str): Tipo do projeto
+
+    Returns:
+        MappingProxyType: Seções do template, na ordem de exibição
+    """
+    return PROJECT_TEMPLATES.get(project_type, _DEFAULT_TEMPLATE)
+
+def _build_required_index(template):
+    """
+    Extrai de um template os campos obrigatórios de cada seção.
+
+    Campos condicionais só são exigidos quando a condição é atendida, então
+    cada regra guarda também o campo e o valor da condição (ou None).
+
+    Returns:
+        MappingProxyType: ID da seção -> tupla de (campo, campo_da_condição, valor_da_condição)
+    """
+    index = {}
+    for section_id, section in template.items():
+        rules = []
+        for field in section['fields']:
+            if not field.get('required'):
+                continue
+            condition = field.get('conditional')
+            if condition:
+                rules.append((field['id'], condition['field'], condition['value']))
+            else:
+                rules.append((field['id'], None, None))
+        index[section_id] = tuple(rules)
+    return MappingProxyType(index)
+
+_DEFAULT_REQUIRED_FIELDS = _build_required_index(_DEFAULT_TEMPLATE)
+
+# Campos obrigatórios por tipo de projeto, calculados uma única vez a partir dos templates
+REQUIRED_FIELDS = MappingProxyType({
+    project_type: _build_required_index(template) for project_type, template in PROJECT_TEMPLATES.items()
+})
+
+def _is_filled(value):
+    """Indica se um campo foi preenchido (texto não vazio ou lista com itens)"""
+    if isinstance(value, str):
+        return bool(value.strip())
+    return bool(value)
+
+def _condition_met(data, field_id, expected):
+    value = data.get(field_id)
+    if isinstance(value, list):
+        return expected in value
+    return value == expected
+
+def is_section_data_complete(project_type, section_id, data):
+    """
+    Verifica se os dados de uma seção preenchem todos os campos obrigatórios.
+
+    Seções sem campos obrigatórios (ou fora do template) são consideradas
+    completas.
+
+    Args:
+        project_type (str): Tipo do projeto
+        section_id (str): ID da seção
+        data (dict): Dados gravados da seção
+
+    Returns:
+        bool: True se todos os campos obrigatórios aplicáveis estiverem preenchidos
+    """
+    rules = REQUIRED_FIELDS.get(project_type, _DEFAULT_REQUIRED_FIELDS).get(section_id, ())
+    for field_id, condition_field, condition_value in rules:
+        if condition_field is not None and not _condition_met(data, condition_field, condition_value):
+            continue
+        if not _is_filled(data.get(field_id)):
+            return False
+    return True